@@ -7,7 +7,6 @@
 """Provides analyses regarding the control-flow of the program."""
 from __future__ import annotations
 
-import queue
 import sys
 
 from dataclasses import dataclass
@@ -629,97 +628,96 @@ class DominatorTree(ProgramGraph[ProgramGraphNode]):
     def compute_dominance_tree(graph: CFG) -> DominatorTree:
         """Computes the dominance tree for a control-flow graph.
 
+        Only the nodes reachable from the entry node are part of the tree.
+
         Args:
             graph: The control-flow graph
 
         Returns:
             The dominance tree for the control-flow graph
         """
-        dominance: dict[
-            ProgramGraphNode, set[ProgramGraphNode]
-        ] = DominatorTree._calculate_dominance(graph)
-        for dominance_node, nodes in dominance.items():
-            nodes.discard(dominance_node)
-        dominance_tree = DominatorTree()
         entry_node = graph.entry_node
         assert entry_node is not None
+        nodes, immediate_dominators = DominatorTree._calculate_immediate_dominators(
+            graph, entry_node
+        )
+        dominance_tree = DominatorTree()
         dominance_tree.add_node(entry_node)
-
-        node_queue: queue.SimpleQueue = queue.SimpleQueue()
-        node_queue.put(entry_node)
-        while not node_queue.empty():
-            node: ProgramGraphNode = node_queue.get()
-            for current, dominators in dominance.items():
-                if node in dominators:
-                    dominators.remove(node)
-                    if len(dominators) == 0:
-                        dominance_tree.add_node(current)
-                        dominance_tree.add_edge(node, current)
-                        node_queue.put(current)
+        for number in range(1, len(nodes)):
+            dominance_tree.add_node(nodes[number])
+            dominance_tree.add_edge(nodes[immediate_dominators[number]], nodes[number])
         return dominance_tree
 
     @staticmethod
-    def _calculate_dominance(
-        graph: CFG,
-    ) -> dict[ProgramGraphNode, set[ProgramGraphNode]]:
-        dominance_map: dict[ProgramGraphNode, set[ProgramGraphNode]] = {}
-        entry = graph.entry_node
-        assert entry, "Cannot work with a graph without entry nodes"
-        entry_dominators: set[ProgramGraphNode] = {entry}
-        dominance_map[entry] = entry_dominators
+    def _calculate_immediate_dominators(
+        graph: CFG, entry_node: ProgramGraphNode
+    ) -> tuple[list[ProgramGraphNode], list[int]]:
+        """Calculates the immediate dominators of the nodes reachable from the entry.
 
-        for node in graph.nodes:
-            if node == entry:
-                continue
-            all_nodes: set[ProgramGraphNode] = set(graph.nodes)
-            dominance_map[node] = all_nodes
+        Implements the iterative algorithm of Cooper, Harvey, and Kennedy, "A Simple,
+        Fast Dominance Algorithm", on nodes numbered in reverse postorder, i.e., a
+        node's number is smaller than the numbers of the nodes it dominates.
 
-        changed: bool = True
+        Args:
+            graph: The control-flow graph
+            entry_node: The entry node of the graph
+
+        Returns:
+            The reachable nodes in reverse postorder, and the number of the
+            immediate dominator for each number of a node, where the entry node
+            dominates itself
+        """
+        nodes: list[ProgramGraphNode] = list(
+            nx.dfs_postorder_nodes(graph.graph, entry_node)
+        )
+        nodes.reverse()
+        numbers = {node: number for number, node in enumerate(nodes)}
+        predecessors = [
+            [
+                numbers[predecessor]
+                for predecessor in graph.graph.predecessors(node)
+                if predecessor in numbers
+            ]
+            for node in nodes
+        ]
+
+        undefined = -1
+        immediate_dominators = [undefined] * len(nodes)
+        immediate_dominators[0] = 0
+        changed = True
         while changed:
             changed = False
-            for node in graph.nodes:
-                if node == entry:
-                    continue
-                current_dominators = dominance_map.get(node)
-                new_dominators = DominatorTree._calculate_dominators(
-                    graph, dominance_map, node
-                )
-
-                if current_dominators != new_dominators:
+            for number in range(1, len(nodes)):
+                new_immediate_dominator = undefined
+                for predecessor in predecessors[number]:
+                    if immediate_dominators[predecessor] == undefined:
+                        continue
+                    if new_immediate_dominator == undefined:
+                        new_immediate_dominator = predecessor
+                        continue
+                    # Intersect the paths to the entry in the dominator tree
+                    first, second = predecessor, new_immediate_dominator
+                    while first != second:
+                        while first > second:
+                            first = immediate_dominators[first]
+                        while second > first:
+                            second = immediate_dominators[second]
+                    new_immediate_dominator = first
+                if immediate_dominators[number] != new_immediate_dominator:
+                    immediate_dominators[number] = new_immediate_dominator
                     changed = True
-                    dominance_map[node] = new_dominators
-                    break
-
-        return dominance_map
-
-    @staticmethod
-    def _calculate_dominators(
-        graph: CFG,
-        dominance_map: dict[ProgramGraphNode, set[ProgramGraphNode]],
-        node: ProgramGraphNode,
-    ) -> set[ProgramGraphNode]:
-        dominators: set[ProgramGraphNode] = {node}
-        intersection: set[ProgramGraphNode] = set()
-        predecessors = graph.get_predecessors(node)
-        if not predecessors:
-            return set()
-
-        first_time: bool = True
-        for predecessor in predecessors:
-            predecessor_dominators = dominance_map.get(predecessor)
-            assert predecessor_dominators is not None, "Cannot be None"
-            if first_time:
-                intersection = intersection.union(predecessor_dominators)
-                first_time = False
-            else:
-                intersection.intersection_update(predecessor_dominators)
-        intersection = intersection.union(dominators)
-        return intersection  # noqa: RET504
+        return nodes, immediate_dominators
 
 
 class ControlDependenceGraph(ProgramGraph[ProgramGraphNode]):
     """Implements a control-dependence graph."""
 
+    def __init__(self) -> None:  # noqa: D107
+        super().__init__()
+        # Finding the entry node requires a scan of the graph.  A computed graph is
+        # not modified anymore, thus the entry node is only looked up once.
+        self._entry_node: ProgramGraphNode | None = None
+
     @staticmethod
     def compute(graph: CFG) -> ControlDependenceGraph:
         """Computes the control-dependence graph for a given control-flow graph.
@@ -738,11 +736,22 @@ class ControlDependenceGraph(ProgramGraph[ProgramGraphNode]):
         for node in nodes:
             cdg.add_node(node)
 
+        # Number the post-dominator tree once, such that ancestor checks and lowest
+        # common ancestors do not require graph traversals for every CFG edge.
+        root = post_dominator_tree.entry_node
+        assert root is not None, "The post-dominator tree must have a root"
+        parents, depths, entered, exited = ControlDependenceGraph._number_tree(
+            post_dominator_tree, root
+        )
+
         # Find matching edges in the CFG.
         edges: set[ControlDependenceGraph._Edge] = set()
         for source in nodes:
             for target in augmented_cfg.get_successors(source):
-                if source not in post_dominator_tree.get_transitive_successors(target):
+                if not (
+                    entered[target] < entered[source]
+                    and exited[source] < exited[target]
+                ):
                     # Store branching data from edge, i.e., which outcome of the
                     # branching node leads to this node.
                     data = frozenset(
@@ -756,26 +765,79 @@ class ControlDependenceGraph(ProgramGraph[ProgramGraphNode]):
 
         # Mark nodes in the PDT and construct edges for them.
         for edge in edges:
-            least_common_ancestor = post_dominator_tree.get_least_common_ancestor(
-                edge.source, edge.target
+            least_common_ancestor = ControlDependenceGraph._least_common_ancestor(
+                edge.source, edge.target, parents, depths
             )
             current = edge.target
             while current != least_common_ancestor:
                 # TODO(fk) can the branching info be actually used here?
                 # Seems ok?
                 cdg.add_edge(edge.source, current, **dict(edge.data))
-                predecessors = post_dominator_tree.get_predecessors(current)
-                assert len(predecessors) == 1, (
-                    "Cannot have more than one predecessor in a tree, this violates a "
-                    "tree invariant"
-                )
-                current = predecessors.pop()
+                current = parents[current]
 
             if least_common_ancestor is edge.source:
                 cdg.add_edge(edge.source, least_common_ancestor, **dict(edge.data))
 
         return filter_dead_code_nodes(cdg, entry_node_index=-sys.maxsize)
 
+    @staticmethod
+    def _number_tree(
+        tree: DominatorTree, root: ProgramGraphNode
+    ) -> tuple[
+        dict[ProgramGraphNode, ProgramGraphNode],
+        dict[ProgramGraphNode, int],
+        dict[ProgramGraphNode, int],
+        dict[ProgramGraphNode, int],
+    ]:
+        """Computes parents, depths, and DFS entry and exit times of a tree.
+
+        A node is a proper descendant of another node iff it is entered after and
+        exited before that node.
+
+        Args:
+            tree: The tree to number
+            root: The root node of the tree
+
+        Returns:
+            The parents, depths, entry times, and exit times of the tree's nodes
+        """
+        parents: dict[ProgramGraphNode, ProgramGraphNode] = {}
+        depths = {root: 0}
+        entered = {root: 0}
+        exited: dict[ProgramGraphNode, int] = {}
+        clock = 1
+        stack = [(root, iter(tree.graph.successors(root)))]
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                exited[node] = clock
+                clock += 1
+                continue
+            parents[child] = node
+            depths[child] = depths[node] + 1
+            entered[child] = clock
+            clock += 1
+            stack.append((child, iter(tree.graph.successors(child))))
+        return parents, depths, entered, exited
+
+    @staticmethod
+    def _least_common_ancestor(
+        first: ProgramGraphNode,
+        second: ProgramGraphNode,
+        parents: dict[ProgramGraphNode, ProgramGraphNode],
+        depths: dict[ProgramGraphNode, int],
+    ) -> ProgramGraphNode:
+        while depths[first] > depths[second]:
+            first = parents[first]
+        while depths[second] > depths[first]:
+            second = parents[second]
+        while first is not second:
+            first = parents[first]
+            second = parents[second]
+        return first
+
     def get_control_dependencies(
         self, node: ProgramGraphNode
     ) -> OrderedSet[ControlDependency]:
@@ -811,6 +873,28 @@ class ControlDependenceGraph(ProgramGraph[ProgramGraphNode]):
                 result.update(self._retrieve_control_dependencies(pred, handled))
         return result
 
+    def compute_predicate_distances(self) -> dict[int, dict[int, int]]:
+        """Computes the lengths of the shortest paths between the predicate nodes.
+
+        Returns:
+            For each predicate id, the lengths of the shortest paths to its node
+            from the nodes of the predicates that can reach it, by predicate id
+        """
+        predicate_nodes = {
+            node.predicate_id: node
+            for node in self.nodes
+            if node.predicate_id is not None
+        }
+        distances: dict[int, dict[int, int]] = {
+            predicate_id: {} for predicate_id in predicate_nodes
+        }
+        for source_id, source in predicate_nodes.items():
+            lengths = nx.single_source_shortest_path_length(self._graph, source)
+            for target_id, target in predicate_nodes.items():
+                if (length := lengths.get(target)) is not None:
+                    distances[target_id][source_id] = length
+        return distances
+
     def is_control_dependent_on_root(self, node: ProgramGraphNode) -> bool:
         """Does this node directly depend on entering the code object?
 
@@ -820,12 +904,17 @@ class ControlDependenceGraph(ProgramGraph[ProgramGraphNode]):
         Returns:
             Whether the given node is directly dependent on the entry of the code object
         """
-        return self._is_control_dependent_on_root(node, set())
+        if self._entry_node is None:
+            self._entry_node = self.entry_node
+        return self._is_control_dependent_on_root(node, self._entry_node, set())
 
     def _is_control_dependent_on_root(
-        self, node: ProgramGraphNode, visited: set[ProgramGraphNode]
+        self,
+        node: ProgramGraphNode,
+        entry_node: ProgramGraphNode | None,
+        visited: set[ProgramGraphNode],
     ) -> bool:
-        if (self.entry_node, node) in self.graph.edges:
+        if (entry_node, node) in self.graph.edges:
             return True
         for pred in self.graph.predecessors(node):
             if pred in visited:
@@ -835,7 +924,7 @@ class ControlDependenceGraph(ProgramGraph[ProgramGraphNode]):
                 continue
             if pred == node:
                 continue
-            if self._is_control_dependent_on_root(pred, visited):
+            if self._is_control_dependent_on_root(pred, entry_node, visited):
                 return True
         return False
 
@@ -539,6 +539,12 @@ class ModuleTestCluster(TestCluster):
         # Keep track of all callables, this is only for statistics purposes.
         self.__callables: OrderedSet[GenericCallableAccessibleObject] = OrderedSet()
 
+        # Memoizes the results of get_generators_for, has to be cleared whenever
+        # the generators change.
+        self.__generators_for: dict[
+            ProperType, tuple[OrderedSet[GenericAccessibleObject], bool]
+        ] = {}
+
     def log_cluster_statistics(self) -> None:  # noqa: D102
         stats = TypeGuessingStats()
         for accessible in self.__accessible_objects_under_test:
@@ -582,6 +588,7 @@ class ModuleTestCluster(TestCluster):
         gens.discard(accessible)
         if len(gens) == 0:
             self.__generators.pop(accessible.generated_type())
+        self.__generators_for.clear()
 
     @staticmethod
     def _add_or_make_union(
@@ -611,7 +618,7 @@ class ModuleTestCluster(TestCluster):
         self._drop_generator(accessible)
         # Must invalidate entire cache, because subtype relationship might also change
         # the return values which are not new_type or old_type.
-        self.get_generators_for.cache_clear()
+        self.__generators_for.clear()
         self.get_all_generatable_types.cache_clear()
         accessible.inferred_signature.return_type = new_type
         self.__generators[new_type].add(accessible)
@@ -648,6 +655,7 @@ class ModuleTestCluster(TestCluster):
         ):
             return
         self.__generators[generated_type].add(generator)
+        self.__generators_for.clear()
 
     def add_accessible_object_under_test(  # noqa: D102
         self, objc: GenericAccessibleObject, data: _CallableData
@@ -678,27 +686,33 @@ class ModuleTestCluster(TestCluster):
     def num_accessible_objects_under_test(self) -> int:  # noqa: D102
         return len(self.__accessible_objects_under_test)
 
-    @functools.lru_cache(maxsize=1024)
     def get_generators_for(  # noqa: D102
         self, typ: ProperType
     ) -> tuple[OrderedSet[GenericAccessibleObject], bool]:
+        # Matching the type against all generated types is costly, while the test
+        # factory asks for the same types over and over again.
+        if (memoized := self.__generators_for.get(typ)) is not None:
+            return memoized
+
         if isinstance(typ, AnyType):
             # Just take everything when it's Any.
-            return (
+            result = (
                 OrderedSet(itertools.chain.from_iterable(self.__generators.values())),
                 False,
             )
-
-        results: OrderedSet[GenericAccessibleObject] = OrderedSet()
-        only_any = True
-        for gen_type, generators in self.__generators.items():
-            if self.__type_system.is_maybe_subtype(gen_type, typ):
-                results.update(generators)
-                # Set flag to False as soon as we encounter a generator that is not
-                # for Any.
-                only_any &= gen_type == ANY
-
-        return results, only_any
+        else:
+            generators_for: OrderedSet[GenericAccessibleObject] = OrderedSet()
+            only_any = True
+            for gen_type, generators in self.__generators.items():
+                if self.__type_system.is_maybe_subtype(gen_type, typ):
+                    generators_for.update(generators)
+                    # Set flag to False as soon as we encounter a generator that is
+                    # not for Any.
+                    only_any &= gen_type == ANY
+            result = generators_for, only_any
+
+        self.__generators_for[typ] = result
+        return result
 
     class _FindModifiers(TypeVisitor[OrderedSet[GenericAccessibleObject]]):
         """A visitor to find all modifiers for the given type."""
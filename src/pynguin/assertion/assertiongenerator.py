@@ -9,7 +9,10 @@ from __future__ import annotations
 
 import ast
 import dataclasses
+import itertools
 import logging
+import multiprocessing
+import sys
 import threading
 import types
 
@@ -36,6 +39,14 @@ from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Generator
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from multiprocessing.connection import Connection
+
+    import mutpy.operators as mo
+
     import pynguin.ga.testcasechromosome as tcc
     import pynguin.ga.testsuitechromosome as tsc
     import pynguin.testcase.testcase as tc
@@ -52,18 +63,24 @@ class AssertionGenerator(cv.ChromosomeVisitor):
     _logger = logging.getLogger(__name__)
 
     def __init__(
-        self, plain_executor: ex.TestCaseExecutor, filtering_executions: int = 1
+        self,
+        plain_executor: ex.TestCaseExecutor,
+        filtering_executions: int = 1,
+        stable_filtering_executions: int = 2,
     ):
         """Create new assertion generator.
 
         Args:
             plain_executor: The executor that is used to execute on the non mutated
                 module.
-            filtering_executions: How often should the tests be executed to filter
-                out trivially flaky assertions, e.g., str representations based on
-                memory locations.
+            filtering_executions: How often should the tests be executed at most to
+                filter out trivially flaky assertions, e.g., str representations
+                based on memory locations.
+            stable_filtering_executions: After how many consecutive executions that
+                do not remove any assertion the filtering stops early.
         """
         self._filtering_executions = filtering_executions
+        self._stable_filtering_executions = stable_filtering_executions
         self._plain_executor = plain_executor
 
     def visit_test_suite_chromosome(  # noqa: D102
@@ -86,21 +103,32 @@ class AssertionGenerator(cv.ChromosomeVisitor):
             for test in test_cases:
                 self._add_assertions_for(test, self._plain_executor.execute(test))
 
-        # Perform filtering executions to remove trivially flaky assertions.
+        # Perform filtering executions to remove trivially flaky assertions.  Once
+        # enough consecutive executions had the same outcome, i.e., all remaining
+        # assertions held, the assertions are considered stable and the remaining
+        # executions are skipped.
         with self._plain_executor.temporarily_add_observer(
             ato.AssertionVerificationObserver()
         ):
+            stable_executions = 0
             for _ in range(self._filtering_executions):
                 # Create a copy of the list that is shuffled.
                 shuffled_copy = list(test_cases)
                 randomness.RNG.shuffle(shuffled_copy)
+                removed_assertions = False
                 for test in shuffled_copy:
-                    self.__remove_non_holding_assertions(
+                    removed_assertions |= self.__remove_non_holding_assertions(
                         test, self._plain_executor.execute(test)
                     )
+                stable_executions = 0 if removed_assertions else stable_executions + 1
+                if stable_executions >= self._stable_filtering_executions:
+                    break
 
     @staticmethod
-    def __remove_non_holding_assertions(test: tc.TestCase, result: ex.ExecutionResult):
+    def __remove_non_holding_assertions(
+        test: tc.TestCase, result: ex.ExecutionResult
+    ) -> bool:
+        removed_assertions = False
         for idx, statement in enumerate(test.statements):
             pos_to_key = dict(enumerate(statement.assertions))
 
@@ -112,6 +140,8 @@ class AssertionGenerator(cv.ChromosomeVisitor):
 
             for pos in sorted(to_delete, reverse=True):
                 statement.assertions.remove(pos_to_key[pos])
+            removed_assertions |= bool(to_delete)
+        return removed_assertions
 
     def _add_assertions_for(self, test_case: tc.TestCase, result: ex.ExecutionResult):
         # In order to avoid repeating the same assertions after each statement,
@@ -160,6 +190,15 @@ class _MutantInfo:
     # Was the mutant killed by any test?
     killed_by: list[int] = dataclasses.field(default_factory=list)
 
+    # Did no test reach the mutated lines, such that the mutant was not executed?
+    not_reached: bool = False
+
+
+# The information about an executed mutant and the verification traces of the test
+# cases on it, which are None if the mutant timed out or might have timed out on a
+# skipped test case.
+_MutantResult = tuple[_MutantInfo, list[at.AssertionVerificationTrace] | None]
+
 
 @dataclasses.dataclass
 class _MutationSummary:
@@ -179,6 +218,14 @@ class _MutationSummary:
             if not info.killed_by and not info.timed_out_by
         ]
 
+    def get_survived_by_non_reachability(self) -> list[_MutantInfo]:
+        """Get survived Mutants whose mutated lines were not reached by any test.
+
+        Returns:
+            The survived mutants that were not executed
+        """
+        return [info for info in self.get_survived() if info.not_reached]
+
     def get_killed(self) -> list[_MutantInfo]:
         """Get killed Mutants.
 
@@ -240,6 +287,12 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
     ):
         # Mimics mutpy.utils.create_module but adds instrumentation to the resulting
         # module
+        mut_num = self._number_of_enumerated_mutants
+        self._number_of_enumerated_mutants += 1
+        if not self._is_responsible_for(mut_num):
+            # The mutant is executed by another process, thus there is no need to
+            # create it.
+            return None
         code = compile(ast_node, module_name, "exec")
         if self._testing:
             self._testing_created_mutants.append(ast.unparse(ast_node))
@@ -247,17 +300,35 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
         module = types.ModuleType(module_name)
         module.__dict__.update(module_dict or {})
 
+        # Mutants are created lazily, i.e., after the executor has run tests in its
+        # own thread, so we have to allow tracing the creating thread again.
+        self._mutation_tracer.current_thread_identifier = (
+            threading.current_thread().ident
+        )
+
         exec(code, module.__dict__)  # noqa: S102
         return module
 
-    def __init__(self, plain_executor: ex.TestCaseExecutor, testing: bool = False):
+    def __init__(
+        self,
+        plain_executor: ex.TestCaseExecutor,
+        testing: bool = False,
+        filtering_executions: int = 1,
+        stable_filtering_executions: int = 2,
+    ):
         """Initializes the generator.
 
         Args:
             plain_executor: Executor used for plain execution
             testing: Enable test mode, currently required for integration testing.
+            filtering_executions: How often should the tests be executed at most to
+                filter out trivially flaky assertions.
+            stable_filtering_executions: After how many consecutive executions that
+                do not remove any assertion the filtering stops early.
         """
-        super().__init__(plain_executor)
+        super().__init__(
+            plain_executor, filtering_executions, stable_filtering_executions
+        )
 
         # We use a separate tracer and executor to execute tests on the mutants.
         self._mutation_tracer = ex.ExecutionTracer()
@@ -276,53 +347,338 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
         self._testing = testing
         self._testing_created_mutants: list[str] = []
         self._testing_mutation_summary: _MutationSummary = _MutationSummary()
-        adapter = ma.MutationAdapter()
 
         # Evil hack to change the way mutpy creates mutated modules.
         mutpy.utils.create_module = self._create_module_with_instrumentation
-        self._mutated_modules = [x for x, _ in adapter.mutate_module()]
+        self._is_responsible_for: Callable[[int], bool] = lambda _: True
+        self._number_of_enumerated_mutants = 0
+        self._number_of_workers = config.configuration.execution.number_of_workers
+        self._early_exit = config.configuration.test_case_output.mutation_early_exit
+
+        # The line numbers of the module under test that are traced, and the ones
+        # covered by each test case when executed on the non mutated module.
+        self._traced_lines: set[int] = set()
+        self._covered_lines: dict[tc.TestCase, set[int]] = {}
+
+    def _add_assertions_for(self, test_case: tc.TestCase, result: ex.ExecutionResult):
+        super()._add_assertions_for(test_case, result)
+        self._covered_lines[test_case] = self.__line_numbers(
+            result.execution_trace.covered_line_ids
+        )
 
     def _add_assertions(self, test_cases: list[tc.TestCase]):
+        self._covered_lines.clear()
+        self._traced_lines = self.__line_numbers(
+            self._plain_executor.tracer.get_subject_properties().existing_lines
+        )
         super()._add_assertions(test_cases)
-        tests_and_results: list[tuple[tc.TestCase, list[ex.ExecutionResult]]] = [
-            (test, []) for test in test_cases
-        ]
+        # The verification traces of all mutants that did not time out on any
+        # reaching test case, merged per test case.
+        merged_traces = [at.AssertionVerificationTrace() for _ in test_cases]
+        mutant_information: list[_MutantInfo] = []
+
+        if self._can_execute_mutants_in_parallel():
+            mutant_results = self._execute_mutants_in_parallel(test_cases)
+        else:
+            mutant_results = self._execute_mutants(test_cases, lambda _: True)
+        for info, traces in mutant_results:
+            mutant_information.append(info)
+            # Ignore timed out executions, and those that might have timed out
+            if traces is not None:
+                for merged, trace in zip(merged_traces, traces, strict=True):
+                    merged.merge(trace)
+
+        summary = _MutationSummary(mutant_information)
+        self.__report_mutation_summary(summary)
+        self.__remove_non_relevant_assertions(test_cases, merged_traces)
 
+    def _execute_mutants(
+        self, test_cases: list[tc.TestCase], is_responsible_for: Callable[[int], bool]
+    ) -> Iterator[_MutantResult]:
+        """Create the mutants and execute the test cases on them.
+
+        Mutants are created, executed and discarded one at a time, such that only a
+        single mutated module has to be kept in memory.
+
+        Args:
+            test_cases: The test cases to execute
+            is_responsible_for: Whether a mutant, given by its number, shall be
+                created and executed
+
+        Yields:
+            The information about each executed mutant together with the
+            verification traces of the test cases, which are None if the mutant
+            timed out or might have timed out on a skipped test case
+        """
+        self._is_responsible_for = is_responsible_for
+        self._number_of_enumerated_mutants = 0
+        # The assertions violated by the mutants executed so far, merged per test
+        # case, to decide which executions are still required.
+        violations = [at.AssertionVerificationTrace() for _ in test_cases]
         with self._mutation_executor.temporarily_add_observer(
             ato.AssertionVerificationObserver()
         ):
-            for idx, mutated_module in enumerate(self._mutated_modules):
-                self._logger.info(
-                    "Running tests on mutant %3i/%i",
-                    idx + 1,
-                    len(self._mutated_modules),
-                )
+            for mut_num, (mutated_module, mutations) in enumerate(
+                ma.MutationAdapter().mutate_module()
+            ):
+                if not is_responsible_for(mut_num):
+                    continue
+                self._logger.info("Running tests on mutant %3i", mut_num + 1)
                 self._mutation_executor.module_provider.add_mutated_version(
                     module_name=config.configuration.module_name,
                     mutated_module=mutated_module,
                 )
-                for test, results in tests_and_results:
-                    results.append(self._mutation_executor.execute(test))
+                # Test cases that do not reach the mutated lines behave as on the
+                # non mutated module, thus we only execute the reaching ones.
+                reaching = self.__reaching_tests(test_cases, mutations)
+                results = self.__execute_tests(test_cases, reaching, violations)
+                # Forget the code objects of this mutant, the next one is
+                # instrumented from scratch.
+                self._mutation_tracer.reset()
+                info = self.__evaluate_mutant(mut_num, results)
+                info.not_reached = not reaching
+                if info.timed_out_by or any(
+                    results[test_num] is None for test_num in reaching
+                ):
+                    # A skipped test case might have timed out, thus the traces
+                    # are ignored as well.  They do not violate any assertion that
+                    # was not already violated, otherwise the skipped test cases
+                    # would have been executed.
+                    yield info, None
+                    continue
+                traces = [
+                    at.AssertionVerificationTrace()
+                    if result is None
+                    else result.assertion_verification_trace
+                    for result in results
+                ]
+                if self._early_exit:
+                    for violation, trace in zip(violations, traces, strict=True):
+                        violation.merge(trace)
+                yield info, traces
+
+    def __execute_tests(
+        self,
+        test_cases: list[tc.TestCase],
+        reaching: dict[int, int],
+        violations: list[at.AssertionVerificationTrace],
+    ) -> list[ex.ExecutionResult | None]:
+        results: list[ex.ExecutionResult | None] = [None] * len(test_cases)
+        order = list(reaching)
+        if self._early_exit:
+            # Test cases that cover more of the mutated lines are more likely to
+            # kill the mutant.
+            order.sort(key=lambda test_num: -reaching[test_num])
+        killed = False
+        for test_num in order:
+            test = test_cases[test_num]
+            if (
+                self._early_exit
+                and killed
+                and not self.__has_unviolated_assertions(test, violations[test_num])
+            ):
+                # The execution could neither kill the mutant nor make any
+                # assertion relevant.
+                continue
+            result = self._mutation_executor.execute(test)
+            results[test_num] = result
+            if result.timeout:
+                # The traces of a timed out mutant are ignored anyway.
+                break
+            killed = killed or self.__is_killed(result)
+        else:
+            skipped = [test_num for test_num in order if results[test_num] is None]
+            if skipped and self.__violates_new_assertions(results, violations):
+                # The traces can only be used if the mutant does not time out on
+                # any reaching test case.
+                for test_num in skipped:
+                    result = self._mutation_executor.execute(test_cases[test_num])
+                    results[test_num] = result
+                    if result.timeout:
+                        break
+        return results
 
-        summary = self.__compute_mutation_summary(
-            len(self._mutated_modules), tests_and_results
+    @staticmethod
+    def __violates_new_assertions(
+        results: list[ex.ExecutionResult | None],
+        violations: list[at.AssertionVerificationTrace],
+    ) -> bool:
+        return any(
+            not violation.was_violated(stmt_idx, assertion_idx)
+            for result, violation in zip(results, violations, strict=True)
+            if result is not None
+            for trace in (
+                result.assertion_verification_trace.failed,
+                result.assertion_verification_trace.error,
+            )
+            for stmt_idx, assertion_indices in trace.items()
+            for assertion_idx in assertion_indices
+        )
+
+    def __reaching_tests(
+        self, test_cases: list[tc.TestCase], mutations: list[mo.Mutation]
+    ) -> dict[int, int]:
+        # The row of the mutant in the sparse mutant x test matrix, i.e., maps the
+        # indices of the test cases that reach the mutated lines to the number of
+        # mutated lines they covered on the non mutated module.
+        mutated_lines = {getattr(mutation.node, "lineno", -1) for mutation in mutations}
+        if not mutated_lines <= self._traced_lines:
+            # We do not know which test cases reach the mutation.
+            return {test_num: 0 for test_num in range(len(test_cases))}
+        reaching = {
+            test_num: len(mutated_lines & self._covered_lines[test])
+            for test_num, test in enumerate(test_cases)
+        }
+        return {test_num: num for test_num, num in reaching.items() if num > 0}
+
+    @staticmethod
+    def __has_unviolated_assertions(
+        test: tc.TestCase, violations: at.AssertionVerificationTrace
+    ) -> bool:
+        return any(
+            not violations.was_violated(stmt_idx, assertion_idx)
+            for stmt_idx, statement in enumerate(test.statements)
+            for assertion_idx in range(len(statement.assertions))
+        )
+
+    def __line_numbers(self, line_ids: Iterable[int]) -> set[int]:
+        # Only the lines of the module under test can be mutated.
+        existing_lines = (
+            self._plain_executor.tracer.get_subject_properties().existing_lines
+        )
+        module_file = getattr(
+            sys.modules.get(config.configuration.module_name), "__file__", None
+        )
+        return {
+            existing_lines[line_id].line_number
+            for line_id in line_ids
+            if existing_lines[line_id].file_name == module_file
+        }
+
+    def _can_execute_mutants_in_parallel(self) -> bool:
+        return (
+            self._number_of_workers > 1
+            and "fork" in multiprocessing.get_all_start_methods()
+        )
+
+    def _execute_mutants_in_parallel(
+        self, test_cases: list[tc.TestCase]
+    ) -> Iterator[_MutantResult]:
+        """Execute the mutants in forked processes.
+
+        Every process enumerates all mutants, but only creates and executes every
+        n-th of them, where n is the number of processes.  Thus, the results can be
+        received in the order of the mutants.
+
+        Args:
+            test_cases: The test cases to execute
+
+        Yields:
+            The information about each executed mutant together with the
+            verification traces of the test cases, which are None if the mutant
+            timed out or might have timed out on a skipped test case
+        """
+        context = multiprocessing.get_context("fork")
+        processes = []
+        sources = []
+        for worker_num in range(self._number_of_workers):
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=self._execute_mutants_in_forked_process,
+                args=(test_cases, worker_num, sender),
+                name="MutantExecutionProcess",
+                daemon=True,
+            )
+            process.start()
+            sender.close()
+            processes.append((process, receiver))
+            sources.append(
+                self._receive_mutant_results(test_cases, worker_num, process, receiver)
+            )
+
+        try:
+            for mut_num in itertools.count():
+                result = next(sources[mut_num % len(sources)], None)
+                if result is None:
+                    # The process responsible for this mutant has finished, thus
+                    # there are no more mutants.
+                    return
+                yield result
+        finally:
+            for source in sources:
+                source.close()
+            # The processes have sent all their results, unless the mutants were
+            # not received completely, e.g., because of an exception.  Thus, we do
+            # not wait for them longer than for setting up an execution.
+            join_timeout = self._mutation_executor.get_execution_time_limit([])
+            for process, receiver in processes:
+                receiver.close()
+                process.join(join_timeout)
+                if process.is_alive():
+                    process.kill()
+                    process.join()
+
+    def _execute_mutants_in_forked_process(
+        self, test_cases: list[tc.TestCase], worker_num: int, connection: Connection
+    ) -> None:
+        for result in self._execute_mutants(
+            test_cases, self.__responsibility(worker_num, 0)
+        ):
+            connection.send(result)
+        connection.send(None)
+        connection.close()
+
+    def _receive_mutant_results(
+        self,
+        test_cases: list[tc.TestCase],
+        worker_num: int,
+        process: multiprocessing.process.BaseProcess,
+        receiver: Connection,
+    ) -> Generator[_MutantResult, None, None]:
+        next_mut_num = worker_num
+        # The process has to send the result of its next mutant within the time
+        # limit of executing all test cases.  It can exceed it, e.g., if it
+        # deadlocks on a lock that another thread held while forking.
+        time_limit = self._mutation_executor.get_execution_time_limit(test_cases)
+        try:
+            while receiver.poll(time_limit):
+                if (result := receiver.recv()) is None:
+                    return
+                next_mut_num = result[0].mut_num + self._number_of_workers
+                yield result
+            _LOGGER.warning(
+                "Process %s timed out, re-executing its remaining mutants",
+                process.name,
+            )
+            process.kill()
+        except EOFError:
+            _LOGGER.warning(
+                "Process %s died, re-executing its remaining mutants", process.name
+            )
+        # The process did not send all its results, e.g., because a mutant
+        # terminated it.  Executing the remaining mutants here is what would have
+        # happened without parallel execution.  The mutants are enumerated eagerly,
+        # as other processes might fail as well.
+        yield from list(
+            self._execute_mutants(
+                test_cases, self.__responsibility(worker_num, next_mut_num)
+            )
+        )
+
+    def __responsibility(
+        self, worker_num: int, first_mut_num: int
+    ) -> Callable[[int], bool]:
+        number_of_workers = self._number_of_workers
+        return lambda mut_num: (
+            mut_num % number_of_workers == worker_num and mut_num >= first_mut_num
         )
-        self.__report_mutation_summary(summary)
-        self.__remove_non_relevant_assertions(tests_and_results, summary)
 
     @staticmethod
     def __remove_non_relevant_assertions(
-        tests_and_results: list[tuple[tc.TestCase, list[ex.ExecutionResult]]],
-        mutation_summary: _MutationSummary,
+        test_cases: list[tc.TestCase],
+        merged_traces: list[at.AssertionVerificationTrace],
     ) -> None:
-        for test, results in tests_and_results:
-            merged = at.AssertionVerificationTrace()
-            for result, mut in zip(
-                results, mutation_summary.mutant_information, strict=True
-            ):
-                # Ignore timed out executions
-                if len(mut.timed_out_by) == 0:
-                    merged.merge(result.assertion_verification_trace)
+        for test, merged in zip(test_cases, merged_traces, strict=True):
             for stmt_idx, statement in enumerate(test.statements):
                 for assertion_idx, assertion in reversed(
                     list(enumerate(statement.assertions))
@@ -331,28 +687,31 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
                         statement.assertions.remove(assertion)
 
     @staticmethod
-    def __compute_mutation_summary(
-        number_of_mutants: int,
-        tests_and_results: list[tuple[tc.TestCase, list[ex.ExecutionResult]]],
-    ) -> _MutationSummary:
-        mutation_info = [_MutantInfo(i) for i in range(number_of_mutants)]
-        for test_num, (_, results) in enumerate(tests_and_results):
-            # For each mutation, check if we had a violated assertion
-            for info, result in zip(mutation_info, results, strict=True):
-                if info.timed_out_by:
-                    continue
-                if result.timeout:
-                    # Mutant caused timeout
-                    info.timed_out_by.append(test_num)
-                elif (
-                    len(result.assertion_verification_trace.error) > 0
-                    or len(result.assertion_verification_trace.failed) > 0
-                    or result.has_test_exceptions()
-                    # Execution with assertions should not raise exceptions.
-                    # If it does, it is probably an incompetent mutant
-                ):
-                    info.killed_by.append(test_num)
-        return _MutationSummary(mutation_info)
+    def __evaluate_mutant(
+        mut_num: int, results: list[ex.ExecutionResult | None]
+    ) -> _MutantInfo:
+        info = _MutantInfo(mut_num)
+        for test_num, result in enumerate(results):
+            if result is None:
+                # The test case was not executed on this mutant.
+                continue
+            if result.timeout:
+                # Mutant caused timeout
+                info.timed_out_by.append(test_num)
+                break
+            if MutationAnalysisAssertionGenerator.__is_killed(result):
+                info.killed_by.append(test_num)
+        return info
+
+    @staticmethod
+    def __is_killed(result: ex.ExecutionResult) -> bool:
+        return (
+            len(result.assertion_verification_trace.error) > 0
+            or len(result.assertion_verification_trace.failed) > 0
+            or result.has_test_exceptions()
+            # Execution with assertions should not raise exceptions.
+            # If it does, it is probably an incompetent mutant
+        )
 
     def __report_mutation_summary(self, mutation_summary: _MutationSummary):
         if self._testing:
@@ -388,3 +747,9 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
             len(survived),
             ", ".join(str(x.mut_num) for x in survived),
         )
+        not_reached = mutation_summary.get_survived_by_non_reachability()
+        _LOGGER.info(
+            "Number of Mutant(s) not reached by any Test: %i (Mutants: %s)",
+            len(not_reached),
+            ", ".join(str(x.mut_num) for x in not_reached),
+        )
@@ -12,6 +12,7 @@ import threading
 
 from collections.abc import Sized
 from types import ModuleType
+from typing import Any
 from typing import cast
 
 from _pytest.outcomes import Failed
@@ -48,9 +49,21 @@ class AssertionTraceObserver(ex.ExecutionObserver):
             super().__init__()
             self.trace: at.AssertionTrace = at.AssertionTrace()
             self.watch_list: list[vr.VariableReference] = []
+            # The last object assertion on each reference, together with the
+            # fingerprint of the asserted value.
+            self.snapshots: dict[vr.Reference, tuple[str, ass.ObjectAssertion]] = {}
 
     def __init__(self) -> None:  # noqa: D107
         self._assertion_local_state = AssertionTraceObserver.AssertionLocalState()
+        # The fields of modules and classes are checked after every statement, thus
+        # we create the references to them only once.
+        self._module_field_references: dict[
+            tuple[str, str], vr.StaticModuleFieldReference
+        ] = {}
+        self._class_field_references: dict[
+            tuple[type, str], vr.StaticFieldReference
+        ] = {}
+        self._fields: dict[tuple[type, str], gao.GenericField] = {}
 
     def get_trace(self) -> at.AssertionTrace:
         """Get a copy of the gathered trace.
@@ -61,12 +74,10 @@ class AssertionTraceObserver(ex.ExecutionObserver):
         """
         return self._assertion_local_state.trace.clone()
 
-    def before_test_case_execution(self, test_case: tc.TestCase):
-        """Not used.
-
-        Args:
-            test_case: Not used
-        """
+    def before_test_case_execution(self, test_case: tc.TestCase):  # noqa: D102
+        self._assertion_local_state.trace = at.AssertionTrace()
+        self._assertion_local_state.watch_list = []
+        self._assertion_local_state.snapshots = {}
 
     def before_statement_execution(  # noqa: D102
         self, statement: st.Statement, node: ast.stmt, exec_ctx: ex.ExecutionContext
@@ -148,21 +159,24 @@ class AssertionTraceObserver(ex.ExecutionObserver):
             for field, value in vars(module).items():
                 if self._should_ignore(field, value):
                     continue
-                self._check_reference(
-                    exec_ctx,
-                    vr.StaticModuleFieldReference(
+                if (
+                    module_reference := self._module_field_references.get(
+                        (module_name, field)
+                    )
+                ) is None:
+                    module_reference = vr.StaticModuleFieldReference(
                         # Type information is not used here, so use Any.
                         gao.GenericStaticModuleField(module_name, field, ANY)
-                    ),
-                    position,
-                    trace,
-                )
+                    )
+                    self._module_field_references[module_name, field] = module_reference
+                self._check_reference(exec_ctx, module_reference, position, trace)
 
-        # Check fields of classes whose constructors were used.
-        for seen_type in [
+        # Check fields of classes whose constructors were used.  Each class is only
+        # checked once, even if several of the watched objects are instances of it.
+        for seen_type in dict.fromkeys(
             type(exec_ctx.get_reference_value(ref))
             for ref in self._assertion_local_state.watch_list
-        ]:
+        ):
             if (
                 is_primitive_type(seen_type)
                 or is_collection_type(seen_type)
@@ -176,15 +190,17 @@ class AssertionTraceObserver(ex.ExecutionObserver):
             for field, value in vars(seen_type).items():
                 if self._should_ignore(field, value):
                     continue
-                self._check_reference(
-                    exec_ctx,
-                    vr.StaticFieldReference(
+                if (
+                    class_reference := self._class_field_references.get(
+                        (seen_type, field)
+                    )
+                ) is None:
+                    class_reference = vr.StaticFieldReference(
                         # Type information is not used here, so use Any.
                         gao.GenericStaticField(TypeInfo(seen_type), field, ANY)
-                    ),
-                    position,
-                    trace,
-                )
+                    )
+                    self._class_field_references[seen_type, field] = class_reference
+                self._check_reference(exec_ctx, class_reference, position, trace)
 
     def _check_reference(
         self,
@@ -212,8 +228,12 @@ class AssertionTraceObserver(ex.ExecutionObserver):
         if isinstance(value, float):
             trace.add_entry(position, ass.FloatAssertion(ref, value))
             return
-        if is_assertable(value):
-            trace.add_entry(position, ass.ObjectAssertion(ref, copy.deepcopy(value)))
+        if (unchanged := self._get_unchanged_assertion(ref, value)) is not None:
+            trace.add_entry(position, unchanged)
+        elif is_assertable(value):
+            assertion = ass.ObjectAssertion(ref, copy.deepcopy(value))
+            self._assertion_local_state.snapshots[ref] = (repr(value), assertion)
+            trace.add_entry(position, assertion)
         else:
             # No precise assertion possible, so assert on type.
             typ = type(value)
@@ -239,16 +259,53 @@ class AssertionTraceObserver(ex.ExecutionObserver):
                     if not self._should_ignore(field, field_value):
                         self._check_reference(
                             exec_ctx,
-                            vr.FieldReference(
-                                ref,
-                                # Type information is not used here, so use Any.
-                                gao.GenericField(TypeInfo(type(value)), field, ANY),
-                            ),
+                            vr.FieldReference(ref, self._get_field(type(value), field)),
                             position,
                             trace,
                             depth + 1,
                         )
 
+    def _get_unchanged_assertion(
+        self, ref: vr.Reference, value: Any
+    ) -> ass.ObjectAssertion | None:
+        """Provides the previous object assertion on a reference, if it still holds.
+
+        Comparing the value with the copy of the previous assertion and with the
+        fingerprint, i.e., the representation, of the previously asserted value is
+        much cheaper than checking whether the value is assertable and copying it
+        again.  The representations distinguish values that are equal but of different
+        types, e.g., `[1]` and `[True]`.
+
+        Args:
+            ref: The reference that is checked
+            value: The current value of the reference
+
+        Returns:
+            The previous object assertion on the reference, if the value did not
+            change, otherwise None.
+        """
+        if (snapshot := self._assertion_local_state.snapshots.get(ref)) is None:
+            return None
+        fingerprint, assertion = snapshot
+        # Only compare values of the very same type as the asserted value, which is
+        # a built-in type or an enum.
+        if type(value) is not type(assertion.object):  # noqa: E721
+            return None
+        try:
+            if value == assertion.object and repr(value) == fingerprint:
+                return assertion
+        except BaseException as err:  # noqa: BLE001
+            # The value might contain objects that cannot be compared.
+            _LOGGER.debug(err)
+        return None
+
+    def _get_field(self, owner: type, field: str) -> gao.GenericField:
+        if (generic_field := self._fields.get((owner, field))) is None:
+            # Type information is not used here, so use Any.
+            generic_field = gao.GenericField(TypeInfo(owner), field, ANY)
+            self._fields[owner, field] = generic_field
+        return generic_field
+
     @staticmethod
     def _should_ignore(field, attr_value):
         return (
@@ -272,12 +329,8 @@ class AssertionVerificationObserver(ex.ExecutionObserver):
     def __init__(self):  # noqa: D107
         self.state = AssertionVerificationObserver.AssertionExecutorLocalState()
 
-    def before_test_case_execution(self, test_case: tc.TestCase):
-        """Not used.
-
-        Args:
-            test_case: Not used
-        """
+    def before_test_case_execution(self, test_case: tc.TestCase):  # noqa: D102
+        self.state.trace = at.AssertionVerificationTrace()
 
     def after_test_case_execution_inside_thread(  # noqa: D102
         self, test_case: tc.TestCase, result: ex.ExecutionResult
@@ -24,6 +24,7 @@ from pynguin.utils.exceptions import ConfigurationException
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Iterator
     from types import ModuleType
     from typing import ClassVar
 
@@ -46,19 +47,20 @@ class MutationAdapter:
     def __init__(self):  # noqa: D107
         self.target_loader: mu.ModulesLoader | None = None
 
-    def mutate_module(self) -> list[tuple[ModuleType, list[mo.Mutation]]]:
+    def mutate_module(self) -> Iterator[tuple[ModuleType, list[mo.Mutation]]]:
         """Mutates the modules specified in the configuration.
 
-        Uses MutPy's mutation procedure.
+        Uses MutPy's mutation procedure.  The mutants are created lazily, i.e., the
+        next mutant is only created when it is requested.
 
-        Returns:
-            A list of tuples where the first entry is the mutated module and the second
-            part is a list of all the mutations operators applied.
+        Yields:
+            Tuples where the first entry is the mutated module and the second part is
+            a list of all the mutations operators applied.
         """
         controller = self._build_mutation_controller()
         controller.score = mc.MutationScore()
 
-        mutants = []
+        number_of_mutants = 0
 
         if self.target_loader is not None:
             for target_module, to_mutate in self.target_loader.load():
@@ -71,9 +73,9 @@ class MutationAdapter:
                     target_ast=target_ast,
                 )
                 for mutant_module, mutations in mutant_modules:
-                    mutants.append((mutant_module, mutations))
-        _LOGGER.info("Generated %d mutants", len(mutants))
-        return mutants
+                    number_of_mutants += 1
+                    yield mutant_module, mutations
+        _LOGGER.info("Generated %d mutants", number_of_mutants)
 
     def _build_mutation_controller(self) -> mc.MutationController:
         _LOGGER.info("Setup mutation controller")
@@ -239,6 +239,16 @@ class TestCaseOutputConfiguration:
     allow_stale_assertions: bool = False
     """Allow assertion on things that did not change between statement executions."""
 
+    assertion_filtering_executions: int = 1
+    """Maximum number of times the test cases are executed in shuffled order to
+    remove trivially flaky assertions, e.g., on str representations based on memory
+    locations."""
+
+    assertion_filtering_stable_executions: int = 2
+    """Number of consecutive executions that did not remove any assertion, after
+    which the filtering of flaky assertions stops before reaching
+    assertion_filtering_executions executions."""
+
     mutation_strategy: MutationStrategy = MutationStrategy.FIRST_ORDER_MUTANTS
     """The strategy that shall be used for creating mutants in the mutation analysis
     assertion generation method."""
@@ -247,6 +257,16 @@ class TestCaseOutputConfiguration:
     """The order of the generated higher order mutants in the mutation analysis
     assertion generation method."""
 
+    mutation_early_exit: bool = False
+    """Stop executing test cases on a mutant in the mutation analysis assertion
+    generation method once it is killed, unless a test case has assertions that were
+    not yet violated by any mutant.  Test cases that covered more of the mutated
+    lines are executed first.  The skipped test cases are still executed if the
+    mutant violates assertions that no mutant violated so far, as their traces can
+    only be used if it does not time out on any test case.  Thus, the generated
+    assertions are the same, but a mutant that would time out on a skipped test
+    case is reported as killed."""
+
     post_process: bool = True
     """Should the results be post processed? For example, truncate test cases after
     statements that raise an exception."""
@@ -587,6 +607,33 @@ class StoppingConfiguration:
     (up to maximum_test_execution_timeout)."""
 
 
+@dataclasses.dataclass
+class ExecutionConfiguration:
+    """Configuration related to the execution of test cases."""
+
+    whole_test_case_execution: bool = True
+    """Compile and execute a test case as a whole instead of statement by statement,
+    as long as no execution observer needs to be notified about single statements
+    and the test case does not have to be instrumented for checked coverage."""
+
+    compiled_code_cache_size: int = 4096
+    """Maximum number of statements instrumented for checked coverage that are kept
+    for reuse in later test case executions."""
+
+    number_of_workers: int = 1
+    """Number of forked processes that execute the offspring of population-based
+    algorithms, or the mutants of the mutation-analysis assertion generation, in
+    parallel.  Only used on platforms that support forking.  Offspring are only
+    executed in parallel if test cases are not instrumented for checked coverage and
+    no stopping condition counts executed statements.  A value of 1 disables parallel
+    execution."""
+
+    instrumentation_cache_dir: str = ""
+    """Directory where the instrumented module under test is cached across runs,
+    such that an unchanged module does not have to be analysed and instrumented
+    again.  Caching is disabled if no directory is given."""
+
+
 @dataclasses.dataclass
 class Configuration:
     """General configuration for the test generator."""
@@ -639,6 +686,11 @@ class Configuration:
     random: RandomConfiguration = dataclasses.field(default_factory=RandomConfiguration)
     """Configuration used for the RANDOM algorithm."""
 
+    execution: ExecutionConfiguration = dataclasses.field(
+        default_factory=ExecutionConfiguration
+    )
+    """Test-case execution configuration."""
+
 
 # Singleton instance of the configuration.
 configuration = Configuration(
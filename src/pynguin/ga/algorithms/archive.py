@@ -7,6 +7,8 @@
 """Provides archives to store found solutions."""
 from __future__ import annotations
 
+import bisect
+import heapq
 import logging
 import sys
 
@@ -16,6 +18,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import pynguin.ga.computations as ff
+import pynguin.ga.coveragegoals as bg
 import pynguin.ga.testcasechromosome as tcc
 
 from pynguin.utils import randomness
@@ -24,6 +27,7 @@ from pynguin.utils.orderedset import OrderedSet
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Hashable
     from collections.abc import Iterable
 
 
@@ -108,7 +112,25 @@ class CoverageArchive(Archive):
         super().__init__()
         self._covered: dict[ff.TestCaseFitnessFunction, tcc.TestCaseChromosome] = {}
         self._uncovered = OrderedSet(objectives)
-        self._objectives = OrderedSet(objectives)
+        self._objectives: OrderedSet[ff.TestCaseFitnessFunction] = OrderedSet()
+        # Positions of the objectives, to process them in their order.
+        self._positions: dict[ff.TestCaseFitnessFunction, int] = {}
+        # The objectives whose coverage can be derived from an execution trace,
+        # by coverage key, and those whose coverage has to be computed.
+        self._keyed_objectives: dict[Hashable, list[ff.TestCaseFitnessFunction]] = {}
+        self._unkeyed_objectives: list[ff.TestCaseFitnessFunction] = []
+        # Covered objectives whose solution was not yet checked by _all_covered.
+        self._unchecked: set[ff.TestCaseFitnessFunction] = set()
+        for objective in objectives:
+            self._add_objective(objective)
+
+    def _add_objective(self, objective: ff.TestCaseFitnessFunction) -> None:
+        self._positions[objective] = len(self._objectives)
+        self._objectives.add(objective)
+        if (key := bg.get_coverage_key(objective)) is None:
+            self._unkeyed_objectives.append(objective)
+        else:
+            self._keyed_objectives.setdefault(key, []).append(objective)
 
     def update(self, solutions: Iterable[tcc.TestCaseChromosome]) -> bool:
         """Updates this archive with the given set of solutions.
@@ -122,18 +144,24 @@ class CoverageArchive(Archive):
         Args:
             solutions: The solutions to update the archive with
         """
+        covering: dict[
+            ff.TestCaseFitnessFunction, list[tuple[tcc.TestCaseChromosome, int]]
+        ] = {}
+        for solution in solutions:
+            size = solution.size()
+            for objective in self._get_covered_objectives(solution):
+                covering.setdefault(objective, []).append((solution, size))
+
         updated = False
-        for objective in self._objectives:
+        for objective in sorted(covering, key=self._positions.__getitem__):
             best_solution = self._covered.get(objective, None)
             best_size = sys.maxsize if best_solution is None else best_solution.size()
 
-            for solution in solutions:
-                covers = solution.get_is_covered(objective)
-                size = solution.size()
-
-                if covers and size < best_size:
+            for solution, size in covering[objective]:
+                if size < best_size:
                     updated = True
                     self._covered[objective] = solution
+                    self._unchecked.add(objective)
                     best_size = size
                     if objective in self._uncovered:
                         self._uncovered.remove(objective)
@@ -141,6 +169,42 @@ class CoverageArchive(Archive):
         self._logger.debug("ArchiveCoverageGoals: %d", len(self._covered))
         return updated
 
+    def _get_covered_objectives(
+        self, solution: tcc.TestCaseChromosome
+    ) -> list[ff.TestCaseFitnessFunction]:
+        """Determines the objectives that are covered by a solution.
+
+        The objectives that are identified by a coverage key are looked up by the
+        goals covered by the solution's last execution, which is a single pass over
+        its trace instead of one check per objective.
+
+        Args:
+            solution: The solution to check
+
+        Returns:
+            The covered objectives
+        """
+        covered: list[ff.TestCaseFitnessFunction] = []
+        if self._keyed_objectives:
+            result = solution.get_last_execution_result()
+            if solution.changed or result is None:
+                # Cannot use the trace, checking the objectives executes the solution.
+                covered.extend(
+                    objective
+                    for objectives in self._keyed_objectives.values()
+                    for objective in objectives
+                    if solution.get_is_covered(objective)
+                )
+            else:
+                for key in bg.compute_covered_goal_keys(result.execution_trace):
+                    covered.extend(self._keyed_objectives.get(key, ()))
+        covered.extend(
+            objective
+            for objective in self._unkeyed_objectives
+            if solution.get_is_covered(objective)
+        )
+        return covered
+
     @property
     def uncovered_goals(self) -> OrderedSet[ff.TestCaseFitnessFunction]:
         """Provides the set of goals that are yet to cover.
@@ -173,7 +237,7 @@ class CoverageArchive(Archive):
         for goal in new_goals:
             if goal not in self._objectives:
                 self._logger.debug("Adding goal: %s", goal)
-                self._objectives.add(goal)
+                self._add_objective(goal)
                 self._uncovered.add(goal)
 
     @property
@@ -185,12 +249,17 @@ class CoverageArchive(Archive):
         """Resets the archive."""
         self._uncovered.update(self._objectives)
         self._covered.clear()
+        self._unchecked.clear()
 
     def _all_covered(self) -> bool:
-        return all(
-            chromosome.get_is_covered(fitness_function)
-            for fitness_function, chromosome in self._covered.items()
+        # Only check the solutions that were stored since the last check.
+        all_covered = all(
+            self._covered[fitness_function].get_is_covered(fitness_function)
+            for fitness_function in self._unchecked
         )
+        if all_covered:
+            self._unchecked.clear()
+        return all_covered
 
 
 @dataclass(frozen=True)
@@ -281,7 +350,8 @@ class MIOPopulation:
                 ):
                     added = True
                     self._solutions[-1] = candidate_solution
-            self._sort_solutions()
+            if added:
+                self._sort_solutions()
 
         assert len(self._solutions) <= self._capacity
         if added:
@@ -353,6 +423,74 @@ class MIOPopulation:
         # TODO(fk) support other secondary objectives?
 
 
+class _TargetQueue:
+    """Targets of the MIO archive, bucketed by the counters of their populations.
+
+    Allows to sample one of the targets with the lowest counter uniformly at random,
+    without looking at all targets.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[int, list[ff.TestCaseFitnessFunction]] = {}
+        self._counters: dict[ff.TestCaseFitnessFunction, int] = {}
+        self._indices: dict[ff.TestCaseFitnessFunction, int] = {}
+        # Min-heap of the counters of the buckets, possibly containing counters whose
+        # buckets became empty in the meantime.
+        self._heap: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    def __contains__(self, target: ff.TestCaseFitnessFunction) -> bool:
+        return target in self._counters
+
+    def add(self, target: ff.TestCaseFitnessFunction, counter: int) -> None:
+        """Adds a target, or updates its counter if it is already contained.
+
+        Args:
+            target: The target
+            counter: The counter of the target's population
+        """
+        if self._counters.get(target) == counter:
+            return
+        self.remove(target)
+        if (bucket := self._buckets.get(counter)) is None:
+            bucket = self._buckets[counter] = []
+            heapq.heappush(self._heap, counter)
+        self._counters[target] = counter
+        self._indices[target] = len(bucket)
+        bucket.append(target)
+
+    def remove(self, target: ff.TestCaseFitnessFunction) -> None:
+        """Removes a target, if it is contained.
+
+        Args:
+            target: The target
+        """
+        if (counter := self._counters.pop(target, None)) is None:
+            return
+        bucket = self._buckets[counter]
+        index = self._indices.pop(target)
+        # Fill the gap with the last target of the bucket.
+        last = bucket.pop()
+        if last is not target:
+            bucket[index] = last
+            self._indices[last] = index
+        if not bucket:
+            del self._buckets[counter]
+
+    def sample(self) -> ff.TestCaseFitnessFunction:
+        """Samples one of the targets with the lowest counter.
+
+        Returns:
+            A random target with the lowest counter
+        """
+        assert self._counters, "Cannot sample from an empty queue"
+        while self._heap[0] not in self._buckets:
+            heapq.heappop(self._heap)
+        return randomness.choice(self._buckets[self._heap[0]])
+
+
 class MIOArchive(Archive):
     """The archive that is used in MIO."""
 
@@ -365,30 +503,106 @@ class MIOArchive(Archive):
         self._archive: dict[ff.TestCaseFitnessFunction, MIOPopulation] = {
             target: MIOPopulation(initial_size) for target in targets
         }
+        # Positions of the targets, to process them in their order.
+        self._positions: dict[ff.TestCaseFitnessFunction, int] = {
+            target: position for position, target in enumerate(self._archive)
+        }
+        # The uncovered targets and the covered targets, in their order, as well as
+        # the covered targets whose coverage can be derived from an execution trace,
+        # by coverage key.
+        self._uncovered: dict[ff.TestCaseFitnessFunction, None] = dict.fromkeys(
+            self._archive
+        )
+        self._covered: list[ff.TestCaseFitnessFunction] = []
+        self._covered_keyed: dict[Hashable, list[ff.TestCaseFitnessFunction]] = {}
+        self._covered_unkeyed: list[ff.TestCaseFitnessFunction] = []
+        # The targets that can be sampled, i.e., the uncovered targets that have
+        # some solutions and the covered targets.
+        self._uncovered_queue = _TargetQueue()
+        self._covered_queue = _TargetQueue()
+        self._solutions: OrderedSet[tcc.TestCaseChromosome] | None = None
 
     def update(self, solutions: Iterable[tcc.TestCaseChromosome]) -> bool:
         """Update the archive with the given solutions."""
         updated = False
         for solution in solutions:
             solution_clone = solution.clone()
-            for target in self._archive:
-                fitness_value = solution_clone.get_fitness_for(target)
-                result = solution_clone.get_last_execution_result()
-                assert result is not None
-                if result.has_test_exceptions():
-                    chop_position = solution_clone.get_last_mutatable_statement()
-                    assert chop_position is not None
-                    solution_clone.test_case.chop(chop_position)
-                covered_before = self._archive[target].is_covered
-                updated |= self._archive[target].add_solution(
-                    1.0 - ff.normalise(fitness_value), solution_clone
-                )
-                # The goal was covered with this solution
-                # TODO(fk) replace with goal.is_covered?
-                if not covered_before and self._archive[target].is_covered:
+            fitness_values = self._compute_fitness_values(solution_clone)
+            if not fitness_values:
+                # The solution cannot improve any target.
+                continue
+            result = solution_clone.get_last_execution_result()
+            assert result is not None
+            if result.has_test_exceptions():
+                chop_position = solution_clone.get_last_mutatable_statement()
+                assert chop_position is not None
+                solution_clone.test_case.chop(chop_position)
+            for target in sorted(fitness_values, key=self._positions.__getitem__):
+                population = self._archive[target]
+                covered_before = population.is_covered
+                if not population.add_solution(
+                    1.0 - ff.normalise(fitness_values[target]), solution_clone
+                ):
+                    continue
+                updated = True
+                if covered_before:
+                    self._solutions = None
+                    self._covered_queue.add(target, population.counter)
+                elif population.is_covered:
+                    # The goal was covered with this solution
+                    self._on_covered(target)
                     self._on_target_covered(target)
+                else:
+                    self._uncovered_queue.add(target, population.counter)
         return updated
 
+    def _compute_fitness_values(
+        self, solution: tcc.TestCaseChromosome
+    ) -> dict[ff.TestCaseFitnessFunction, float]:
+        """Computes the fitness values of the targets a solution might improve.
+
+        These are all uncovered targets and the covered targets that are covered by
+        the solution, too, because a covered target does not accept any solution
+        that does not cover it.  The latter are looked up by the goals covered by
+        the solution's execution, instead of checking every covered target.
+
+        Args:
+            solution: The solution
+
+        Returns:
+            The fitness values of the solution, by target
+        """
+        fitness_values = {
+            target: solution.get_fitness_for(target) for target in self._uncovered
+        }
+        result = solution.get_last_execution_result()
+        if solution.changed or result is None:
+            # Cannot use the trace, so compute the values for all covered targets.
+            covered: Iterable[ff.TestCaseFitnessFunction] = (
+                target for target in self._archive if target not in self._uncovered
+            )
+        else:
+            covered = [
+                target
+                for key in bg.compute_covered_goal_keys(result.execution_trace)
+                for target in self._covered_keyed.get(key, ())
+            ]
+            covered.extend(self._covered_unkeyed)
+        for target in covered:
+            fitness_values[target] = solution.get_fitness_for(target)
+        return fitness_values
+
+    def _on_covered(self, target: ff.TestCaseFitnessFunction) -> None:
+        del self._uncovered[target]
+        bisect.insort(self._covered, target, key=self._positions.__getitem__)
+        if (key := bg.get_coverage_key(target)) is None:
+            self._covered_unkeyed.append(target)
+        else:
+            self._covered_keyed.setdefault(key, []).append(target)
+        self._uncovered_queue.remove(target)
+        self._covered_queue.add(target, self._archive[target].counter)
+        self._solutions = None
+
     def get_solution(self) -> tcc.TestCaseChromosome | None:
         """Get a random solution."""
         # Choose one target at random that has not been covered but contains some
@@ -397,33 +611,21 @@ class MIOArchive(Archive):
         # targets there is not any solution yet, then choose one of the covered targets
         # at random. Thereafter, choose one solution randomly from the list of solutions
         # of the chosen target.
-        targets_with_solutions = [
-            func
-            for func, population in self._archive.items()
-            if population.num_solutions > 0
-        ]
-        if len(targets_with_solutions) == 0:
+        if len(self._uncovered_queue) > 0:
+            queue = self._uncovered_queue
+        elif len(self._covered_queue) > 0:
+            queue = self._covered_queue
+        else:
             # There is not at least one target with at least one solution
             return None
 
-        potential_targets = [
-            func
-            for func in targets_with_solutions
-            if not self._archive[func].is_covered
-        ]
-        if len(potential_targets) == 0:
-            potential_targets = targets_with_solutions
-
-        assert len(potential_targets) > 0
-
-        # We shuffle before, so we don't always pick the same, in case of ties.
-        randomness.RNG.shuffle(potential_targets)
-
-        # Instead of choosing a target at random, we choose the one with the lowest
+        # Instead of choosing a target at random, we choose one with the lowest
         # counter value. (See Section 3.3 of the paper that describes this archive
         # for more details)
-        potential_targets.sort(key=lambda t: self._archive[t].counter)
-        sampled = self._archive[potential_targets[0]].sample_solution()
+        target = queue.sample()
+        population = self._archive[target]
+        sampled = population.sample_solution()
+        queue.add(target, population.counter)
         if sampled is not None:
             sampled = sampled.clone()
         return sampled
@@ -436,16 +638,20 @@ class MIOArchive(Archive):
 
     @property
     def solutions(self) -> OrderedSet[tcc.TestCaseChromosome]:  # noqa: D102
-        result: OrderedSet[tcc.TestCaseChromosome] = OrderedSet()
-        for population in self._archive.values():
-            solution = population.get_best_solution_if_any()
-            if solution is not None:
-                result.add(solution)
-        return result
+        if self._solutions is None:
+            # Hashing a test case is expensive, and a solution is often the best one
+            # for several targets, thus skip the solutions that were already seen.
+            self._solutions = OrderedSet()
+            seen: set[int] = set()
+            for target in self._covered:
+                solution = self._archive[target].get_best_solution_if_any()
+                assert solution is not None
+                if id(solution) not in seen:
+                    seen.add(id(solution))
+                    self._solutions.add(solution)
+        return self._solutions
 
     @property
     def num_covered_targets(self) -> int:
         """The amount of targets that are covered."""
-        return len(
-            [1 for population in self._archive.values() if population.is_covered]
-        )
+        return len(self._covered_queue)
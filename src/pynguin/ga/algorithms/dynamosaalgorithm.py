@@ -56,6 +56,7 @@ class DynaMOSAAlgorithm(AbstractMOSAAlgorithm):
         )
 
         self._population = self._get_random_population()
+        self.execute_changed_test_cases(self._population)
         self._goals_manager.update(self._population)
 
         # Calculate dominance ranks and crowding distance
@@ -86,6 +87,7 @@ class DynaMOSAAlgorithm(AbstractMOSAAlgorithm):
         offspring_population: list[
             tcc.TestCaseChromosome
         ] = self._breed_next_generation()
+        self.execute_changed_test_cases(offspring_population)
 
         # Create union of parents and offspring
         union: list[tcc.TestCaseChromosome] = []
@@ -154,8 +156,22 @@ class _GoalsManager:
         self._current_goals: OrderedSet[
             bg.BranchCoverageTestFitness
         ] = self._graph.root_branches
+        # The goals covered so far, and those covered since the last update of the
+        # current goals.  Both are maintained by the archive's callback, such that
+        # an update only has to look at the goals that were covered in between.
+        self._covered_goals: set[bg.BranchCoverageTestFitness] = set(
+            self._archive.covered_goals  # type: ignore[arg-type]
+        )
+        self._newly_covered_goals: set[bg.BranchCoverageTestFitness] = set()
+        self._archive.add_on_target_covered(
+            self._on_target_covered  # type: ignore[arg-type]
+        )
         self._archive.add_goals(self._current_goals)  # type: ignore[arg-type]
 
+    def _on_target_covered(self, target: bg.BranchCoverageTestFitness) -> None:
+        self._covered_goals.add(target)
+        self._newly_covered_goals.add(target)
+
     @property
     def current_goals(self) -> OrderedSet[ff.FitnessFunction]:
         """Provides the set of current goals.
@@ -171,24 +187,30 @@ class _GoalsManager:
         Args:
             solutions: The previously found solutions
         """
-        # We must keep iterating, as long as new goals are added.
-        new_goals_added = True
-        while new_goals_added:
-            self._archive.update(solutions)
-            covered = self._archive.covered_goals
+        # We must keep iterating, as long as new goals are added.  The current goals
+        # never contain a covered goal, thus only the goals that were covered by this
+        # archive update have to be replaced by their uncovered structural children.
+        self._archive.update(solutions)
+        while self._newly_covered_goals:
             new_goals: OrderedSet[bg.BranchCoverageTestFitness] = OrderedSet()
-            new_goals_added = False
+            added_goals: OrderedSet[bg.BranchCoverageTestFitness] = OrderedSet()
             for old_goal in self._current_goals:
-                if old_goal in covered:
-                    children = self._graph.get_structural_children(old_goal)
-                    for child in children:
-                        if child not in self._current_goals and child not in covered:
+                if old_goal in self._newly_covered_goals:
+                    for child in self._graph.get_structural_children(old_goal):
+                        if (
+                            child not in self._current_goals
+                            and child not in self._covered_goals
+                        ):
                             new_goals.add(child)
-                            new_goals_added = True
+                            added_goals.add(child)
                 else:
                     new_goals.add(old_goal)
+            self._newly_covered_goals.clear()
             self._current_goals = new_goals
-            self._archive.add_goals(self._current_goals)  # type: ignore[arg-type]
+            if not added_goals:
+                break
+            self._archive.add_goals(added_goals)  # type: ignore[arg-type]
+            self._archive.update(solutions)
         self._logger.debug("current goals after update: %s", self._current_goals)
 
 
@@ -218,8 +240,12 @@ class _BranchFitnessGraph:
         subject_properties: SubjectProperties,
     ):
         """Construct the actual graph from the given fitness functions."""
+        fitness_by_goal: dict[
+            bg.AbstractCoverageGoal, bg.BranchCoverageTestFitness
+        ] = {}
         for fitness in fitness_functions:
             self._graph.add_node(fitness)
+            fitness_by_goal.setdefault(fitness.goal, fitness)
 
         for fitness in fitness_functions:
             if fitness.goal.is_branchless_code_object:
@@ -247,7 +273,7 @@ class _BranchFitnessGraph:
                     dependency.predicate_id,
                     dependency.branch_value,
                 )
-                dependent_ff = self._goal_to_fitness_function(fitness_functions, goal)
+                dependent_ff = self._goal_to_fitness_function(fitness_by_goal, goal)
                 self._graph.add_edge(dependent_ff, fitness)
 
         # Sanity check
@@ -268,20 +294,23 @@ class _BranchFitnessGraph:
 
     @staticmethod
     def _goal_to_fitness_function(
-        search_in: OrderedSet[bg.BranchCoverageTestFitness], goal: bg.BranchGoal
+        search_in: dict[bg.AbstractCoverageGoal, bg.BranchCoverageTestFitness],
+        goal: bg.BranchGoal,
     ) -> bg.BranchCoverageTestFitness:
         """Little helper to find the fitness function associated with a certain goal.
 
         Args:
-            search_in: The list to search in
+            search_in: The fitness functions indexed by their goals
             goal: The goal to search for
 
         Returns:
             The found fitness function.
+
+        Raises:
+            RuntimeError: If there is no fitness function for the goal.
         """
-        for fitness in search_in:
-            if fitness.goal == goal:
-                return fitness
+        if (fitness := search_in.get(goal)) is not None:
+            return fitness
         raise RuntimeError(f"Could not find fitness function for goal: {goal}")
 
     def get_structural_children(
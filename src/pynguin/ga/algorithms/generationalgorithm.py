@@ -266,6 +266,34 @@ class GenerationAlgorithm(Generic[A]):
             suite.add_coverage_function(suite_coverage)
         return suite
 
+    def execute_changed_test_cases(
+        self, population: Iterable[tcc.TestCaseChromosome]
+    ) -> None:
+        """Executes the changed test-case chromosomes of a population at once.
+
+        Executing them together allows the executor to execute them in parallel.
+        Test-case chromosomes that did not change keep their execution result.
+
+        Args:
+            population: A list of test-case chromosomes
+        """
+        changed = [
+            chromosome
+            for chromosome in population
+            if chromosome.changed or chromosome.get_last_execution_result() is None
+        ]
+        if len(changed) == 0:
+            return
+        results = self._executor.execute_multiple(
+            [chromosome.test_case for chromosome in changed]
+        )
+        for chromosome, result in zip(changed, results, strict=True):
+            chromosome.set_last_execution_result(result)
+            chromosome.changed = False
+            # The chromosome is no longer aware that it was changed, thus we have to
+            # invalidate the values computed so far.
+            chromosome.invalidate_cache()
+
     @abstractmethod
     def generate_tests(self) -> tsc.TestSuiteChromosome:
         """Generates tests for a given module until the time limit is reached.
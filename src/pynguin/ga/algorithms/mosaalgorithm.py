@@ -39,6 +39,7 @@ class MOSAAlgorithm(AbstractMOSAAlgorithm):
         )
 
         self._population = self._get_random_population()
+        self.execute_changed_test_cases(self._population)
         self._archive.update(self._population)
 
         # Calculate dominance ranks and crowding distance
@@ -73,6 +74,7 @@ class MOSAAlgorithm(AbstractMOSAAlgorithm):
         offspring_population: list[
             tcc.TestCaseChromosome
         ] = self._breed_next_generation()
+        self.execute_changed_test_cases(offspring_population)
 
         # Create union of parents and offspring
         union: list[tcc.TestCaseChromosome] = []
@@ -43,6 +43,11 @@ class WholeSuiteAlgorithm(GenerationAlgorithm[arch.CoverageArchive]):
     ) -> tsc.TestSuiteChromosome:
         self.before_search_start()
         self._population = self._get_random_population()
+        self.execute_changed_test_cases(
+            chromosome
+            for suite in self._population
+            for chromosome in suite.test_case_chromosomes
+        )
         self._update_archive()
         self._sort_population()
         suite = self._get_solution()
@@ -58,6 +63,9 @@ class WholeSuiteAlgorithm(GenerationAlgorithm[arch.CoverageArchive]):
         """Evolve the current population and replace it with a new one."""
         new_generation = []
         new_generation.extend(self.elitism())
+        # The offspring are put into the new generation for now, together with the
+        # index of their place, which is decided once all offspring were executed.
+        families = []
         while not self.is_next_population_full(new_generation):
             parent1 = self._selection_function.select(self._population, 1)[0]
             parent2 = self._selection_function.select(self._population, 1)[0]
@@ -78,24 +86,36 @@ class WholeSuiteAlgorithm(GenerationAlgorithm[arch.CoverageArchive]):
                 self._logger.info("Crossover/Mutation failed: %s", ex)
                 continue
 
+            families.append(
+                (len(new_generation), parent1, parent2, offspring1, offspring2)
+            )
+            new_generation.extend((offspring1, offspring2))
+
+        self.execute_changed_test_cases(
+            chromosome
+            for _, _, _, offspring1, offspring2 in families
+            for offspring in (offspring1, offspring2)
+            for chromosome in offspring.test_case_chromosomes
+        )
+
+        best_individual = self._get_best_individual()
+        for idx, parent1, parent2, offspring1, offspring2 in families:
             fitness_parents = min(parent1.get_fitness(), parent2.get_fitness())
             fitness_offspring = min(offspring1.get_fitness(), offspring2.get_fitness())
             length_parents = parent1.length() + parent2.length()
             length_offspring = offspring1.length() + offspring2.length()
-            best_individual = self._get_best_individual()
 
             if (fitness_offspring < fitness_parents) or (
                 fitness_offspring == fitness_parents
                 and length_offspring <= length_parents
             ):
-                for offspring in [offspring1, offspring2]:
-                    if offspring.length() <= 2 * best_individual.length():
-                        new_generation.append(offspring)
-                    else:
-                        new_generation.append(randomness.choice([parent1, parent2]))
+                for offset, offspring in enumerate((offspring1, offspring2)):
+                    if offspring.length() > 2 * best_individual.length():
+                        new_generation[idx + offset] = randomness.choice(
+                            [parent1, parent2]
+                        )
             else:
-                new_generation.append(parent1)
-                new_generation.append(parent2)
+                new_generation[idx : idx + 2] = [parent1, parent2]
 
         self._population = new_generation
         self._update_archive()
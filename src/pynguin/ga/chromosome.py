@@ -9,11 +9,16 @@ from __future__ import annotations
 
 from abc import ABCMeta
 from abc import abstractmethod
+from typing import TYPE_CHECKING
 
 import pynguin.ga.chromosomevisitor as cv
 import pynguin.ga.computations as ff
 
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
 class Chromosome(metaclass=ABCMeta):
     """An abstract base class for chromosomes."""
 
@@ -117,6 +122,19 @@ class Chromosome(metaclass=ABCMeta):
         """
         return self._computation_cache.get_fitness_for(fitness_function)
 
+    def get_fitness_values(
+        self, fitness_functions: Iterable[ff.FitnessFunction]
+    ) -> list[float]:
+        """Returns the fitness values of several fitness functions at once.
+
+        Args:
+            fitness_functions: The fitness functions
+
+        Returns:
+            Their fitness values, in the same order
+        """
+        return self._computation_cache.get_fitness_values(fitness_functions)
+
     def get_is_covered(self, fitness_function: ff.FitnessFunction) -> bool:
         """Check if the individual covers this fitness function.
 
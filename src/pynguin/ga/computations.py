@@ -26,6 +26,7 @@ from pynguin.testcase.execution import ExecutionTrace
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Iterable
 
     from pynguin.slicer.dynamicslicer import SlicingCriterion
     from pynguin.testcase.execution import AbstractTestCaseExecutor
@@ -99,6 +100,29 @@ class TestSuiteChromosomeComputation(ChromosomeComputation, metaclass=abc.ABCMet
             results.append(result)
         return results
 
+    @staticmethod
+    def _merge_test_suite_traces(
+        individual, results: list[ExecutionResult]
+    ) -> ExecutionTrace:
+        """Merges the execution traces of the results of a test suite.
+
+        Uses the incrementally merged trace of the test suite, such that only the
+        traces of changed test cases have to be merged.  The merged trace does not
+        contain executed instructions or assertions.
+
+        Args:
+            individual: The test suite the results belong to
+            results: The execution results of the test cases of the test suite
+
+        Returns:
+            The merged trace
+        """
+        traces = []
+        for result in results:
+            assert result.execution_trace is not None
+            traces.append(result.execution_trace)
+        return individual.merged_execution_trace.update(traces)
+
 
 class FitnessFunction:
     """Interface for a fitness function."""
@@ -216,7 +240,7 @@ class BranchDistanceTestSuiteFitnessFunction(TestSuiteFitnessFunction):
 
     def compute_fitness(self, individual) -> float:  # noqa: D102
         results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual, results)
         tracer = self._executor.tracer
 
         return compute_branch_distance_fitness(
@@ -229,7 +253,7 @@ class BranchDistanceTestSuiteFitnessFunction(TestSuiteFitnessFunction):
 
     def compute_is_covered(self, individual) -> bool:  # noqa: D102
         results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual, results)
         tracer = self._executor.tracer
 
         return compute_branch_distance_fitness_is_covered(
@@ -249,14 +273,14 @@ class LineTestSuiteFitnessFunction(TestSuiteFitnessFunction):
 
     def compute_fitness(self, individual) -> float:  # noqa: D102
         results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual, results)
         tracer = self._executor.tracer
         existing_lines = tracer.get_subject_properties().existing_lines
         return len(existing_lines) - len(merged_trace.covered_line_ids)
 
     def compute_is_covered(self, individual) -> bool:  # noqa: D102
         results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual, results)
         tracer = self._executor.tracer
 
         return compute_line_coverage_fitness_is_covered(
@@ -277,7 +301,7 @@ class StatementCheckedTestSuiteFitnessFunction(TestSuiteFitnessFunction):
 
     def compute_fitness(self, individual) -> float:  # noqa: D102
         results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual, results)
         tracer = self._executor.tracer
 
         return len(tracer.get_subject_properties().existing_lines) - len(
@@ -286,7 +310,7 @@ class StatementCheckedTestSuiteFitnessFunction(TestSuiteFitnessFunction):
 
     def compute_is_covered(self, individual) -> bool:  # noqa: D102
         results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual, results)
         tracer = self._executor.tracer
 
         return compute_checked_coverage_statement_fitness_is_covered(
@@ -330,7 +354,7 @@ class TestSuiteBranchCoverageFunction(TestSuiteCoverageFunction):
 
     def compute_coverage(self, individual) -> float:  # noqa: D102
         results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual, results)
         tracer = self._executor.tracer
         return compute_branch_coverage(merged_trace, tracer.get_subject_properties())
 
@@ -350,7 +374,7 @@ class TestSuiteLineCoverageFunction(TestSuiteCoverageFunction):
 
     def compute_coverage(self, individual) -> float:  # noqa: D102
         results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual, results)
         tracer = self._executor.tracer
         return compute_line_coverage(merged_trace, tracer.get_subject_properties())
 
@@ -370,7 +394,7 @@ class TestSuiteStatementCheckedCoverageFunction(TestSuiteCoverageFunction):
 
     def compute_coverage(self, individual) -> float:  # noqa: D102
         results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual, results)
         tracer = self._executor.tracer
 
         existing = len(tracer.get_subject_properties().existing_lines)
@@ -608,6 +632,33 @@ class ComputationCache:
         )
         return self._fitness_cache[fitness_function]
 
+    def get_fitness_values(
+        self, fitness_functions: Iterable[FitnessFunction]
+    ) -> list[float]:
+        """Returns the fitness values of several fitness functions at once.
+
+        This is equivalent to calling `get_fitness_for` for every fitness function,
+        but only checks the cache for fitness values that are not yet cached.
+
+        Args:
+            fitness_functions: The fitness functions
+
+        Returns:
+            Their fitness values, in the same order
+        """
+        cache = self._fitness_cache
+        values: list[float] = []
+        for fitness_function in fitness_functions:
+            if self._chromosome.changed or fitness_function not in cache:
+                self._check_cache(
+                    self._compute_fitness,
+                    cache,
+                    self._fitness_functions,
+                    fitness_function,
+                )
+            values.append(cache[fitness_function])
+        return values
+
     def get_is_covered(self, fitness_function: FitnessFunction) -> bool:
         """Check if the individual covers this fitness function.
 
@@ -729,35 +780,38 @@ def compute_branch_distance_fitness(
     exclude_true = set() if exclude_true is None else exclude_true
     exclude_false = set() if exclude_false is None else exclude_false
 
-    # Check if all predicates are covered
+    # Check if all predicates are covered.  This runs for every evaluation of a
+    # test suite and for every predicate of the subject, thus the fitness of the
+    # branches is computed inline.  Covered branches contribute 0.0 and are skipped;
+    # all other values are summed up in predicate order, which keeps the fitness
+    # bit-for-bit identical to adding up the fitness of every single branch.
+    true_distances = trace.true_distances
+    false_distances = trace.false_distances
+    executed_predicates = trace.executed_predicates
     predicate_fitness: float = 0.0
     for predicate in subject_properties.existing_predicates:
+        executions = executed_predicates.get(predicate, 0)
         if predicate not in exclude_true:
-            predicate_fitness += _predicate_fitness(
-                predicate, trace.true_distances, trace
-            )
+            distance = true_distances.get(predicate)
+            if distance != 0.0:
+                predicate_fitness += (
+                    1.0
+                    if executions < 2
+                    else normalise(distance)  # type: ignore[arg-type]
+                )
         if predicate not in exclude_false:
-            predicate_fitness += _predicate_fitness(
-                predicate, trace.false_distances, trace
-            )
+            distance = false_distances.get(predicate)
+            if distance != 0.0:
+                predicate_fitness += (
+                    1.0
+                    if executions < 2
+                    else normalise(distance)  # type: ignore[arg-type]
+                )
 
     assert predicate_fitness >= 0.0, "Predicate fitness cannot be negative."
     return code_objects_missing + predicate_fitness
 
 
-def _predicate_fitness(
-    predicate: int, branch_distances: dict[int, float], trace: ExecutionTrace
-) -> float:
-    if predicate in branch_distances and branch_distances[predicate] == 0.0:
-        return 0.0
-    if (
-        predicate in trace.executed_predicates
-        and trace.executed_predicates[predicate] >= 2
-    ):
-        return normalise(branch_distances[predicate])
-    return 1.0
-
-
 def compute_branch_distance_fitness_is_covered(
     trace: ExecutionTrace,
     subject_properties: SubjectProperties,
@@ -948,7 +1002,7 @@ def compute_statement_checked_lines(
     """
     known_code_objects = subject_properties.existing_code_objects
     dynamic_slicer = DynamicSlicer(known_code_objects)
-    checked_lines_ids = set()
+    slicing_criteria = []
     for statement in statements:
         if statement.get_position() not in statement_slicing_criteria:
             # if there is no slicing criterion there was an exception during
@@ -956,10 +1010,11 @@ def compute_statement_checked_lines(
             # with an exception will never be executed,
             # thus having no slicing criterion
             break
-        statement_slice = dynamic_slicer.slice(
-            trace,
-            statement_slicing_criteria[statement.get_position()],
-        )
+        slicing_criteria.append(statement_slicing_criteria[statement.get_position()])
+
+    checked_lines_ids = set()
+    # All statements are sliced in a single backward pass over the trace
+    for statement_slice in dynamic_slicer.slice_criteria(trace, slicing_criteria):
         statement_checked_lines = DynamicSlicer.map_instructions_to_lines(
             statement_slice, subject_properties
         )
@@ -1002,10 +1057,12 @@ def compute_assertion_checked_coverage(
     else:
         assertion_slicer = AssertionSlicer(subject_properties.existing_code_objects)
         checked_instructions = []
-        for executed_assertion in trace.executed_assertions:
-            assertion_checked_instructions = assertion_slicer.slice_assertion(
-                executed_assertion, trace
-            )
+        # All assertions are sliced in a single backward pass over the trace
+        for executed_assertion, assertion_checked_instructions in zip(
+            trace.executed_assertions,
+            assertion_slicer.slice_assertions(trace.executed_assertions, trace),
+            strict=True,
+        ):
             executed_assertion.assertion.checked_instructions.extend(
                 assertion_checked_instructions
             )
@@ -18,10 +18,13 @@ from pynguin.utils.orderedset import OrderedSet
 
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     import pynguin.ga.testcasechromosome as tcc
 
     from pynguin.testcase.execution import AbstractTestCaseExecutor
     from pynguin.testcase.execution import ExecutionResult
+    from pynguin.testcase.execution import ExecutionTrace
     from pynguin.testcase.execution import ExecutionTracer
     from pynguin.testcase.execution import SubjectProperties
 
@@ -55,6 +58,18 @@ class AbstractCoverageGoal:
             True, if this goal is covered in the execution result
         """
 
+    @property
+    @abstractmethod
+    def coverage_key(self) -> Hashable:
+        """Provides a key that identifies this goal among the covered goals of a trace.
+
+        A goal is covered by an execution trace, iff its key is contained in the
+        result of `compute_covered_goal_keys` for that trace.
+
+        Returns:
+            The key of this goal
+        """
+
 
 class LineCoverageGoal(AbstractCoverageGoal):
     """Line to be covered by the search as goal."""
@@ -75,6 +90,10 @@ class LineCoverageGoal(AbstractCoverageGoal):
     def is_covered(self, result: ExecutionResult) -> bool:  # noqa: D102
         return self._line_id in result.execution_trace.covered_line_ids
 
+    @property
+    def coverage_key(self) -> Hashable:  # noqa: D102
+        return LineCoverageGoal, self._line_id
+
     def __str__(self) -> str:
         return f"Line Coverage Goal{self._line_id}"
 
@@ -111,6 +130,10 @@ class CheckedCoverageGoal(AbstractCoverageGoal):
     def is_covered(self, result: ExecutionResult) -> bool:  # noqa: D102
         return self._line_id in result.execution_trace.checked_lines
 
+    @property
+    def coverage_key(self) -> Hashable:  # noqa: D102
+        return CheckedCoverageGoal, self._line_id
+
     def __str__(self) -> str:
         return f"Checked Coverage Goal{self._line_id}"
 
@@ -198,6 +221,10 @@ class BranchlessCodeObjectGoal(AbstractBranchCoverageGoal):
     def is_covered(self, result: ExecutionResult) -> bool:  # noqa: D102
         return self._code_object_id in result.execution_trace.executed_code_objects
 
+    @property
+    def coverage_key(self) -> Hashable:  # noqa: D102
+        return BranchlessCodeObjectGoal, self._code_object_id
+
     def __str__(self) -> str:
         return f"Branch-less Code-Object {self._code_object_id}"
 
@@ -240,6 +267,10 @@ class BranchGoal(AbstractBranchCoverageGoal):
             and distances[self._predicate_id] == 0.0
         )
 
+    @property
+    def coverage_key(self) -> Hashable:  # noqa: D102
+        return BranchGoal, self._predicate_id, self._value
+
     @property
     def predicate_id(self) -> int:
         """Provides the predicate id of the targeted predicate.
@@ -413,6 +444,15 @@ class LineCoverageTestFitness(ff.TestCaseFitnessFunction):
     def __repr__(self) -> str:
         return f"LineCoverageTestFitness(executor={self._executor}, goal={self._goal})"
 
+    @property
+    def goal(self) -> LineCoverageGoal:
+        """Provides the line-coverage goal of this fitness function.
+
+        Returns:
+            The attached line-coverage goal
+        """
+        return self._goal
+
 
 class StatementCheckedCoverageTestFitness(ff.TestCaseFitnessFunction):
     """A statement checked coverage fitness implementation for test cases."""
@@ -444,6 +484,15 @@ class StatementCheckedCoverageTestFitness(ff.TestCaseFitnessFunction):
             f"goal={self._goal})"
         )
 
+    @property
+    def goal(self) -> CheckedCoverageGoal:
+        """Provides the checked-coverage goal of this fitness function.
+
+        Returns:
+            The attached checked-coverage goal
+        """
+        return self._goal
+
 
 def create_branch_coverage_fitness_functions(
     executor: AbstractTestCaseExecutor, branch_goal_pool: BranchGoalPool
@@ -512,3 +561,51 @@ def create_checked_coverage_fitness_functions(
             ) in executor.tracer.get_subject_properties().existing_lines.items()
         ]
     )
+
+
+def get_coverage_key(fitness_function: ff.TestCaseFitnessFunction) -> Hashable | None:
+    """Provides the coverage key of the goal of a fitness function, if it has one.
+
+    Args:
+        fitness_function: The fitness function
+
+    Returns:
+        The coverage key of the goal targeted by the fitness function, or None, if
+        the coverage of the fitness function cannot be determined from a trace.
+    """
+    if isinstance(
+        fitness_function,
+        BranchCoverageTestFitness
+        | LineCoverageTestFitness
+        | StatementCheckedCoverageTestFitness,
+    ):
+        return fitness_function.goal.coverage_key
+    return None
+
+
+def compute_covered_goal_keys(trace: ExecutionTrace) -> set[Hashable]:
+    """Computes the coverage keys of all goals that are covered by a trace.
+
+    This is a single pass over the trace, which is much cheaper than checking
+    every goal if there are many goals.
+
+    Args:
+        trace: The execution trace
+
+    Returns:
+        The coverage keys of all covered goals
+    """
+    keys: set[Hashable] = {
+        (LineCoverageGoal, line_id) for line_id in trace.covered_line_ids
+    }
+    keys.update((CheckedCoverageGoal, line_id) for line_id in trace.checked_lines)
+    keys.update(
+        (BranchlessCodeObjectGoal, code_object_id)
+        for code_object_id in trace.executed_code_objects
+    )
+    for predicate_id in trace.executed_predicates:
+        if trace.true_distances[predicate_id] == 0.0:
+            keys.add((BranchGoal, predicate_id, True))
+        if trace.false_distances[predicate_id] == 0.0:
+            keys.add((BranchGoal, predicate_id, False))
+    return keys
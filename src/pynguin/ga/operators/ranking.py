@@ -8,7 +8,6 @@
 from __future__ import annotations
 
 import logging
-import sys
 
 from abc import ABCMeta
 from abc import abstractmethod
@@ -20,13 +19,13 @@ from typing import TypeVar
 import pynguin.configuration as config
 import pynguin.ga.chromosome as chrom
 
-from pynguin.ga.operators.comparator import DominanceComparator
-from pynguin.ga.operators.comparator import PreferenceSortingComparator
 from pynguin.utils import randomness
 from pynguin.utils.orderedset import OrderedSet
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import pynguin.ga.computations as ff
 
 C = TypeVar("C", bound=chrom.Chromosome)
@@ -111,9 +110,6 @@ class RankBasedPreferenceSorting(RankingFunction, Generic[C]):
 
         if len(zero_front) < config.configuration.search_algorithm.population:
             ranked_solutions = len(zero_front)
-            comparator: DominanceComparator[C] = DominanceComparator(
-                goals=uncovered_goals
-            )
 
             remaining: list[C] = []
             remaining.extend(solutions)
@@ -121,17 +117,16 @@ class RankBasedPreferenceSorting(RankingFunction, Generic[C]):
                 if element in remaining:
                     remaining.remove(element)
 
-            while (
-                ranked_solutions < config.configuration.search_algorithm.population
-                and len(remaining) > 0
-            ):
-                new_front: list[C] = self._get_non_dominated_solutions(
-                    remaining, comparator, front_index
-                )
-                fronts.append(new_front)
+            fitness_values = _get_distinguishing_fitness_values(
+                remaining, uncovered_goals
+            )
+            for front_indices in _fast_non_dominated_sort(fitness_values):
+                if ranked_solutions >= config.configuration.search_algorithm.population:
+                    break
+                new_front = [remaining[index] for index in front_indices]
                 for element in new_front:
-                    if element in remaining:
-                        remaining.remove(element)
+                    element.rank = front_index
+                fronts.append(new_front)
                 ranked_solutions += len(new_front)
                 front_index += 1
 
@@ -151,46 +146,139 @@ class RankBasedPreferenceSorting(RankingFunction, Generic[C]):
     def _get_zero_front(
         solutions: list[C], uncovered_goals: OrderedSet[ff.FitnessFunction]
     ) -> list[C]:
+        # Equivalent to picking the best solution for every goal with a
+        # PreferenceSortingComparator, but on fitness values fetched only once.
+        fitness_values = [
+            solution.get_fitness_values(uncovered_goals) for solution in solutions
+        ]
+        lengths = [solution.length() for solution in solutions]
         zero_front: OrderedSet[C] = OrderedSet()
-        for goal in uncovered_goals:
-            comparator: PreferenceSortingComparator[C] = PreferenceSortingComparator(
-                goal
-            )
-            best: C | None = None
-            for solution in solutions:
-                flag = comparator.compare(solution, best)
+        for goal_index in range(len(uncovered_goals)):
+            best: int | None = None
+            for index, values in enumerate(fitness_values):
+                if best is None:
+                    flag = -1
+                else:
+                    value = values[goal_index]
+                    best_value = fitness_values[best][goal_index]
+                    if value != best_value:
+                        flag = -1 if value < best_value else 1
+                    elif lengths[index] != lengths[best]:
+                        flag = -1 if lengths[index] < lengths[best] else 1
+                    else:
+                        flag = 0
                 if flag < 0 or (flag == 0 and randomness.next_bool()):
-                    best = solution
+                    best = index
             assert best is not None
 
-            best.rank = 0
-            zero_front.add(best)
+            solutions[best].rank = 0
+            zero_front.add(solutions[best])
         return list(zero_front)
 
-    @staticmethod
-    def _get_non_dominated_solutions(
-        solutions: list[C], comparator: DominanceComparator[C], front_index: int
-    ) -> list[C]:
-        front: list[C] = []
-        for solution in solutions:
-            is_dominated = False
-            dominated_solutions: list[C] = []
-            for best in front:
-                flag = comparator.compare(solution, best)
-                if flag < 0:
-                    dominated_solutions.append(best)
-                if flag > 0:
-                    is_dominated = True
-                    break
-            if is_dominated:
-                continue
 
-            solution.rank = front_index
-            front.append(solution)
-            for dominated_solution in dominated_solutions:
-                if dominated_solution in front:
-                    front.remove(dominated_solution)
-        return front
+def _get_distinguishing_fitness_values(
+    solutions: list[C], goals: OrderedSet[ff.FitnessFunction]
+) -> list[list[float]]:
+    """Fetches the fitness values of the solutions for the goals.
+
+    Goals for which all solutions have the same fitness cannot decide whether one
+    solution dominates another, thus their values are left out.
+
+    Args:
+        solutions: The solutions
+        goals: The goals
+
+    Returns:
+        The fitness values of every solution for the goals that distinguish them
+    """
+    fitness_values = [solution.get_fitness_values(goals) for solution in solutions]
+    if not fitness_values:
+        return fitness_values
+    first = fitness_values[0]
+    distinguishing = [
+        goal_index
+        for goal_index, value in enumerate(first)
+        if any(values[goal_index] != value for values in fitness_values)
+    ]
+    if len(distinguishing) == len(first):
+        return fitness_values
+    return [[values[index] for index in distinguishing] for values in fitness_values]
+
+
+def _compare_dominance(values_1: list[float], values_2: list[float]) -> int:
+    """Compares two vectors of fitness values regarding their dominance.
+
+    Same as the DominanceComparator, but on already fetched fitness values.
+
+    Args:
+        values_1: The first fitness values
+        values_2: The second fitness values
+
+    Returns:
+        -1 if values_1 dominates values_2; 1 if values_1 is dominated by values_2;
+        0 otherwise
+    """
+    dominate_1 = False
+    dominate_2 = False
+    for value_1, value_2 in zip(values_1, values_2, strict=True):
+        if value_1 < value_2:
+            if dominate_2:
+                return 0
+            dominate_1 = True
+        elif value_1 > value_2:
+            if dominate_1:
+                return 0
+            dominate_2 = True
+    if dominate_1 == dominate_2:
+        return 0
+    return -1 if dominate_1 else 1
+
+
+def _fast_non_dominated_sort(
+    fitness_values: list[list[float]],
+) -> Iterator[list[int]]:
+    """Sorts solutions into fronts of non-dominated solutions.
+
+    Implements the fast non-dominated sorting of NSGA-II from K. Deb, A. Pratap,
+    S. Agarwal, and T. Meyarivan, “A Fast and Elitist Multiobjective Genetic
+    Algorithm: NSGA-II”, IEEE Transactions on Evolutionary Computation, vol. 6,
+    no. 2, 2002, pp. 182-197.  Every pair of solutions is compared only once; the
+    fronts are then peeled off by counting how many solutions dominate a solution.
+
+    Args:
+        fitness_values: The fitness values of every solution
+
+    Yields:
+        The fronts, as lists of indices of solutions in ascending order
+    """
+    number_of_solutions = len(fitness_values)
+    domination_counts = [0] * number_of_solutions
+    dominated: list[list[int]] = [[] for _ in range(number_of_solutions)]
+    for index_1, values_1 in enumerate(fitness_values):
+        for index_2 in range(index_1 + 1, number_of_solutions):
+            flag = _compare_dominance(values_1, fitness_values[index_2])
+            if flag < 0:
+                dominated[index_1].append(index_2)
+                domination_counts[index_2] += 1
+            elif flag > 0:
+                dominated[index_2].append(index_1)
+                domination_counts[index_1] += 1
+
+    front = [
+        index
+        for index, domination_count in enumerate(domination_counts)
+        if domination_count == 0
+    ]
+    while front:
+        yield front
+        next_front: list[int] = []
+        for index in front:
+            for dominated_index in dominated[index]:
+                domination_counts[dominated_index] -= 1
+                if domination_counts[dominated_index] == 0:
+                    next_front.append(dominated_index)
+        next_front.sort()
+        front = next_front
 
 
 def fast_epsilon_dominance_assignment(
@@ -210,25 +298,18 @@ def fast_epsilon_dominance_assignment(
     for test in front:
         test.distance = 0
 
-    for goal in goals:
-        minimum = sys.float_info.max
-        min_set: list[C] = []
-        maximum = 0.0
-        for test in front:
-            value = test.get_fitness_for(goal)
-            if value < minimum:
-                minimum = value
-                min_set.clear()
-                min_set.append(test)
-            elif value == minimum:
-                min_set.append(test)
-
-            if value > maximum:
-                maximum = value
-
+    fitness_values = [test.get_fitness_values(goals) for test in front]
+    for goal_values in zip(*fitness_values, strict=True):
+        minimum = min(goal_values)
+        maximum = max(goal_values)
         if maximum == minimum:
             continue
 
+        min_set = [
+            test
+            for test, value in zip(front, goal_values, strict=True)
+            if value == minimum
+        ]
         for test in min_set:
             numerator = len(front) - len(min_set)
             denominator = len(front)
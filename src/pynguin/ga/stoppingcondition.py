@@ -90,6 +90,14 @@ class StoppingCondition(so.SearchObserver, ExecutionObserver, metaclass=ABCMeta)
         """
         return self._observes_execution
 
+    @property
+    def observes_statements(self) -> bool:  # noqa: D102
+        return False
+
+    @property
+    def supports_parallel_execution(self) -> bool:  # noqa: D102
+        return True
+
     def before_test_case_execution(self, test_case: tc.TestCase):
         """Not used.
 
@@ -391,7 +399,10 @@ class MaxTestExecutionsStoppingCondition(StoppingCondition):
     def before_search_start(self, start_time_ns: int) -> None:  # noqa: D102
         self._num_executed_tests = 0
 
-    def before_test_case_execution(self, test_case: tc.TestCase):  # noqa: D102
+    def after_test_case_execution_outside_thread(  # noqa: D102
+        self, test_case: tc.TestCase, result: ExecutionResult
+    ):
+        # Count outside the executing thread, which might run in another process.
         self._num_executed_tests += 1
 
     def __str__(self):
@@ -430,6 +441,15 @@ class MaxStatementExecutionsStoppingCondition(StoppingCondition):
     def before_search_start(self, start_time_ns: int) -> None:  # noqa: D102
         self._num_executed_statements = 0
 
+    @property
+    def observes_statements(self) -> bool:  # noqa: D102
+        return True
+
+    @property
+    def supports_parallel_execution(self) -> bool:  # noqa: D102
+        # The statements are counted in the executing process.
+        return False
+
     def before_statement_execution(  # noqa: D102
         self, statement: stmt.Statement, node: ast.stmt, exec_ctx: ExecutionContext
     ):
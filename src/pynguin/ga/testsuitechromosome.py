@@ -12,6 +12,7 @@ from typing import Any
 
 import pynguin.configuration as config
 import pynguin.ga.chromosome as chrom
+import pynguin.testcase.execution as ex
 
 from pynguin.utils import randomness
 
@@ -46,11 +47,13 @@ class TestSuiteChromosome(chrom.Chromosome):
                 cf.ChromosomeFactory[tcc.TestCaseChromosome]
             ) = test_case_chromosome_factory
             self._test_case_chromosomes: list[tcc.TestCaseChromosome] = []
+            self._merged_execution_trace = ex.MergedExecutionTrace()
         else:
             self._test_case_chromosomes = [
                 chromosome.clone() for chromosome in orig._test_case_chromosomes
             ]
             self._test_case_chromosome_factory = orig._test_case_chromosome_factory
+            self._merged_execution_trace = orig._merged_execution_trace.clone()
 
     def add_test_case_chromosome(self, test: tcc.TestCaseChromosome) -> None:
         """Adds a test case chromosome to the test suite.
@@ -111,6 +114,15 @@ class TestSuiteChromosome(chrom.Chromosome):
         """
         return self._test_case_chromosomes
 
+    @property
+    def merged_execution_trace(self) -> ex.MergedExecutionTrace:
+        """Provides the incrementally merged execution trace of the test cases.
+
+        Returns:
+            The merged execution trace of this suite
+        """
+        return self._merged_execution_trace
+
     def set_test_case_chromosome(
         self, index: int, test: tcc.TestCaseChromosome
     ) -> None:
@@ -153,6 +153,9 @@ def _setup_import_hook(
         tracer,
         coverage_metrics=coverage_metrics,
         dynamic_constant_provider=dynamic_constant_provider,
+        instrumentation_cache_dir=(
+            config.configuration.execution.instrumentation_cache_dir or None
+        ),
     )
     return tracer
 
@@ -261,10 +264,14 @@ def _setup_and_check() -> (
 
     # Make alias to make the following lines shorter...
     stop = config.configuration.stopping
+    execution = config.configuration.execution
     executor = TestCaseExecutor(
         tracer,
         maximum_test_execution_timeout=stop.maximum_test_execution_timeout,
         test_execution_time_per_statement=stop.test_execution_time_per_statement,
+        compiled_code_cache_size=execution.compiled_code_cache_size,
+        whole_test_case_execution=execution.whole_test_case_execution,
+        number_of_workers=execution.number_of_workers,
     )
     _track_sut_data(tracer, test_cluster)
     _setup_random_number_generator()
@@ -558,6 +565,7 @@ def _run() -> ReturnCode:
             Path(config.configuration.statistics_output.report_dir) / "cov_report.xml",
             datetime.datetime.now(),
         )
+    _track_execution_statistics(executor)
     _collect_miscellaneous_statistics(test_cluster)
     if not stat.write_statistics():
         _LOGGER.error("Failed to write statistics data")
@@ -593,14 +601,23 @@ def _minimize_assertions(generation_result: tsc.TestSuiteChromosome):
 
 def _generate_assertions(executor, generation_result):
     ass_gen = config.configuration.test_case_output.assertion_generation
+    output_config = config.configuration.test_case_output
+    filtering_executions = output_config.assertion_filtering_executions
+    stable_filtering_executions = output_config.assertion_filtering_stable_executions
     if ass_gen != config.AssertionGenerator.NONE:
         _LOGGER.info("Start generating assertions")
         if ass_gen == config.AssertionGenerator.MUTATION_ANALYSIS:
             generator: cv.ChromosomeVisitor = ag.MutationAnalysisAssertionGenerator(
-                executor
+                executor,
+                filtering_executions=filtering_executions,
+                stable_filtering_executions=stable_filtering_executions,
             )
         else:
-            generator = ag.AssertionGenerator(executor)
+            generator = ag.AssertionGenerator(
+                executor,
+                filtering_executions=filtering_executions,
+                stable_filtering_executions=stable_filtering_executions,
+            )
         generation_result.accept(generator)
 
 
@@ -659,6 +676,16 @@ def _instantiate_test_generation_strategy(
     return factory.get_search_algorithm()
 
 
+def _track_execution_statistics(executor: TestCaseExecutor) -> None:
+    compiled_code_cache = executor.compiled_code_cache
+    stat.track_output_variable(
+        RuntimeVariable.CompiledCodeCacheHits, compiled_code_cache.hits
+    )
+    stat.track_output_variable(
+        RuntimeVariable.CompiledCodeCacheMisses, compiled_code_cache.misses
+    )
+
+
 def _collect_miscellaneous_statistics(test_cluster: ModuleTestCluster) -> None:
     test_cluster.log_cluster_statistics()
     stat.track_output_variable(
@@ -8,11 +8,13 @@
 from __future__ import annotations
 
 import builtins
+import dis
 import enum
 import json
 import logging
 
 from dataclasses import dataclass
+from dataclasses import field
 from types import CodeType
 from typing import TYPE_CHECKING
 
@@ -78,6 +80,76 @@ class CodeObjectMetaData:
     # CDG of this Code Object
     cdg: ControlDependenceGraph
 
+    # Lengths of the shortest CDG paths to each predicate of this code object from
+    # the predicates that can reach it, by predicate id.  Computed once after the
+    # code object has been instrumented.
+    predicate_distances: dict[int, dict[int, int]] = field(default_factory=dict)
+
+    # Lookup tables for the slicer, built on first use
+    _original_cfg_nodes: dict[int, ProgramGraphNode] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cdg_nodes: dict[int, ProgramGraphNode] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _disassembly: dict[tuple[int, int], dis.Instruction] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def get_original_cfg_node(self, index: int) -> ProgramGraphNode | None:
+        """Provides the node with the given index of the original CFG.
+
+        Args:
+            index: The index of the node
+
+        Returns:
+            The node of the original CFG, None if there is no such node
+        """
+        if self._original_cfg_nodes is None:
+            self._original_cfg_nodes = {
+                node.index: node for node in self.original_cfg.nodes
+            }
+        return self._original_cfg_nodes.get(index)
+
+    def get_cdg_node(self, index: int) -> ProgramGraphNode | None:
+        """Provides the node with the given index of the CDG.
+
+        Args:
+            index: The index of the node
+
+        Returns:
+            The node of the CDG, None if there is no such node
+        """
+        if self._cdg_nodes is None:
+            self._cdg_nodes = {node.index: node for node in self.cdg.nodes}
+        return self._cdg_nodes.get(index)
+
+    def get_disassembled_instruction(
+        self, opcode: int, offset: int
+    ) -> dis.Instruction | None:
+        """Provides the instruction of the disassembled code object.
+
+        EXTENDED_ARG instructions are not counted for the offsets of the
+        instrumentation, thus the offset is the one without them.
+
+        Args:
+            opcode: The opcode of the instruction
+            offset: The offset of the instruction without EXTENDED_ARG instructions
+
+        Returns:
+            The disassembled instruction, None if there is no such instruction
+        """
+        if self._disassembly is None:
+            self._disassembly = {}
+            offset_offset = 0
+            for dis_instr in dis.get_instructions(self.code_object):
+                if dis_instr.opcode == op.EXTENDED_ARG:
+                    offset_offset += 2
+                self._disassembly.setdefault(
+                    (dis_instr.opcode, dis_instr.offset - offset_offset), dis_instr
+                )
+        return self._disassembly.get((opcode, offset))
+
 
 @dataclass
 class PredicateMetaData:
@@ -257,15 +329,14 @@ class InstrumentationTransformer:
         cfg = CFG.from_bytecode(Bytecode.from_code(code))
         original_cfg = CFG.from_bytecode(Bytecode.from_code(code))
         cdg = ControlDependenceGraph.compute(cfg)
-        code_object_id = self._tracer.register_code_object(
-            CodeObjectMetaData(
-                code_object=code,
-                parent_code_object_id=parent_code_object_id,
-                cfg=cfg,
-                original_cfg=original_cfg,
-                cdg=cdg,
-            )
+        code_object_meta_data = CodeObjectMetaData(
+            code_object=code,
+            parent_code_object_id=parent_code_object_id,
+            cfg=cfg,
+            original_cfg=original_cfg,
+            cdg=cdg,
         )
+        code_object_id = self._tracer.register_code_object(code_object_meta_data)
         # Overwrite/Set docstring to carry tagging information, i.e.,
         # the code object id. Convert to JSON string because I'm not sure where this
         # value might be used in CPython.
@@ -276,6 +347,8 @@ class InstrumentationTransformer:
         for adapter in self._instrumentation_adapters:
             adapter.visit_entry_node(real_entry_node.basic_block, code_object_id)
         self._instrument_cfg(cfg, code_object_id)
+        # The predicates of the nodes are only known after the instrumentation.
+        code_object_meta_data.predicate_distances = cdg.compute_predicate_distances()
         return self._instrument_inner_code_objects(
             cfg.bytecode_cfg().to_code(), code_object_id
         )
@@ -11,20 +11,31 @@ Inspired by https://github.com/agronholm/typeguard/blob/master/typeguard/importh
 from __future__ import annotations
 
 import contextlib
+import hashlib
+import io
 import logging
+import marshal
+import pickle
 import sys
+import tempfile
 
 from importlib.abc import FileLoader
 from importlib.abc import MetaPathFinder
 from importlib.machinery import ModuleSpec
 from importlib.machinery import SourceFileLoader
 from inspect import isclass
+from pathlib import Path
 from types import CodeType
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import cast
 
+from bytecode.instr import UNSET
+from bytecode.instr import InstrLocation
+
 import pynguin.configuration as config
 
+from pynguin.__version__ import __version__
 from pynguin.analyses.constants import ConstantPool
 from pynguin.analyses.constants import DynamicConstantProvider
 from pynguin.analyses.constants import EmptyConstantProvider
@@ -36,8 +47,187 @@ from pynguin.instrumentation.instrumentation import LineCoverageInstrumentation
 
 
 if TYPE_CHECKING:
+    import os
+
     from pynguin.instrumentation.instrumentation import InstrumentationAdapter
     from pynguin.testcase.execution import ExecutionTracer
+    from pynguin.testcase.execution import SubjectProperties
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# The version of the layout of the cached instrumentation.  It has to be increased
+# whenever the pickled types change, e.g., when a field is added to
+# SubjectProperties or CodeObjectMetaData, as older entries cannot be loaded then.
+_CACHE_FORMAT_VERSION = 2
+
+
+def _load_code(code: bytes, consts: tuple[Any, ...]) -> CodeType:
+    return marshal.loads(code).replace(co_consts=consts)  # noqa: S302
+
+
+class _InstrumentationPickler(pickle.Pickler):
+    """Pickles instrumented code and the meta data of its instrumentation.
+
+    Instrumented code contains references to the tracer and the dynamic constant
+    provider, which are stored as persistent ids and replaced by the current ones
+    when unpickling.
+    """
+
+    def __init__(self, file, persistent_objects: dict[str, object]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._persistent_ids = {id(obj): pid for pid, obj in persistent_objects.items()}
+
+    def persistent_id(self, obj: Any) -> str | None:
+        return self._persistent_ids.get(id(obj))
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, CodeType):
+            # Code objects can only be marshalled without the references to the
+            # tracer in their constants.
+            return _load_code, (marshal.dumps(obj.replace(co_consts=())), obj.co_consts)
+        if isinstance(obj, InstrLocation):
+            # Frozen and slotted, thus its state cannot be restored by pickle.
+            return InstrLocation, (
+                obj.lineno,
+                obj.end_lineno,
+                obj.col_offset,
+                obj.end_col_offset,
+            )
+        if obj is UNSET:
+            return type(obj), ()
+        return NotImplemented
+
+
+class _InstrumentationUnpickler(pickle.Unpickler):
+    """Unpickles what was pickled by an _InstrumentationPickler."""
+
+    def __init__(self, file, persistent_objects: dict[str, object]):
+        super().__init__(file)
+        self._persistent_objects = persistent_objects
+
+    def persistent_load(self, pid: Any) -> object:
+        return self._persistent_objects[pid]
+
+
+class InstrumentationCache:
+    """A persistent cache of instrumented modules.
+
+    Instrumenting a module requires to build control-flow and control-dependence
+    graphs for each of its code objects, which is costly when tests are generated
+    repeatedly for an unchanged module.  The cache stores the instrumented code of a
+    module together with the subject properties that the instrumentation registered
+    in the tracer.  Entries are addressed by the hash of the module's source, its
+    path, the instrumentation, the layout of the cache, and the Pynguin and Python
+    versions.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | os.PathLike,
+        tracer: ExecutionTracer,
+        coverage_metrics: set[config.CoverageMetric],
+        dynamic_constant_provider: DynamicConstantProvider | None = None,
+    ) -> None:
+        """Create a new cache.
+
+        Args:
+            cache_dir: The directory where the instrumented modules are stored
+            tracer: The tracer the instrumentation reports to
+            coverage_metrics: The coverage metrics that are instrumented
+            dynamic_constant_provider: The provider used for dynamic constant
+                seeding, if any
+        """
+        self._cache_dir = Path(cache_dir)
+        self._tracer = tracer
+        self._coverage_metrics = coverage_metrics
+        self._persistent_objects: dict[str, object] = {"tracer": tracer}
+        if dynamic_constant_provider is not None:
+            self._persistent_objects[
+                "dynamic_constant_provider"
+            ] = dynamic_constant_provider
+
+    def _key(self, path: str, source: bytes) -> str:
+        digest = hashlib.sha256()
+        for part in (
+            __version__,
+            str(_CACHE_FORMAT_VERSION),
+            sys.implementation.cache_tag,
+            path,
+            *sorted(metric.name for metric in self._coverage_metrics),
+            *sorted(self._persistent_objects),
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(source)
+        return digest.hexdigest()
+
+    def _entry(self, path: str, source: bytes) -> Path:
+        return self._cache_dir / f"{self._key(path, source)}.pickle"
+
+    def load(self, path: str, source: bytes) -> CodeType | None:
+        """Load the instrumented code of a module.
+
+        On a hit, the subject properties of the tracer are replaced by the ones
+        that were registered when the module was instrumented.
+
+        Args:
+            path: The path of the module
+            source: The source of the module
+
+        Returns:
+            The instrumented code of the module, or None if it is not cached
+        """
+        try:
+            with self._entry(path, source).open("rb") as file:
+                code, subject_properties = _InstrumentationUnpickler(
+                    file, self._persistent_objects
+                ).load()
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: BLE001
+            _LOGGER.warning("Failed to load cached instrumentation of %s", path)
+            return None
+        self._tracer.subject_properties = subject_properties
+        _LOGGER.debug("Loaded cached instrumentation of %s", path)
+        return code
+
+    def store(self, path: str, source: bytes, code: CodeType) -> None:
+        """Store the instrumented code of a module.
+
+        The tracer must only contain the subject properties of this module.
+
+        Args:
+            path: The path of the module
+            source: The source of the module
+            code: The instrumented code of the module
+        """
+        subject_properties: SubjectProperties = self._tracer.get_subject_properties()
+        buffer = io.BytesIO()
+        try:
+            _InstrumentationPickler(buffer, self._persistent_objects).dump(
+                (code, subject_properties)
+            )
+        except Exception:  # noqa: BLE001
+            _LOGGER.warning("Failed to cache instrumentation of %s", path)
+            return
+        temporary_file: Path | None = None
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, such that concurrent runs never read
+            # a partially written entry.
+            with tempfile.NamedTemporaryFile(
+                dir=self._cache_dir, suffix=".tmp", delete=False
+            ) as file:
+                temporary_file = Path(file.name)
+                file.write(buffer.getvalue())
+            temporary_file.replace(self._entry(path, source))
+        except OSError:
+            # The cache is only an optimisation, e.g., a read-only or full cache
+            # directory must not prevent importing the module.
+            _LOGGER.warning("Failed to cache instrumentation of %s", path)
+            if temporary_file is not None:
+                temporary_file.unlink(missing_ok=True)
 
 
 class InstrumentationLoader(SourceFileLoader):
@@ -49,10 +239,12 @@ class InstrumentationLoader(SourceFileLoader):
         path,
         tracer: ExecutionTracer,
         transformer: InstrumentationTransformer,
+        cache: InstrumentationCache | None = None,
     ):
         super().__init__(fullname, path)
         self._tracer = tracer
         self._transformer = transformer
+        self._cache = cache
 
     def exec_module(self, module):  # noqa: D102
         self._tracer.reset()
@@ -70,9 +262,23 @@ class InstrumentationLoader(SourceFileLoader):
         Returns:
             The modules code blocks
         """
+        # The cached subject properties replace the ones of the tracer, thus the
+        # cache can only be used if nothing else was registered.
+        cache = (
+            self._cache
+            if not self._tracer.get_subject_properties().existing_code_objects
+            else None
+        )
+        if cache is not None:
+            source = self.get_data(self.path)
+            if (cached := cache.load(self.path, source)) is not None:
+                return cached
         to_instrument = cast(CodeType, super().get_code(fullname))
         assert to_instrument is not None, "Failed to get code object of module."
-        return self._transformer.instrument_module(to_instrument)
+        instrumented = self._transformer.instrument_module(to_instrument)
+        if cache is not None:
+            cache.store(self.path, source, instrumented)
+        return instrumented
 
 
 def build_transformer(
@@ -122,6 +328,7 @@ class InstrumentationFinder(MetaPathFinder):
         tracer: ExecutionTracer,
         coverage_metrics: set[config.CoverageMetric],
         dynamic_constant_provider: DynamicConstantProvider | None = None,
+        instrumentation_cache_dir: str | None = None,
     ) -> None:
         """Wraps the given pathfinder.
 
@@ -131,12 +338,15 @@ class InstrumentationFinder(MetaPathFinder):
             tracer: the execution tracer
             coverage_metrics: the coverage metrics to be used for instrumentation.
             dynamic_constant_provider: Used for dynamic constant seeding
+            instrumentation_cache_dir: the directory where instrumented modules are
+                cached, if any.
         """
         self._module_to_instrument = module_to_instrument
         self._original_pathfinder = original_pathfinder
         self._tracer = tracer
         self._coverage_metrics = coverage_metrics
         self._dynamic_constant_provider = dynamic_constant_provider
+        self._instrumentation_cache_dir = instrumentation_cache_dir
 
     def update_instrumentation_metrics(
         self,
@@ -157,6 +367,16 @@ class InstrumentationFinder(MetaPathFinder):
         self._coverage_metrics = coverage_metrics
         self._dynamic_constant_provider = dynamic_constant_provider
 
+    def _build_cache(self) -> InstrumentationCache | None:
+        if self._instrumentation_cache_dir is None:
+            return None
+        return InstrumentationCache(
+            self._instrumentation_cache_dir,
+            self._tracer,
+            self._coverage_metrics,
+            self._dynamic_constant_provider,
+        )
+
     def _should_instrument(self, module_name: str):
         return module_name == self._module_to_instrument
 
@@ -189,6 +409,7 @@ class InstrumentationFinder(MetaPathFinder):
                             self._coverage_metrics,
                             self._dynamic_constant_provider,
                         ),
+                        self._build_cache(),
                     )
                     return spec
                 self._logger.error(
@@ -222,6 +443,7 @@ def install_import_hook(
     tracer: ExecutionTracer,
     coverage_metrics: set[config.CoverageMetric] | None = None,
     dynamic_constant_provider: DynamicConstantProvider | None = None,
+    instrumentation_cache_dir: str | None = None,
 ) -> ImportHookContextManager:
     """Install the InstrumentationFinder in the meta path.
 
@@ -231,6 +453,8 @@ def install_import_hook(
         coverage_metrics: the coverage metrics to be used for instrumentation, falls
             back to the configured metrics in the configuration, if not specified.
         dynamic_constant_provider: Used for dynamic constant seeding
+        instrumentation_cache_dir: The directory where instrumented modules are
+            cached, no caching is done if not specified.
 
     Returns:
         a context manager which can be used to uninstall the hook.
@@ -269,6 +493,7 @@ def install_import_hook(
         tracer,
         coverage_metrics=coverage_metrics,
         dynamic_constant_provider=dynamic_constant_provider,
+        instrumentation_cache_dir=instrumentation_cache_dir,
     )
     sys.meta_path.insert(0, hook)
     return ImportHookContextManager(hook)
@@ -10,6 +10,7 @@
 """Provides classes and logic for dynamic slicing."""
 from __future__ import annotations
 
+import copy
 import logging
 import operator
 import time
@@ -27,16 +28,16 @@ from pynguin.slicer.executionflowbuilder import ExecutionFlowBuilder
 from pynguin.slicer.executionflowbuilder import UniqueInstruction
 from pynguin.slicer.stack.stackeffect import StackEffect
 from pynguin.slicer.stack.stacksimulation import TraceStack
+from pynguin.testcase.execution import LineMetaData
 from pynguin.utils.exceptions import InstructionNotFoundException
 from pynguin.utils.exceptions import SlicingTimeoutException
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from bytecode import Instr
 
-    from pynguin.analyses.controlflow import CFG
-    from pynguin.analyses.controlflow import ControlDependenceGraph
-    from pynguin.analyses.controlflow import ProgramGraphNode
     from pynguin.instrumentation.instrumentation import CodeObjectMetaData
     from pynguin.slicer.executedinstruction import ExecutedInstruction
     from pynguin.slicer.executionflowbuilder import LastInstrState
@@ -144,7 +145,7 @@ class DynamicSlicer:
         """
         self._known_code_objects = known_code_objects
 
-    def slice(  # noqa: A003, C901
+    def slice(  # noqa: A003
         self,
         trace: ExecutionTrace,
         slicing_criterion: SlicingCriterion,
@@ -163,110 +164,259 @@ class DynamicSlicer:
             SlicingTimeoutException: when the slicing takes longer than the
                 configured budget
         """
-        slc = self._setup_slicing_configuration(slicing_criterion, trace)
+        return self.slice_criteria(trace, [slicing_criterion])[0]
 
-        while True:
-            criterion_in_slice = imp_data_dep = False
-            include_use = True
+    def slice_criteria(  # noqa: C901
+        self,
+        trace: ExecutionTrace,
+        slicing_criteria: Sequence[SlicingCriterion],
+    ) -> list[list[UniqueInstruction]]:
+        """Computes the dynamic slices of several criteria in one backward pass.
+
+        The pass starts at the criterion that is last in the trace.  The execution
+        flow is reconstructed only once; every other criterion is added to the pass
+        when the pass reaches it and keeps its own slicing context and stack.  A
+        criterion the pass does not reach exactly is sliced on its own.
+
+        Args:
+            trace: Execution trace object containing slicing information
+                with collected instructions.
+            slicing_criteria: The slicing criteria
+
+        Returns:
+            The slices of the slicing criteria, in the order of the criteria.
+
+        Raises:
+            SlicingTimeoutException: when the slicing takes longer than the
+                configured budget
+        """
+        if not slicing_criteria:
+            return []
+
+        slices: list[list[UniqueInstruction]] = [[] for _ in slicing_criteria]
+        # Criteria later in the trace are reached earlier by the backward pass
+        pending = sorted(
+            range(len(slicing_criteria)),
+            key=lambda index: slicing_criteria[index].trace_position,
+        )
+        missed: list[int] = []
+        execution_flow_builder = ExecutionFlowBuilder(trace, self._known_code_objects)
+
+        first = pending.pop()
+        pass_state = self._setup_slicing_configuration(
+            slicing_criteria[first], execution_flow_builder
+        )
+        active = [(first, pass_state)]
+        self._add_reached_criteria(
+            slicing_criteria,
+            pending,
+            active,
+            missed,
+            slicing_criteria[first].unique_instr,
+            pass_state,
+        )
+        # The instructions are shared by the criteria, thus their stack simulation
+        # must not mark them as part of a slice.
+        shared = len(slicing_criteria) > 1
 
+        while True:
             # Get last instruction
-            last_state = slc.update_state()
-
-            if last_state.exception:
-                # Stack can not be reliably simulated when an exception occurred
-                slc.stack_simulation = False
-            if not last_state.last_instr:
-                # Reached end of executed instructions -> return slice (and keep order)
-                instructions = set()
-                slice_instructions = []
-                for i in reversed(slc.context.instr_in_slice):
-                    if i not in instructions:
-                        instructions.add(i)
-                        slice_instructions.append(i)
-                return slice_instructions
+            last_state = pass_state.update_state()
+
+            if not last_state.last_instr:  # type: ignore[truthy-bool]
+                # Reached end of executed instructions -> return slices
+                break
 
             last_unique_instr = self.create_unique_instruction(
-                slc.file,
+                pass_state.file,
                 last_state.last_instr,
-                slc.code_object_id,
-                slc.basic_block_id,
-                slc.offset,
+                pass_state.code_object_id,
+                pass_state.basic_block_id,
+                pass_state.offset,
             )
-            # Adjust trace position
-            last_traced_instr = None
+            last_traced_pos = None
             if last_state.last_instr.opcode in op.TRACED_INSTRUCTIONS:
-                last_traced_instr = trace.executed_instructions[slc.trace_position]
-                slc.trace_position -= 1
+                last_traced_pos = pass_state.trace_position
+
+            for _, slc in active:
+                if slc is not pass_state:
+                    slc.file = last_state.file
+                    slc.offset = last_state.offset
+                    slc.code_object_id = last_state.code_object_id
+                    slc.basic_block_id = last_state.basic_block_id
+                self._slice_instruction(
+                    slc, last_state, last_unique_instr, last_traced_pos, shared
+                )
 
-            # Stack housekeeping
-            prev_import_back_call = self._stack_housekeeping(
-                last_state, last_unique_instr, slc
-            )
+            if last_traced_pos is not None and pending:
+                self._add_reached_criteria(
+                    slicing_criteria,
+                    pending,
+                    active,
+                    missed,
+                    last_unique_instr,
+                    pass_state,
+                )
 
-            # Control dependency
-            control_dependency = self.check_control_dependency(
-                slc.context, last_unique_instr, slc.code_object_id
-            )
+            if time.time() > pass_state.timeout:
+                raise SlicingTimeoutException
 
-            # Data dependencies
-            # Explicit data dependency
-            (
-                exp_data_dep,
-                slc.new_attribute_object_uses,
-            ) = self.check_explicit_data_dependency(
-                slc.context, last_unique_instr, last_traced_instr
-            )
+        for index, slc in active:
+            slices[index] = self._finish_slice(slc.context)
+        for index in missed + pending:
+            slices[index] = self.slice_criteria(trace, [slicing_criteria[index]])[0]
+        return slices
 
-            # Dependency via method call
-            if last_state.call and slc.code_object_dependent:
-                imp_data_dep = True
-                slc.code_object_dependent = False
-
-                if last_state.import_start:
-                    # We need to include the import statement after determining
-                    # if one of the instructions executed by the import is included
-                    # (because IMPORT_NAME is traced afterwards).
-                    slc.context.instr_in_slice.append(prev_import_back_call)
-                    num_import_pops = StackEffect.stack_effect(
-                        prev_import_back_call.opcode, arg=None, jump=False
-                    )[0]
-                    slc.trace_stack.update_pop_operations(
-                        num_import_pops, prev_import_back_call, True
+    def _add_reached_criteria(
+        self,
+        slicing_criteria: Sequence[SlicingCriterion],
+        pending: list[int],
+        active: list[tuple[int, SlicingState]],
+        missed: list[int],
+        reached_instr: UniqueInstruction,
+        pass_state: SlicingState,
+    ) -> None:
+        while (
+            pending
+            and slicing_criteria[pending[-1]].trace_position
+            >= pass_state.trace_position
+        ):
+            index = pending.pop()
+            criterion = slicing_criteria[index]
+            if (
+                criterion.trace_position == pass_state.trace_position
+                and criterion.unique_instr.file == reached_instr.file
+                and criterion.unique_instr.code_object_id
+                == reached_instr.code_object_id
+                and criterion.unique_instr.node_id == reached_instr.node_id
+                and criterion.unique_instr.offset == reached_instr.offset
+            ):
+                active.append(
+                    (
+                        index,
+                        self._setup_slicing_configuration(
+                            criterion,
+                            pass_state.execution_flow_builder,
+                            pass_state.timeout,
+                        ),
                     )
-            # Implicit data dependency (over stack)
-            if slc.stack_simulation:
-                stack_dep, include_use = slc.trace_stack.update_push_operations(
-                    slc.pushes, last_state.returned
                 )
-                if stack_dep:
-                    imp_data_dep = True
-            if last_state.returned:
-                slc.code_object_dependent = False
-
-            if control_dependency or exp_data_dep or imp_data_dep:
-                criterion_in_slice = True
-
-                if not last_state.call:
-                    slc.code_object_dependent = True
-
-            # Unconditional jumps
-            if last_state.jump and last_state.last_instr.is_uncond_jump():
-                criterion_in_slice = True
-
-            # Housekeeping for execution trace, stack
-            self._trace_housekeeping(
-                criterion_in_slice,
-                include_use,
-                last_traced_instr,
-                last_unique_instr,
-                slc,
-            )
+            else:
+                missed.append(index)
+
+    @staticmethod
+    def _finish_slice(context: SlicingContext) -> list[UniqueInstruction]:
+        # Keep the order of the instructions, but only their first occurrence
+        instructions = set()
+        slice_instructions = []
+        for i in reversed(context.instr_in_slice):
+            if i not in instructions:
+                instructions.add(i)
+                slice_instructions.append(i)
+        return slice_instructions
+
+    def _slice_instruction(  # noqa: C901
+        self,
+        slc: SlicingState,
+        last_state: LastInstrState,
+        last_unique_instr: UniqueInstruction,
+        last_traced_pos: int | None,
+        shared: bool,
+    ) -> None:
+        criterion_in_slice = imp_data_dep = False
+        include_use = True
 
-            # next iteration
-            slc.curr_instr = last_state.last_instr
+        if last_state.exception:
+            # Stack can not be reliably simulated when an exception occurred
+            slc.stack_simulation = False
 
-            if time.time() > slc.timeout:
-                raise SlicingTimeoutException
+        # Adjust trace position.  The traced instruction is only materialised when
+        # its data dependencies have to be analysed.
+        executed_instructions = slc.execution_flow_builder.trace.executed_instructions
+        last_traced_instr: ExecutedInstruction | None = None
+        if last_traced_pos is not None:
+            slc.trace_position -= 1
+            if last_unique_instr.is_def():
+                last_traced_instr = executed_instructions[last_traced_pos]
+
+        # Stack housekeeping
+        prev_import_back_call = self._stack_housekeeping(
+            last_state, last_unique_instr, slc
+        )
+
+        # Control dependency
+        control_dependency = self.check_control_dependency(
+            slc.context, last_unique_instr, slc.code_object_id
+        )
+
+        # Data dependencies
+        # Explicit data dependency
+        (
+            exp_data_dep,
+            slc.new_attribute_object_uses,
+        ) = self.check_explicit_data_dependency(
+            slc.context, last_unique_instr, last_traced_instr
+        )
+
+        # Dependency via method call
+        if last_state.call and slc.code_object_dependent:
+            imp_data_dep = True
+            slc.code_object_dependent = False
+
+            if last_state.import_start:
+                # We need to include the import statement after determining
+                # if one of the instructions executed by the import is included
+                # (because IMPORT_NAME is traced afterwards).
+                slc.context.instr_in_slice.append(prev_import_back_call)
+                num_import_pops = StackEffect.stack_effect(
+                    prev_import_back_call.opcode, arg=None, jump=False
+                )[0]
+                slc.trace_stack.update_pop_operations(
+                    num_import_pops, prev_import_back_call, True
+                )
+        # Implicit data dependency (over stack)
+        if slc.stack_simulation:
+            stack_dep, include_use = slc.trace_stack.update_push_operations(
+                slc.pushes, last_state.returned
+            )
+            if stack_dep:
+                imp_data_dep = True
+        if last_state.returned:
+            slc.code_object_dependent = False
+
+        if control_dependency or exp_data_dep or imp_data_dep:
+            criterion_in_slice = True
+
+            if not last_state.call:
+                slc.code_object_dependent = True
+
+        # Unconditional jumps
+        if last_state.jump and last_state.last_instr.is_uncond_jump():
+            criterion_in_slice = True
+
+        if criterion_in_slice and shared:
+            last_unique_instr = copy.copy(last_unique_instr)
+
+        if (
+            last_traced_instr is None
+            and last_traced_pos is not None
+            and criterion_in_slice
+            and include_use
+            and last_unique_instr.is_use()
+        ):
+            last_traced_instr = executed_instructions[last_traced_pos]
+
+        # Housekeeping for execution trace, stack
+        self._trace_housekeeping(
+            criterion_in_slice,
+            include_use,
+            last_traced_instr,
+            last_unique_instr,
+            slc,
+        )
+
+        # next iteration
+        slc.curr_instr = last_state.last_instr
 
     def _stack_housekeeping(self, last_state, last_unique_instr, slc):
         prev_import_back_call = slc.trace_stack.get_import_frame()
@@ -333,8 +483,9 @@ class DynamicSlicer:
     def _setup_slicing_configuration(
         self,
         slicing_criterion: SlicingCriterion,
-        trace: ExecutionTrace,
-    ):
+        execution_flow_builder: ExecutionFlowBuilder,
+        timeout: float | None = None,
+    ) -> SlicingState:
         new_attribute_object_uses: set[str] = set()
         # Build slicing criterion
         last_ex_instruction = slicing_criterion.unique_instr
@@ -343,12 +494,12 @@ class DynamicSlicer:
         curr_instr = self._locate_unique_in_bytecode(
             last_ex_instruction, code_object_id, basic_block_id
         )
-        execution_flow_builder = ExecutionFlowBuilder(trace, self._known_code_objects)
         pops, pushes, trace_stack = self._init_stack(
             last_ex_instruction,
         )
         context = self._init_context(code_object_id, last_ex_instruction)
-        timeout = time.time() + config.configuration.stopping.maximum_slicing_time
+        if timeout is None:
+            timeout = time.time() + config.configuration.stopping.maximum_slicing_time
         return SlicingState(
             basic_block_id,
             code_object_id,
@@ -388,26 +539,23 @@ class DynamicSlicer:
         self, instr: UniqueInstruction, code_object_id: int, basic_block_id: int
     ) -> Instr:
         # Get relevant basic block
-        basic_block = None
-        bb_offset = -1
         code_object = self._known_code_objects.get(code_object_id)
         assert code_object, "Unknown code object id"
-        for node in code_object.original_cfg.nodes:
-            if node.index == basic_block_id:
-                basic_block = node.basic_block
-                bb_offset = node.offset
-
-        if (not basic_block) or (bb_offset < 0):
+        node = code_object.get_original_cfg_node(basic_block_id)
+        if node is None or not node.basic_block or node.offset < 0:
             raise InstructionNotFoundException
 
-        for instruction in basic_block:
+        basic_block = node.basic_block
+        index = ExecutionFlowBuilder.get_index_in_basic_block(
+            instr.offset, basic_block, node.offset  # type: ignore[arg-type]
+        )
+        if index is not None:
+            instruction = basic_block[index]
             if (
                 instr.opcode == instruction.opcode  # type: ignore[union-attr]
                 and instr.lineno == instruction.lineno  # type: ignore[union-attr]
-                and instr.offset == bb_offset
             ):
                 return instruction  # type: ignore[return-value]
-            bb_offset += 2
 
         raise InstructionNotFoundException
 
@@ -461,10 +609,11 @@ class DynamicSlicer:
             return False
 
         code_object: CodeObjectMetaData = self._known_code_objects[code_object_id]
-        cdg: ControlDependenceGraph = code_object.cdg
-        curr_node = self.get_node(unique_instr.node_id, cdg)
+        curr_node = code_object.get_cdg_node(unique_instr.node_id)
         assert curr_node, "Invalid node id"
-        successors = cdg.get_successors(curr_node)
+        successors = {
+            successor.index for successor in code_object.cdg.get_successors(curr_node)
+        }
 
         instr_ctrl_deps_copy = context.instr_ctrl_deps.copy()
 
@@ -472,8 +621,7 @@ class DynamicSlicer:
         # If so: include current instruction in the slice, remove all instructions
         # control dependent on current instruction
         for instr in context.instr_ctrl_deps:
-            instr_node = self.get_node(instr.node_id, cdg)
-            if instr_node in successors:
+            if instr.node_id in successors:
                 instr_ctrl_deps_copy.remove(instr)
                 control_dependency = True
         context.instr_ctrl_deps = instr_ctrl_deps_copy
@@ -494,34 +642,14 @@ class DynamicSlicer:
             code_object_id: the id of the code object containing the instruction
         """
         code_object: CodeObjectMetaData = self._known_code_objects[code_object_id]
-        cdg: ControlDependenceGraph = code_object.cdg
-        curr_node = self.get_node(unique_instr.node_id, cdg)
+        curr_node = code_object.get_cdg_node(unique_instr.node_id)
         assert curr_node, "Invalid node id"
-        predecessors = cdg.get_predecessors(curr_node)
+        predecessors = code_object.cdg.get_predecessors(curr_node)
 
         for predecessor in predecessors:
             if not predecessor.is_artificial:
                 context.instr_ctrl_deps.add(unique_instr)
 
-    @staticmethod
-    def get_node(
-        node_id: int, graph: ControlDependenceGraph | CFG
-    ) -> ProgramGraphNode | None:
-        """Iterate through all nodes of the graph and return the node with the given id.
-
-        Args:
-            node_id: the node id to find inside the given graph
-            graph: the graph to find the node inside of
-
-        Returns:
-            A ProgramGraphNode object with the given id
-            or None if the id is not in the nodes
-        """
-        for node in graph.nodes:
-            if node.index == node_id:
-                return node
-        return None
-
     def check_explicit_data_dependency(  # noqa: C901
         self,
         context: SlicingContext,
@@ -787,13 +915,17 @@ class DynamicSlicer:
         Raises:
             ValueError: If the line of the instruction is not part of the known data.
         """
-        for line_id, line_meta in subject_properties.existing_lines.items():
-            if (
-                line_meta.file_name == instruction.file
-                and line_meta.line_number == instruction.lineno
-            ):
-                return line_id
-        raise ValueError("The instruction's line is not registered in the known data")
+        # Lines are identified by their file and line number only.
+        line_meta = LineMetaData(
+            instruction.code_object_id,
+            instruction.file,
+            instruction.lineno,  # type: ignore[arg-type]
+        )
+        if (line_id := subject_properties.get_line_id(line_meta)) is None:
+            raise ValueError(
+                "The instruction's line is not registered in the known data"
+            )
+        return line_id
 
     @staticmethod
     def map_instructions_to_lines(
@@ -850,10 +982,8 @@ class AssertionSlicer:
         code_meta = self._known_code_objects[traced_instr.code_object_id]
 
         # find out the basic block of the assertion
-        basic_block = None
-        for node in code_meta.original_cfg.nodes:
-            if node.index == traced_instr.node_id and node.basic_block:
-                basic_block = node.basic_block
+        node = code_meta.get_original_cfg_node(traced_instr.node_id)
+        basic_block = node.basic_block if node is not None else None
         assert basic_block, "node id or code object id were off"
 
         # the traced instruction is always the jump at the end of the bb
@@ -892,3 +1022,25 @@ class AssertionSlicer:
         slicing_criterion = self._slicing_criterion_from_assertion(assertion, trace)
         slicer = DynamicSlicer(self._known_code_objects)
         return slicer.slice(trace, slicing_criterion)
+
+    def slice_assertions(
+        self, assertions: Sequence[ExecutedAssertion], trace: ExecutionTrace
+    ) -> list[list[UniqueInstruction]]:
+        """Calculate the dynamic slices of the assertions inside a test case.
+
+        The assertions are sliced in a single backward pass over the trace.
+
+        Args:
+            assertions: The assertions, for which to calculate the slices.
+            trace: the execution trace
+
+        Returns:
+            The lists of executed instructions contained in the slices of the
+            assertions, in the order of the assertions.
+        """
+        slicing_criteria = [
+            self._slicing_criterion_from_assertion(assertion, trace)
+            for assertion in assertions
+        ]
+        slicer = DynamicSlicer(self._known_code_objects)
+        return slicer.slice_criteria(trace, slicing_criteria)
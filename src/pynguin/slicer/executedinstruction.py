@@ -7,7 +7,12 @@
 """Contains all code related to executed instruction classes."""
 from __future__ import annotations
 
+from array import array
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import overload
 
 from opcode import opname
 
@@ -21,7 +26,7 @@ class ExecutedInstruction:
     node_id: int
     opcode: int
     argument: int | str | None
-    lineno: int
+    lineno: int | None
     offset: int
 
     @property
@@ -136,3 +141,357 @@ class ExecutedReturnInstruction(ExecutedInstruction):
             f"{'(ret)':<7} {self.file:<40} {opname[self.opcode]:<72} "
             f"{self.code_object_id:02d} @ line: {self.lineno:d}-{self.offset:d}"
         )
+
+
+# The types of executed instructions a trace can hold, indexed by their kind
+_INSTRUCTION_TYPES: tuple[type[ExecutedInstruction], ...] = (
+    ExecutedInstruction,
+    ExecutedMemoryInstruction,
+    ExecutedAttributeInstruction,
+    ExecutedControlInstruction,
+    ExecutedCallInstruction,
+    ExecutedReturnInstruction,
+)
+_INSTRUCTION_KINDS: dict[type[ExecutedInstruction], int] = {
+    instruction_type: kind for kind, instruction_type in enumerate(_INSTRUCTION_TYPES)
+}
+_CONTROL_KIND = _INSTRUCTION_KINDS[ExecutedControlInstruction]
+
+# Flags of an executed instruction
+_MUTABLE_TYPE = 1
+_OBJECT_CREATION = 2
+_STRING_ARGUMENT = 4
+_NO_ARGUMENT = 8
+_NO_ARG_ADDRESS = 16
+_NO_SRC_ADDRESS = 32
+_NO_LINENO = 64
+
+
+class ExecutedInstructionTrace(Sequence[ExecutedInstruction]):
+    """A compact, columnar trace of executed instructions.
+
+    Every field of the executed instructions is stored in its own array, strings,
+    i.e., the module files and the names of the accessed variables and attributes,
+    are interned in a string table.  Indexing or iterating the trace materialises
+    the executed instruction objects on demand, which should be avoided in hot
+    loops; the columns and the index-based accessors give access to single fields
+    without materialising any object.
+    """
+
+    def __init__(self, instructions: Iterable[ExecutedInstruction] = ()) -> None:
+        """Create a new trace.
+
+        Args:
+            instructions: The executed instructions to initially add to the trace
+        """
+        self._strings: list[str] = []
+        self._string_indices: dict[str, int] = {}
+        self._kinds = array("B")
+        self._files = array("i")
+        self._code_object_ids = array("i")
+        self._node_ids = array("i")
+        self._opcodes = array("H")
+        self._arguments = array("q")
+        self._linenos = array("i")
+        self._offsets = array("i")
+        self._arg_addresses = array("q")
+        self._src_addresses = array("q")
+        self._flags = array("B")
+        self.extend(instructions)
+
+    @property
+    def code_object_ids(self) -> array[int]:
+        """Provides the column of the ids of the code objects.
+
+        Returns:
+            The ids of the code objects containing the executed instructions
+        """
+        return self._code_object_ids
+
+    @property
+    def node_ids(self) -> array[int]:
+        """Provides the column of the ids of the nodes.
+
+        Returns:
+            The ids of the nodes containing the executed instructions
+        """
+        return self._node_ids
+
+    @property
+    def opcodes(self) -> array[int]:
+        """Provides the column of the opcodes.
+
+        Returns:
+            The opcodes of the executed instructions
+        """
+        return self._opcodes
+
+    @property
+    def linenos(self) -> array[int]:
+        """Provides the column of the line numbers.
+
+        Returns:
+            The line numbers of the executed instructions
+        """
+        return self._linenos
+
+    @property
+    def offsets(self) -> array[int]:
+        """Provides the column of the offsets.
+
+        Returns:
+            The offsets of the executed instructions
+        """
+        return self._offsets
+
+    def get_file(self, index: int) -> str:
+        """Provides the module file of an executed instruction.
+
+        Args:
+            index: The position of the executed instruction in the trace
+
+        Returns:
+            The file name of the module containing the executed instruction
+        """
+        return self._strings[self._files[index]]
+
+    def get_argument(self, index: int) -> int | str | None:
+        """Provides the argument of an executed instruction.
+
+        Args:
+            index: The position of the executed instruction in the trace
+
+        Returns:
+            The argument of the executed instruction
+        """
+        flags = self._flags[index]
+        if flags & _NO_ARGUMENT:
+            return None
+        if flags & _STRING_ARGUMENT:
+            return self._strings[self._arguments[index]]
+        return self._arguments[index]
+
+    def get_lineno(self, index: int) -> int | None:
+        """Provides the line number of an executed instruction.
+
+        Args:
+            index: The position of the executed instruction in the trace
+
+        Returns:
+            The line number of the executed instruction
+        """
+        if self._flags[index] & _NO_LINENO:
+            return None
+        return self._linenos[index]
+
+    def is_jump(self, index: int) -> bool:
+        """Whether an executed instruction is a jump condition.
+
+        Args:
+            index: The position of the executed instruction in the trace
+
+        Returns:
+            True, if the executed instruction is a jump condition, False otherwise
+        """
+        return self._kinds[index] == _CONTROL_KIND
+
+    def _intern(self, string: str) -> int:
+        index = self._string_indices.get(string)
+        if index is None:
+            index = self._string_indices[string] = len(self._strings)
+            self._strings.append(string)
+        return index
+
+    def add(
+        self,
+        instruction_type: type[ExecutedInstruction],
+        file: str,
+        code_object_id: int,
+        node_id: int,
+        opcode: int,
+        argument: int | str | None,
+        lineno: int | None,
+        offset: int,
+        arg_address: int | None = None,
+        src_address: int | None = None,
+        is_mutable_type: bool = False,
+        object_creation: bool = False,
+    ) -> None:
+        """Adds an executed instruction to the trace without creating an object.
+
+        Args:
+            instruction_type: The type of the executed instruction
+            file: File name of the module containing the instruction
+            code_object_id: code object containing the instruction
+            node_id: the node of the code object containing the instruction
+            opcode: the opcode of the instruction
+            argument: the argument of the instruction
+            lineno: the line number of the instruction
+            offset: the offset of the instruction
+            arg_address: the memory address of the argument, if any
+            src_address: the memory address of the source of an attribute, if any
+            is_mutable_type: if the argument is mutable
+            object_creation: if the instruction creates the object used
+        """
+        flags = 0
+        if is_mutable_type:
+            flags |= _MUTABLE_TYPE
+        if object_creation:
+            flags |= _OBJECT_CREATION
+        if argument is None:
+            flags |= _NO_ARGUMENT
+            argument = 0
+        elif isinstance(argument, str):
+            flags |= _STRING_ARGUMENT
+            argument = self._intern(argument)
+        if arg_address is None:
+            flags |= _NO_ARG_ADDRESS
+            arg_address = 0
+        if src_address is None:
+            flags |= _NO_SRC_ADDRESS
+            src_address = 0
+        if lineno is None:
+            flags |= _NO_LINENO
+            lineno = 0
+        self._kinds.append(_INSTRUCTION_KINDS[instruction_type])
+        self._files.append(self._intern(file))
+        self._code_object_ids.append(code_object_id)
+        self._node_ids.append(node_id)
+        self._opcodes.append(opcode)
+        self._arguments.append(argument)
+        self._linenos.append(lineno)
+        self._offsets.append(offset)
+        self._arg_addresses.append(arg_address)
+        self._src_addresses.append(src_address)
+        self._flags.append(flags)
+
+    def append(self, instruction: ExecutedInstruction) -> None:
+        """Adds an executed instruction object to the trace.
+
+        Args:
+            instruction: The executed instruction
+        """
+        self.add(
+            type(instruction),
+            instruction.file,
+            instruction.code_object_id,
+            instruction.node_id,
+            instruction.opcode,
+            instruction.argument,
+            instruction.lineno,
+            instruction.offset,
+            arg_address=getattr(instruction, "arg_address", None),
+            src_address=getattr(instruction, "src_address", None),
+            is_mutable_type=getattr(instruction, "is_mutable_type", False),
+            object_creation=getattr(instruction, "object_creation", False),
+        )
+
+    def extend(self, instructions: Iterable[ExecutedInstruction]) -> None:
+        """Adds the executed instructions to the end of the trace.
+
+        Another columnar trace is concatenated column by column.  Only if its string
+        table is not compatible with the one of this trace, the indices into the
+        string table are translated.
+
+        Args:
+            instructions: The executed instructions
+        """
+        if not isinstance(instructions, ExecutedInstructionTrace):
+            for instruction in instructions:
+                self.append(instruction)  # noqa: PERF402
+            return
+
+        other = instructions
+        mapping = [self._intern(string) for string in other._strings]
+        if all(index == mapped for index, mapped in enumerate(mapping)):
+            self._files.extend(other._files)
+            self._arguments.extend(other._arguments)
+        else:
+            self._files.extend(array("i", [mapping[file] for file in other._files]))
+            self._arguments.extend(
+                array(
+                    "q",
+                    [
+                        mapping[argument] if flags & _STRING_ARGUMENT else argument
+                        for argument, flags in zip(
+                            other._arguments, other._flags, strict=True
+                        )
+                    ],
+                )
+            )
+        self._kinds.extend(other._kinds)
+        self._code_object_ids.extend(other._code_object_ids)
+        self._node_ids.extend(other._node_ids)
+        self._opcodes.extend(other._opcodes)
+        self._linenos.extend(other._linenos)
+        self._offsets.extend(other._offsets)
+        self._arg_addresses.extend(other._arg_addresses)
+        self._src_addresses.extend(other._src_addresses)
+        self._flags.extend(other._flags)
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    @overload
+    def __getitem__(self, index: int) -> ExecutedInstruction:
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ExecutedInstruction]:
+        ...  # pragma: no cover
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> ExecutedInstruction | list[ExecutedInstruction]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        flags = self._flags[index]
+        values = (
+            self._strings[self._files[index]],
+            self._code_object_ids[index],
+            self._node_ids[index],
+            self._opcodes[index],
+            self.get_argument(index),
+            self.get_lineno(index),
+            self._offsets[index],
+        )
+        arg_address = None if flags & _NO_ARG_ADDRESS else self._arg_addresses[index]
+        instruction_type = _INSTRUCTION_TYPES[self._kinds[index]]
+        if instruction_type is ExecutedMemoryInstruction:
+            return ExecutedMemoryInstruction(
+                *values,
+                arg_address,  # type: ignore[arg-type]
+                bool(flags & _MUTABLE_TYPE),
+                bool(flags & _OBJECT_CREATION),
+            )
+        if instruction_type is ExecutedAttributeInstruction:
+            return ExecutedAttributeInstruction(
+                *values,
+                None  # type: ignore[arg-type]
+                if flags & _NO_SRC_ADDRESS
+                else self._src_addresses[index],
+                arg_address,  # type: ignore[arg-type]
+                bool(flags & _MUTABLE_TYPE),
+            )
+        return instruction_type(*values)
+
+    def __iter__(self) -> Iterator[ExecutedInstruction]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __reversed__(self) -> Iterator[ExecutedInstruction]:
+        for index in range(len(self) - 1, -1, -1):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            own == foreign for own, foreign in zip(self, other, strict=True)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ExecutedInstructionTrace({list(self)!r})"
@@ -47,12 +47,8 @@ class StatementSlicingObserver(ex.ExecutionObserver):
         self._tracer = tracer
         self._slicing_local_state = StatementSlicingObserver.SlicingLocalState()
 
-    def before_test_case_execution(self, test_case: tc.TestCase):
-        """Not used.
-
-        Args:
-            test_case: Not used
-        """
+    def before_test_case_execution(self, test_case: tc.TestCase):  # noqa: D102
+        self._slicing_local_state.slicing_criteria = {}
 
     def before_statement_execution(  # noqa: D102
         self, statement: st.Statement, node: ast.stmt, exec_ctx: ex.ExecutionContext
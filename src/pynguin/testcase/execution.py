@@ -14,20 +14,29 @@ import copy
 import dataclasses
 import inspect
 import logging
+import math
+import multiprocessing
 import os
+import pickle
 import sys
 import threading
+import time
+import weakref
 
 from abc import abstractmethod
+from collections import Counter
+from collections import OrderedDict
+from collections.abc import Iterable
 from collections.abc import Sized
 from dataclasses import dataclass
 from dataclasses import field
 from importlib import reload
 from math import inf
 from queue import Empty
-from queue import Queue
+from queue import SimpleQueue
 from types import BuiltinFunctionType
 from types import BuiltinMethodType
+from types import CodeType
 from types import ModuleType
 from typing import TYPE_CHECKING
 from typing import Any
@@ -76,6 +85,9 @@ from pynguin.utils.type_utils import is_string
 immutable_types = (int, float, complex, str, tuple, frozenset, bytes)
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from multiprocessing.connection import Connection
+
     import pynguin.testcase.testcase as tc
 
     from pynguin.analyses import module
@@ -83,6 +95,10 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Name of the hook that is called before each statement, when a test case is
+# executed as a whole.
+_STATEMENT_BOUNDARY_HOOK = "__pynguin_statement_boundary__"
+
 
 class ExecutionContext:
     """Contains information required in the context of an execution.
@@ -250,9 +266,12 @@ class ExecutionObserver:
     """An Observer that can be used to observe the execution of a test case.
 
     Important Note: If an observer is stateful, then this state must be encapsulated
-    in a threading.local, i.e., be bound to a thread. Note that thread local data
-    is initialized per thread, so there is no need to clear any pre-existing data
-    (because there is none), as every thread gets its own instance.
+    in a threading.local, i.e., be bound to a thread. Note that the executing thread
+    is reused for subsequent executions, as long as no execution times out.  Thus,
+    you have to reset any pre-existing data in
+    ExecutionObserver::before_test_case_execution, which is called from inside the
+    thread.  Do not clear data in place that was already written to an execution
+    result, but create new containers instead.
 
     Methods that are called from within the thread are not allowed to interact with the
     'outside'. The only thing that should leave an observer are results when they are
@@ -269,10 +288,38 @@ class ExecutionObserver:
     For more details, look at some implementations, e.g., AssertionTraceObserver.
     """
 
+    @property
+    def observes_statements(self) -> bool:
+        """Does this observer have to be notified about every single statement?
+
+        Observers that only implement the test-case level hooks should return False,
+        which allows the executor to run a test case as a whole.
+
+        Returns:
+            Whether the statement-level hooks of this observer have to be called
+        """
+        return True
+
+    @property
+    def supports_parallel_execution(self) -> bool:
+        """Can test cases be executed in forked processes while this observer is set?
+
+        The hooks that are called inside the executing thread then run in a forked
+        process, thus any state that they keep, except for the data they store in
+        the execution result, is lost.  Only the data in the execution result is sent
+        back to the main process, where the outside-thread hook is called.
+
+        Returns:
+            Whether the observer works with parallel test-case execution
+        """
+        return False
+
     @abstractmethod
     def before_test_case_execution(self, test_case: tc.TestCase):
         """Called before test case execution.
 
+        The call happens from inside the thread that executes the test case.
+
         Args:
             test_case: The test cases that will be executed.
         """
@@ -428,7 +475,19 @@ class AssertionExecutionObserver(ExecutionObserver):
         existing_code_objects = (
             self._tracer.get_subject_properties().existing_code_objects
         )
-        code_object_id = len(existing_code_objects) - 1
+        # The code of the assertion might have been taken from the compiled-code
+        # cache, thus it is not necessarily the last registered code object.  The
+        # last traced POP_JUMP_IF_TRUE instruction belongs to the assertion, though.
+        executed_instructions = self._tracer.get_trace().executed_instructions
+        code_object_id = next(
+            code_object_id
+            for opcode, code_object_id in zip(
+                reversed(executed_instructions.opcodes),
+                reversed(executed_instructions.code_object_ids),
+                strict=True,
+            )
+            if opcode == op.POP_JUMP_IF_TRUE
+        )
         code_object = existing_code_objects[code_object_id]
         assert_node = None
         for node in code_object.cfg.nodes:
@@ -469,12 +528,9 @@ class ReturnTypeObserver(ExecutionObserver):
         # Non-local state
         self._test_cluster = test_cluster
 
-    def before_test_case_execution(self, test_case: tc.TestCase):
-        """Not used.
-
-        Args:
-            test_case: Not used
-        """
+    def before_test_case_execution(self, test_case: tc.TestCase):  # noqa: D102
+        self._return_type_local_state.return_type_trace = {}
+        self._return_type_local_state.return_type_generic_args = {}
 
     def after_test_case_execution_inside_thread(  # noqa: D102
         self, test_case: tc.TestCase, result: ExecutionResult
@@ -570,7 +626,9 @@ class ExecutionTrace:
     true_distances: dict[int, float] = field(default_factory=dict)
     false_distances: dict[int, float] = field(default_factory=dict)
     covered_line_ids: OrderedSet[int] = field(default_factory=OrderedSet)
-    executed_instructions: list[ei.ExecutedInstruction] = field(default_factory=list)
+    executed_instructions: ei.ExecutedInstructionTrace = field(
+        default_factory=ei.ExecutedInstructionTrace
+    )
     executed_assertions: list[ExecutedAssertion] = field(default_factory=list)
     checked_lines: OrderedSet[int] = field(default_factory=OrderedSet)
 
@@ -639,7 +697,7 @@ class ExecutionTrace:
         lineno: int,
         offset: int,
     ) -> None:
-        """Creates a new ExecutedInstruction object and adds it to the trace.
+        """Adds a new executed instruction to the trace.
 
         Args:
             module: File name of the module containing the instruction
@@ -649,10 +707,16 @@ class ExecutionTrace:
             lineno: the line number of the instruction
             offset: the offset of the instruction
         """
-        executed_instr = ei.ExecutedInstruction(
-            module, code_object_id, node_id, opcode, None, lineno, offset
+        self.executed_instructions.add(
+            ei.ExecutedInstruction,
+            module,
+            code_object_id,
+            node_id,
+            opcode,
+            None,
+            lineno,
+            offset,
         )
-        self.executed_instructions.append(executed_instr)
 
     def add_memory_instruction(
         self,
@@ -667,7 +731,7 @@ class ExecutionTrace:
         is_mutable_type: bool,
         object_creation: bool,
     ) -> None:
-        """Creates a new ExecutedMemoryInstruction object and adds it to the trace.
+        """Adds a new executed memory instruction to the trace.
 
         Args:
             module: File name of the module containing the instruction
@@ -681,7 +745,8 @@ class ExecutionTrace:
             is_mutable_type: if the argument is mutable
             object_creation: if the instruction creates the object used
         """
-        executed_instr = ei.ExecutedMemoryInstruction(
+        self.executed_instructions.add(
+            ei.ExecutedMemoryInstruction,
             module,
             code_object_id,
             node_id,
@@ -689,11 +754,10 @@ class ExecutionTrace:
             arg_name,
             lineno,
             offset,
-            arg_address,
-            is_mutable_type,
-            object_creation,
+            arg_address=arg_address,
+            is_mutable_type=is_mutable_type,
+            object_creation=object_creation,
         )
-        self.executed_instructions.append(executed_instr)
 
     def add_attribute_instruction(
         self,
@@ -708,7 +772,7 @@ class ExecutionTrace:
         arg_address: int,
         is_mutable_type: bool,
     ) -> None:
-        """Creates a new ExecutedAttributeInstruction object and adds it to the trace.
+        """Adds a new executed attribute instruction to the trace.
 
         Args:
             module: File name of the module containing the instruction
@@ -722,7 +786,8 @@ class ExecutionTrace:
             arg_address: the memory address of the argument
             is_mutable_type: if the attribute is mutable
         """
-        executed_instr = ei.ExecutedAttributeInstruction(
+        self.executed_instructions.add(
+            ei.ExecutedAttributeInstruction,
             module,
             code_object_id,
             node_id,
@@ -730,11 +795,10 @@ class ExecutionTrace:
             attr_name,
             lineno,
             offset,
-            src_address,
-            arg_address,
-            is_mutable_type,
+            arg_address=arg_address,
+            src_address=src_address,
+            is_mutable_type=is_mutable_type,
         )
-        self.executed_instructions.append(executed_instr)
 
     def add_jump_instruction(
         self,
@@ -746,7 +810,7 @@ class ExecutionTrace:
         offset: int,
         target_id: int,
     ) -> None:
-        """Creates a new ExecutedControlInstruction object and adds it to the trace.
+        """Adds a new executed control instruction to the trace.
 
         Args:
             module: File name of the module containing the instruction
@@ -757,10 +821,16 @@ class ExecutionTrace:
             offset: the offset of the instruction
             target_id: the target offset to jump to
         """
-        executed_instr = ei.ExecutedControlInstruction(
-            module, code_object_id, node_id, opcode, target_id, lineno, offset
+        self.executed_instructions.add(
+            ei.ExecutedControlInstruction,
+            module,
+            code_object_id,
+            node_id,
+            opcode,
+            target_id,
+            lineno,
+            offset,
         )
-        self.executed_instructions.append(executed_instr)
 
     def add_call_instruction(
         self,
@@ -772,7 +842,7 @@ class ExecutionTrace:
         offset: int,
         arg: int,
     ) -> None:
-        """Creates a new ExecutedCallInstruction object and adds it to the trace.
+        """Adds a new executed call instruction to the trace.
 
         Args:
             module: File name of the module containing the instruction
@@ -783,12 +853,17 @@ class ExecutionTrace:
             offset: the offset of the instruction
             arg: the argument to the instruction
         """
-        executed_instr = ei.ExecutedCallInstruction(
-            module, code_object_id, node_id, opcode, arg, lineno, offset
+        self.executed_instructions.add(
+            ei.ExecutedCallInstruction,
+            module,
+            code_object_id,
+            node_id,
+            opcode,
+            arg,
+            lineno,
+            offset,
         )
 
-        self.executed_instructions.append(executed_instr)
-
     def add_return_instruction(
         self,
         module: str,
@@ -798,7 +873,7 @@ class ExecutionTrace:
         lineno: int,
         offset: int,
     ) -> None:
-        """Creates a new ExecutedReturnInstruction object and adds it to the trace.
+        """Adds a new executed return instruction to the trace.
 
         Args:
             module: File name of the module containing the instruction
@@ -808,11 +883,227 @@ class ExecutionTrace:
             lineno: the line number of the instruction
             offset: the offset of the instruction
         """
-        executed_instr = ei.ExecutedReturnInstruction(
-            module, code_object_id, node_id, opcode, None, lineno, offset
+        self.executed_instructions.add(
+            ei.ExecutedReturnInstruction,
+            module,
+            code_object_id,
+            node_id,
+            opcode,
+            None,
+            lineno,
+            offset,
         )
 
-        self.executed_instructions.append(executed_instr)
+
+class MergedExecutionTrace:
+    """Incrementally merges the execution traces of the test cases of a suite.
+
+    Merging the traces of all test cases of a suite from scratch whenever the
+    suite is evaluated is wasteful, because usually only one or two of its test
+    cases changed in between.  This class keeps the merged trace of the test cases
+    it has seen and only adds the contributions of new traces and removes the
+    contributions of traces that are no longer part of the suite.
+
+    The merged trace only holds the executed code objects, predicates, branch
+    distances, covered lines, and checked lines; it contains no executed
+    instructions or assertions.  Use `ExecutionTrace.merge` if you require those.
+    """
+
+    def __init__(self, orig: MergedExecutionTrace | None = None) -> None:
+        """Creates a new merged trace.
+
+        Args:
+            orig: Original, if we clone an existing merged trace.
+        """
+        if orig is None:
+            self._traces: dict[int, ExecutionTrace] = {}
+            self._multiplicities: Counter[int] = Counter()
+            self._code_object_counts: Counter[int] = Counter()
+            self._line_counts: Counter[int] = Counter()
+            self._checked_line_counts: Counter[int] = Counter()
+            # How many of the merged traces have the minimal distance of a predicate.
+            self._true_minimum_counts: dict[int, int] = {}
+            self._false_minimum_counts: dict[int, int] = {}
+            self._merged = ExecutionTrace()
+        else:
+            self._traces = dict(orig._traces)
+            self._multiplicities = Counter(orig._multiplicities)
+            self._code_object_counts = Counter(orig._code_object_counts)
+            self._line_counts = Counter(orig._line_counts)
+            self._checked_line_counts = Counter(orig._checked_line_counts)
+            self._true_minimum_counts = dict(orig._true_minimum_counts)
+            self._false_minimum_counts = dict(orig._false_minimum_counts)
+            self._merged = ExecutionTrace(
+                executed_code_objects=OrderedSet(orig._merged.executed_code_objects),
+                executed_predicates=dict(orig._merged.executed_predicates),
+                true_distances=dict(orig._merged.true_distances),
+                false_distances=dict(orig._merged.false_distances),
+                covered_line_ids=OrderedSet(orig._merged.covered_line_ids),
+                checked_lines=OrderedSet(orig._merged.checked_lines),
+            )
+
+    def clone(self) -> MergedExecutionTrace:
+        """Clones the merged trace.
+
+        Returns:
+            A clone that can be updated independently of this merged trace
+        """
+        return MergedExecutionTrace(orig=self)
+
+    def update(self, traces: Iterable[ExecutionTrace]) -> ExecutionTrace:
+        """Updates the merged trace to the given traces.
+
+        Traces are identified by their identity, i.e., a trace must not be modified
+        after it was merged.  A trace that occurs multiple times is merged multiple
+        times, as `ExecutionTrace.merge` would do.
+
+        Args:
+            traces: The traces that shall be merged, e.g., one per test case
+
+        Returns:
+            The merged trace, which must not be modified by the caller
+        """
+        multiplicities: Counter[int] = Counter()
+        for trace in traces:
+            key = id(trace)
+            multiplicities[key] += 1
+            self._traces.setdefault(key, trace)
+        # Remove first, such that minimal distances are only searched among the
+        # traces that remain.
+        for key in list(self._multiplicities):
+            while self._multiplicities[key] > multiplicities[key]:
+                self._multiplicities[key] -= 1
+                self._remove(self._traces[key])
+        for key, count in multiplicities.items():
+            while self._multiplicities[key] < count:
+                self._multiplicities[key] += 1
+                self._add(self._traces[key])
+        self._multiplicities = multiplicities
+        for key in self._traces.keys() - multiplicities.keys():
+            del self._traces[key]
+        return self._merged
+
+    def _add(self, trace: ExecutionTrace) -> None:
+        merged = self._merged
+        for code_object_id in trace.executed_code_objects:
+            if self._code_object_counts[code_object_id] == 0:
+                merged.executed_code_objects.add(code_object_id)
+            self._code_object_counts[code_object_id] += 1
+        for predicate, count in trace.executed_predicates.items():
+            merged.executed_predicates[predicate] = (
+                merged.executed_predicates.get(predicate, 0) + count
+            )
+        self._add_distances(
+            merged.true_distances, self._true_minimum_counts, trace.true_distances
+        )
+        self._add_distances(
+            merged.false_distances, self._false_minimum_counts, trace.false_distances
+        )
+        self._add_lines(merged.covered_line_ids, self._line_counts, trace)
+        self._add_lines(
+            merged.checked_lines, self._checked_line_counts, trace, checked=True
+        )
+
+    def _remove(self, trace: ExecutionTrace) -> None:
+        merged = self._merged
+        for code_object_id in trace.executed_code_objects:
+            self._code_object_counts[code_object_id] -= 1
+            if self._code_object_counts[code_object_id] == 0:
+                del self._code_object_counts[code_object_id]
+                merged.executed_code_objects.discard(code_object_id)
+        for predicate, count in trace.executed_predicates.items():
+            remaining = merged.executed_predicates[predicate] - count
+            if remaining == 0:
+                del merged.executed_predicates[predicate]
+            else:
+                merged.executed_predicates[predicate] = remaining
+        self._remove_distances(
+            merged.true_distances, self._true_minimum_counts, trace, true_branch=True
+        )
+        self._remove_distances(
+            merged.false_distances,
+            self._false_minimum_counts,
+            trace,
+            true_branch=False,
+        )
+        self._remove_lines(merged.covered_line_ids, self._line_counts, trace)
+        self._remove_lines(
+            merged.checked_lines, self._checked_line_counts, trace, checked=True
+        )
+
+    @staticmethod
+    def _add_distances(
+        merged: dict[int, float],
+        minimum_counts: dict[int, int],
+        distances: dict[int, float],
+        multiplicity: int = 1,
+    ) -> None:
+        for predicate, distance in distances.items():
+            minimum = merged.get(predicate, inf)
+            if predicate not in merged or distance < minimum:
+                merged[predicate] = distance
+                minimum_counts[predicate] = multiplicity
+            elif distance == minimum:
+                minimum_counts[predicate] += multiplicity
+
+    def _remove_distances(
+        self,
+        merged: dict[int, float],
+        minimum_counts: dict[int, int],
+        trace: ExecutionTrace,
+        *,
+        true_branch: bool,
+    ) -> None:
+        distances = trace.true_distances if true_branch else trace.false_distances
+        for predicate, distance in distances.items():
+            if distance != merged[predicate]:
+                continue
+            minimum_counts[predicate] -= 1
+            if minimum_counts[predicate] > 0:
+                continue
+            # The last trace with the minimal distance was removed, thus we have to
+            # look for the new minimum among the remaining traces.
+            del merged[predicate]
+            del minimum_counts[predicate]
+            for key, count in self._multiplicities.items():
+                other = self._traces[key]
+                other_distances = (
+                    other.true_distances if true_branch else other.false_distances
+                )
+                if count > 0 and predicate in other_distances:
+                    self._add_distances(
+                        merged,
+                        minimum_counts,
+                        {predicate: other_distances[predicate]},
+                        count,
+                    )
+
+    @staticmethod
+    def _add_lines(
+        merged: OrderedSet[int],
+        line_counts: Counter[int],
+        trace: ExecutionTrace,
+        *,
+        checked: bool = False,
+    ) -> None:
+        for line_id in trace.checked_lines if checked else trace.covered_line_ids:
+            if line_counts[line_id] == 0:
+                merged.add(line_id)
+            line_counts[line_id] += 1
+
+    @staticmethod
+    def _remove_lines(
+        merged: OrderedSet[int],
+        line_counts: Counter[int],
+        trace: ExecutionTrace,
+        *,
+        checked: bool = False,
+    ) -> None:
+        for line_id in trace.checked_lines if checked else trace.covered_line_ids:
+            line_counts[line_id] -= 1
+            if line_counts[line_id] == 0:
+                del line_counts[line_id]
+                merged.discard(line_id)
 
 
 @dataclasses.dataclass
@@ -984,12 +1275,59 @@ class SubjectProperties:
     # Maps all known ids of predicates to meta information
     existing_predicates: dict[int, PredicateMetaData] = field(default_factory=dict)
 
-    # stores which line id represents which line in which file
+    # stores which line id represents which line in which file.  New lines must be
+    # added through register_line, which keeps the index of their ids up to date.
     existing_lines: dict[int, LineMetaData] = field(default_factory=dict)
 
     # stores known memory attribute object addresses
     object_addresses: OrderedSet[int] = field(default_factory=OrderedSet)
 
+    # Reverse index of existing_lines, stores the id of each known line.  It is
+    # rebuilt whenever existing_lines is set, thus it is not pickled.
+    _line_ids: dict[LineMetaData, int] = field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "existing_lines":
+            super().__setattr__(
+                "_line_ids", {meta: line_id for line_id, meta in value.items()}
+            )
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_line_ids"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def register_line(self, line_meta: LineMetaData) -> int:
+        """Registers a line, unless it is already known.
+
+        Args:
+            line_meta: The meta data of the line
+
+        Returns:
+            The id of the line
+        """
+        if (line_id := self._line_ids.get(line_meta)) is None:
+            line_id = len(self.existing_lines)
+            self.existing_lines[line_id] = line_meta
+            self._line_ids[line_meta] = line_id
+        return line_id
+
+    def get_line_id(self, line_meta: LineMetaData) -> int | None:
+        """Provides the id of a known line.
+
+        Args:
+            line_meta: The meta data of the line
+
+        Returns:
+            The id of the line, or None, if the line is not known
+        """
+        return self._line_ids.get(line_meta)
+
 
 class ExecutionTracer:
     """Tracks branch distances and covered statements during execution.
@@ -1366,16 +1704,9 @@ class ExecutionTracer:
         Returns:
             the id of the registered line
         """
-        line_meta = LineMetaData(code_object_id, file_name, line_number)
-        if line_meta not in self.subject_properties.existing_lines.values():
-            line_id = len(self.subject_properties.existing_lines)
-            self.subject_properties.existing_lines[line_id] = line_meta
-        else:
-            index = list(self.subject_properties.existing_lines.values()).index(
-                line_meta
-            )
-            line_id = list(self.subject_properties.existing_lines.keys())[index]
-        return line_id
+        return self.subject_properties.register_line(
+            LineMetaData(code_object_id, file_name, line_number)
+        )
 
     def _update_metrics(
         self, distance_false: float, distance_true: float, predicate: int
@@ -1722,9 +2053,10 @@ class ExecutionTracer:
         if statement.has_only_exception_assertion():
             trace = self._thread_local_state.trace
             error_call_position = len(trace.executed_instructions) - 1
-            error_causing_instr = trace.executed_instructions[error_call_position]
-            code_object_id = error_causing_instr.code_object_id
-            node_id = error_causing_instr.node_id
+            code_object_id = trace.executed_instructions.code_object_ids[
+                error_call_position
+            ]
+            node_id = trace.executed_instructions.node_ids[error_call_position]
             trace.executed_assertions.append(
                 ExecutedAssertion(
                     code_object_id,
@@ -1755,10 +2087,10 @@ class ExecutionTracer:
         if self.is_disabled():
             return
 
-        exec_instr = self.get_trace().executed_instructions
-        pop_jump_if_true_position = len(exec_instr) - 1
-        for instr in reversed(exec_instr):
-            if instr.opcode == op.POP_JUMP_IF_TRUE:
+        opcodes = self.get_trace().executed_instructions.opcodes
+        pop_jump_if_true_position = len(opcodes) - 1
+        for opcode in reversed(opcodes):
+            if opcode == op.POP_JUMP_IF_TRUE:
                 break
             pop_jump_if_true_position -= 1
         assert (
@@ -1787,13 +2119,17 @@ class ExecutionTracer:
         Returns:
             The id of the object type or the class if it has the attribute, -1 otherwise
         """
+        # The first class in the MRO that has the attribute, in case it is not a
+        # data descriptor, which saves a second pass over the MRO.
+        owner = -1
         for cls in type(object_type).__mro__:
-            if attribute in cls.__dict__ and inspect.isdatadescriptor(
-                cls.__dict__.get(attribute)
-            ):
-                # Class in the MRO hierarchy has attribute
-                # Class has attribute and attribute is a data descriptor
-                return id(cls)
+            if attribute in cls.__dict__:
+                if inspect.isdatadescriptor(cls.__dict__[attribute]):
+                    # Class in the MRO hierarchy has attribute
+                    # Class has attribute and attribute is a data descriptor
+                    return id(cls)
+                if owner == -1:
+                    owner = id(cls)
 
         # This would lead to an infinite recursion and thus a crash of the program
         if attribute in ("__getattr__", "__getitem__"):
@@ -1813,11 +2149,7 @@ class ExecutionTracer:
             return id(object_type)
 
         # Check if attribute in MRO hierarchy (no need for data descriptor)
-        for cls in type(object_type).__mro__:
-            if attribute in cls.__dict__:
-                return id(cls)
-
-        return -1
+        return owner
 
     def __repr__(self) -> str:
         return "ExecutionTracer"
@@ -2037,6 +2369,86 @@ class ModuleProvider:
         reload(sys.modules[module_name])
 
 
+class CompiledCodeCache:
+    """A bounded cache of code objects instrumented for checked coverage.
+
+    Test cases usually change only slightly from one generation to the next, thus
+    most of their statements are executed over and over again.  Instrumenting the
+    same statement for checked coverage again and again is wasted effort, so we
+    keep the resulting code objects around.  Plain code objects are not cached:
+    computing the key of a node takes longer than compiling it.
+
+    The key of an entry is the structure of the module that wraps the statement,
+    i.e., the statement as well as the names of its variables and module aliases.
+    We cannot key on the statement itself, because observers may rewrite the node
+    before it is executed.  Instrumented code objects refer to code-object ids of
+    the tracer's subject properties, hence they are dropped as soon as the tracer is
+    reset.
+    """
+
+    def __init__(
+        self,
+        tracer: ExecutionTracer,
+        checked_transformer: InstrumentationTransformer,
+        maximum_size: int = 4096,
+    ) -> None:
+        """Create a new cache.
+
+        Args:
+            tracer: The tracer that is used by the instrumented code objects
+            checked_transformer: The transformer for checked-coverage instrumentation
+            maximum_size: The maximum number of cached code objects
+        """
+        self._tracer = tracer
+        self._checked_transformer = checked_transformer
+        self._maximum_size = maximum_size
+        self._cache: OrderedDict[str, CodeType] = OrderedDict()
+        self._subject_properties: SubjectProperties | None = None
+        # Threads of timed out executions might still access the cache.
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_code(self, ast_node: ast.Module, instrument: bool) -> CodeType:
+        """Provides the code object for the given module node.
+
+        Args:
+            ast_node: The node of the module to compile
+            instrument: Whether the code shall be instrumented for checked coverage
+
+        Returns:
+            The ready-to-execute code object
+        """
+        if not instrument:
+            return compile(ast_node, "<ast>", "exec")
+        key = ast.dump(ast_node, include_attributes=True)
+        with self._lock:
+            subject_properties = self._tracer.get_subject_properties()
+            if self._subject_properties is not subject_properties:
+                self._subject_properties = subject_properties
+                self._cache.clear()
+            if (code := self._cache.get(key)) is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return code
+            self.misses += 1
+            code = self._checked_transformer.instrument_module(
+                compile(ast_node, "<ast>", "exec")
+            )
+            self._cache[key] = code
+            if len(self._cache) > self._maximum_size:
+                self._cache.popitem(last=False)
+            return code
+
+    def clear(self) -> None:
+        """Remove all cached code objects."""
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
 class AbstractTestCaseExecutor(abc.ABC):
     """Interface for a test case executor."""
 
@@ -2092,6 +2504,22 @@ class AbstractTestCaseExecutor(abc.ABC):
             Result of the execution
         """
 
+    def execute_multiple(
+        self, test_cases: Sequence[tc.TestCase]
+    ) -> list[ExecutionResult]:
+        """Executes the given test cases.
+
+        Executors may execute the test cases in parallel, the results are always
+        returned in the order of the given test cases.
+
+        Args:
+            test_cases: the test cases that should be executed.
+
+        Returns:
+            The results of the executions
+        """
+        return [self.execute(test_case) for test_case in test_cases]
+
 
 class TestCaseExecutor(AbstractTestCaseExecutor):
     """An executor that executes the generated test cases."""
@@ -2102,6 +2530,9 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
         module_provider: ModuleProvider | None = None,
         maximum_test_execution_timeout: int = 5,
         test_execution_time_per_statement: int = 1,
+        compiled_code_cache_size: int = 4096,
+        whole_test_case_execution: bool = True,
+        number_of_workers: int = 1,
     ) -> None:
         """Create new test case executor.
 
@@ -2112,6 +2543,12 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
                 before a test case execution times out.
             test_execution_time_per_statement: The amount of time (in seconds) that is
                 added to the timeout per statement, up to minimum_test_execution_timeout
+            compiled_code_cache_size: The maximum number of statements instrumented
+                for checked coverage that are kept for reuse in later executions
+            whole_test_case_execution: Execute a test case as a single code object,
+                if no observer has to be notified about single statements
+            number_of_workers: The number of forked processes that execute test
+                cases in parallel when multiple test cases are executed at once
         """
         # Repeatedly opening/closing devnull caused problems.
         # This is closed when Pynguin terminates, since we don't need this output
@@ -2134,6 +2571,12 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
         self._checked_transformer = InstrumentationTransformer(
             self._tracer, [checked_instrumentation]
         )
+        self._compiled_code_cache = CompiledCodeCache(
+            self._tracer, self._checked_transformer, compiled_code_cache_size
+        )
+        self._whole_test_case_execution = whole_test_case_execution
+        self._number_of_workers = number_of_workers
+        self._worker: _TestCaseExecutionWorker | None = None
 
         def log_thread_exception(arg):
             _LOGGER.error(
@@ -2183,6 +2626,15 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
         """
         return self._tracer
 
+    @property
+    def compiled_code_cache(self) -> CompiledCodeCache:
+        """Provide access to the cache of compiled statements.
+
+        Returns:
+            The compiled-code cache
+        """
+        return self._compiled_code_cache
+
     def set_instrument(self, instrument: bool) -> None:
         """Set if the test is to be instrumented as well.
 
@@ -2191,61 +2643,261 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
         """
         self._instrument = instrument
 
+    def get_execution_time_limit(self, test_cases: Sequence[tc.TestCase]) -> int:
+        """Provides how long executing test cases one after another may take.
+
+        This is the sum of the timeouts of the test cases, plus one more maximum
+        test-case timeout to set up the execution, e.g., in a forked process, and to
+        send its results.
+
+        Args:
+            test_cases: The test cases to execute
+
+        Returns:
+            The time limit in seconds
+        """
+        return (
+            sum(self._timeout_for(test_case) for test_case in test_cases)
+            + self._maximum_test_execution_timeout
+        )
+
     def execute(  # noqa: D102
         self,
         test_case: tc.TestCase,
     ) -> ExecutionResult:
-        with contextlib.redirect_stdout(self._null_file), contextlib.redirect_stderr(
-            self._null_file
-        ):
-            return_queue: Queue[ExecutionResult] = Queue()
-            thread = threading.Thread(
-                target=self._execute_test_case,
-                args=(test_case, return_queue),
+        result = self._execute_in_worker(test_case)
+        self._after_test_case_execution_outside_thread(test_case, result)
+        return result
+
+    def execute_multiple(  # noqa: D102
+        self, test_cases: Sequence[tc.TestCase]
+    ) -> list[ExecutionResult]:
+        if not self._can_execute_in_parallel(test_cases):
+            return super().execute_multiple(test_cases)
+
+        # Each forked process executes a contiguous chunk of the test cases, such
+        # that the results can be merged in the order of the test cases, no matter
+        # which process finishes first.
+        chunk_size = math.ceil(len(test_cases) / self._number_of_workers)
+        chunks = [
+            test_cases[start : start + chunk_size]
+            for start in range(0, len(test_cases), chunk_size)
+        ]
+        context = multiprocessing.get_context("fork")
+        processes = []
+        for chunk in chunks:
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=self._execute_in_forked_process,
+                args=(chunk, sender),
+                name="TestCaseExecutionProcess",
                 daemon=True,
             )
-            thread.start()
-            thread.join(
-                timeout=min(
-                    self._maximum_test_execution_timeout,
-                    self._test_execution_time_per_statement * len(test_case.statements),
+            process.start()
+            sender.close()
+            processes.append((process, receiver))
+
+        # The forked processes run concurrently, thus each one has to finish within
+        # the time limit of its test cases.  A process can exceed it, e.g., if it
+        # deadlocks on a lock that another thread held while forking.
+        start = time.monotonic()
+        results: list[ExecutionResult] = []
+        for chunk, (process, receiver) in zip(chunks, processes, strict=True):
+            deadline = start + self.get_execution_time_limit(chunk)
+            chunk_results: list[ExecutionResult] | None = None
+            try:
+                if receiver.poll(max(0.0, deadline - time.monotonic())):
+                    chunk_results = receiver.recv()
+                else:
+                    _LOGGER.warning(
+                        "Process %s timed out, re-executing its test cases",
+                        process.name,
+                    )
+                    process.kill()
+            except EOFError:
+                _LOGGER.warning(
+                    "Process %s died, re-executing its test cases", process.name
                 )
+            finally:
+                receiver.close()
+                process.join()
+            if chunk_results is None:
+                # The process did not send its results, e.g., because the SUT
+                # terminated it.  Executing the chunk here is what would have
+                # happened without parallel execution.
+                chunk_results = [
+                    self._execute_in_worker(test_case) for test_case in chunk
+                ]
+            results.extend(chunk_results)
+
+        for test_case, result in zip(test_cases, results, strict=True):
+            self._after_test_case_execution_outside_thread(test_case, result)
+        return results
+
+    def _can_execute_in_parallel(self, test_cases: Sequence[tc.TestCase]) -> bool:
+        # Instrumenting test cases registers new code objects, which would only
+        # happen in the forked processes.
+        return (
+            self._number_of_workers > 1
+            and len(test_cases) > 1
+            and "fork" in multiprocessing.get_all_start_methods()
+            and not self._instrument
+            and all(
+                observer.supports_parallel_execution for observer in self._observers
             )
-            if thread.is_alive():
+        )
+
+    def _execute_in_forked_process(
+        self, test_cases: Sequence[tc.TestCase], connection: Connection
+    ) -> None:
+        results = [self._execute_in_worker(test_case) for test_case in test_cases]
+        for result in results:
+            _make_exceptions_picklable(result)
+        connection.send(results)
+        connection.close()
+
+    def _execute_in_worker(self, test_case: tc.TestCase) -> ExecutionResult:
+        with contextlib.redirect_stdout(self._null_file), contextlib.redirect_stderr(
+            self._null_file
+        ):
+            # The worker thread does not exist in a forked process anymore.
+            if self._worker is None or not self._worker.thread.is_alive():
+                if self._worker is not None:
+                    self._worker.stop()
+                self._worker = _TestCaseExecutionWorker(self)
+            worker = self._worker
+            worker.submit(test_case)
+            try:
+                execution_result = worker.results.get(
+                    timeout=self._timeout_for(test_case)
+                )
+            except Empty:
                 # Set thread ident to invalid value, such that the tracer
-                # kills the thread
+                # kills the thread.  The worker is still busy with the timed out
+                # test case, thus we replace it for subsequent executions.
                 self._tracer.current_thread_identifier = -1
+                self._worker = None
+                worker.stop()
                 result = ExecutionResult(timeout=True)
                 _LOGGER.warning("Experienced timeout from test-case execution")
             else:
-                try:
-                    result = return_queue.get(block=False)
-                except Empty as ex:
+                if execution_result is None:
+                    self._worker = None
+                    worker.stop()
                     _LOGGER.error("Finished thread did not return a result.")
-                    raise RuntimeError("Bug in Pynguin!") from ex
-        self._after_test_case_execution_outside_thread(test_case, result)
+                    raise RuntimeError("Bug in Pynguin!")
+                result = execution_result
         return result
 
+    def _timeout_for(self, test_case: tc.TestCase) -> int:
+        return min(
+            self._maximum_test_execution_timeout,
+            self._test_execution_time_per_statement * len(test_case.statements),
+        )
+
     def _before_test_case_execution(self, test_case: tc.TestCase) -> None:
         self._tracer.init_trace()
         for observer in self._observers:
             observer.before_test_case_execution(test_case)
 
-    def _execute_test_case(self, test_case: tc.TestCase, result_queue: Queue) -> None:
+    def _execute_test_case(
+        self, test_case: tc.TestCase, result_queue: SimpleQueue
+    ) -> None:
         self._before_test_case_execution(test_case)
         result = ExecutionResult()
         exec_ctx = ExecutionContext(self._module_provider)
         self._tracer.current_thread_identifier = threading.current_thread().ident
-        for idx, statement in enumerate(test_case.statements):
-            ast_node = self._before_statement_execution(statement, exec_ctx)
-            exception = self.execute_ast(ast_node, exec_ctx)
-            self._after_statement_execution(statement, exec_ctx, exception)
-            if exception is not None:
-                result.report_new_thrown_exception(idx, exception)
-                break
+        if self._can_execute_as_a_whole():
+            self._execute_test_case_as_a_whole(test_case, exec_ctx, result)
+        else:
+            for idx, statement in enumerate(test_case.statements):
+                ast_node = self._before_statement_execution(statement, exec_ctx)
+                exception = self.execute_ast(ast_node, exec_ctx)
+                self._after_statement_execution(statement, exec_ctx, exception)
+                if exception is not None:
+                    result.report_new_thrown_exception(idx, exception)
+                    break
         self._after_test_case_execution_inside_thread(test_case, result)
         result_queue.put(result)
 
+    def _can_execute_as_a_whole(self) -> bool:
+        # The checked-coverage instrumentation would also trace the statement
+        # boundary hooks, thus we only do this for uninstrumented test cases.
+        return (
+            self._whole_test_case_execution
+            and not self._instrument
+            and not any(observer.observes_statements for observer in self._observers)
+        )
+
+    def _execute_test_case_as_a_whole(
+        self,
+        test_case: tc.TestCase,
+        exec_ctx: ExecutionContext,
+        result: ExecutionResult,
+    ) -> None:
+        """Execute all statements of the test case with a single exec.
+
+        Before each statement we call a hook that records the position of the
+        statement, such that we can attribute a raised exception to the statement
+        that caused it.
+
+        Args:
+            test_case: The test case to execute
+            exec_ctx: The execution context
+            result: The execution result that is updated
+        """
+        position = 0
+
+        def statement_boundary(statement_position: int) -> None:
+            nonlocal position
+            # Check if the current thread is still the one that should be executing
+            # Otherwise raise an exception to kill it.
+            if (
+                self._tracer.current_thread_identifier
+                != threading.current_thread().ident
+            ):
+                raise RuntimeError(
+                    "The current thread shall not be executed any more, thus I kill it."
+                )
+            position = statement_position
+
+        body: list[ast.stmt] = []
+        for idx, statement in enumerate(test_case.statements):
+            body.append(
+                ast.Expr(
+                    value=ast.Call(
+                        func=ast.Name(id=_STATEMENT_BOUNDARY_HOOK, ctx=ast.Load()),
+                        args=[ast.Constant(value=idx)],
+                        keywords=[],
+                    )
+                )
+            )
+            body.append(exec_ctx.node_for_statement(statement))
+        ast_node = ast.fix_missing_locations(ast.Module(body=body, type_ignores=[]))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Executing %s", ast.unparse(ast_node))
+
+        code = self._compiled_code_cache.get_code(ast_node, instrument=False)
+        global_namespace: dict[str, Any] = {
+            **exec_ctx.global_namespace,
+            _STATEMENT_BOUNDARY_HOOK: statement_boundary,
+        }
+        try:
+            exec(code, global_namespace, exec_ctx.local_namespace)  # noqa: S102
+        except BaseException as err:  # noqa: BLE001
+            if (
+                self._tracer.current_thread_identifier
+                != threading.current_thread().ident
+            ):
+                # This thread has timed out, there is nothing to report.
+                raise
+            _LOGGER.debug(
+                "Failed to execute statement:\n%s%s",
+                ast.unparse(body[2 * position + 1]),
+                err.args,
+            )
+            result.report_new_thrown_exception(position, err)
+
     def _after_test_case_execution_inside_thread(
         self, test_case: tc.TestCase, result: ExecutionResult
     ) -> None:
@@ -2316,9 +2968,7 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Executing %s", ast.unparse(ast_node))
 
-        code = compile(ast_node, "<ast>", "exec")
-        if self._instrument:
-            code = self._checked_transformer.instrument_module(code)
+        code = self._compiled_code_cache.get_code(ast_node, self._instrument)
 
         try:
             exec(  # noqa: S102
@@ -2352,6 +3002,89 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
             self._tracer.enable()
 
 
+def _make_exceptions_picklable(result: ExecutionResult) -> None:
+    """Replace the exceptions of the result that cannot be sent to another process.
+
+    Args:
+        result: The execution result whose exceptions are replaced
+    """
+    for stmt_idx, exception in result.exceptions.items():
+        try:
+            pickle.dumps(exception)
+        except Exception:  # noqa: BLE001, PERF203
+            result.exceptions[stmt_idx] = RuntimeError(
+                f"{type(exception).__name__}: {exception}"
+            )
+
+
+class _TestCaseExecutionWorker:
+    """A thread that executes test cases for a test-case executor.
+
+    Starting a new thread for every execution is costly, thus an executor reuses its
+    worker until an execution times out.  In such a case, the worker is abandoned and
+    killed by the tracer, and the executor starts a new one.
+    """
+
+    def __init__(self, executor: TestCaseExecutor) -> None:
+        """Create and start a new worker.
+
+        Args:
+            executor: The executor whose test cases are executed
+        """
+        # Only keep a weak reference, such that an idle worker does not keep its
+        # executor alive.  The worker is stopped when the executor is collected.
+        self._executor = weakref.ref(executor)
+        self._tasks: SimpleQueue[tc.TestCase | None] = SimpleQueue()
+        self.results: SimpleQueue[ExecutionResult | None] = SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name="TestCaseExecutionWorker", daemon=True
+        )
+        self._thread.start()
+        # The finalizer must not refer to the worker, otherwise it would keep
+        # replaced workers reachable until the executor is collected.
+        self._finalizer = weakref.finalize(executor, self._tasks.put, None)
+
+    @property
+    def thread(self) -> threading.Thread:
+        """Provides the thread of this worker.
+
+        Returns:
+            The thread of this worker
+        """
+        return self._thread
+
+    def submit(self, test_case: tc.TestCase) -> None:
+        """Execute the given test case.
+
+        The result is put into the results queue, or None if the execution failed
+        without providing a result.
+
+        Args:
+            test_case: The test case to execute
+        """
+        self._tasks.put(test_case)
+
+    def stop(self) -> None:
+        """Stop the worker after it finished its current task."""
+        self._finalizer.detach()
+        self._tasks.put(None)
+
+    def _run(self) -> None:
+        while (test_case := self._tasks.get()) is not None:
+            if (executor := self._executor()) is None:
+                return
+            try:
+                executor._execute_test_case(test_case, self.results)
+            except BaseException:
+                # Send to the logger, so timeout related errors are not spilled out
+                # to stderr and clutter our formatted output.
+                _LOGGER.exception("Exception in Thread: %s", self._thread)
+                self.results.put(None)
+                return
+            finally:
+                del executor
+
+
 class TypeTracingTestCaseExecutor(AbstractTestCaseExecutor):
     """A test case executor that delegates to another executor.
 
@@ -2428,12 +3161,8 @@ class TypeTracingObserver(ExecutionObserver):
         self._local_state = TypeTracingObserver.TypeTracingLocalState()
         self._cluster = cluster
 
-    def before_test_case_execution(self, test_case: tc.TestCase):
-        """Not used.
-
-        Args:
-            test_case: Not used
-        """
+    def before_test_case_execution(self, test_case: tc.TestCase):  # noqa: D102
+        self._local_state.proxies = {}
 
     def after_test_case_execution_inside_thread(  # noqa: D102
         self, test_case: tc.TestCase, result: ExecutionResult
@@ -17,14 +17,10 @@ from math import inf
 from typing import TYPE_CHECKING
 from typing import Any
 
-import networkx as nx
-
 import pynguin.ga.computations as ff
 
 
 if TYPE_CHECKING:
-    from pynguin.analyses.controlflow import ControlDependenceGraph
-    from pynguin.analyses.controlflow import ProgramGraphNode
     from pynguin.testcase.execution import ExecutionResult
     from pynguin.testcase.execution import ExecutionTracer
 
@@ -183,53 +179,32 @@ def get_non_root_control_flow_distance(
         distance.branch_distance = branch_distance
         return distance
 
-    cdg = tracer.get_subject_properties().existing_code_objects[code_object_id].cdg
-    target_node = _get_node_with_predicate_id(cdg, predicate_id)
+    code_object = tracer.get_subject_properties().existing_code_objects[code_object_id]
 
     # Choose diameter as upper bound
-    distance.approach_level = (
-        tracer.get_subject_properties()
-        .existing_code_objects[code_object_id]
-        .cfg.diameter
-    )
+    distance.approach_level = code_object.cfg.diameter
 
     # We check for the closest predicate that was executed and compute the approach
     # level as the length of the path from such a predicate node to the desired
     # predicate node.
-    for node in [
-        node
-        for node in cdg.nodes
-        if node.predicate_id is not None
-        and node.predicate_id in trace.executed_predicates
-    ]:
-        try:
-            candidate = ControlFlowDistance()
-            candidate.approach_level = nx.shortest_path_length(
-                cdg.graph, node, target_node
-            )
-            # Predicate was executed but did not lead to execution of desired predicate
-            # So the remaining branch distance to the true or false branch is
-            # the desired distance, right?
-            # One of them has to be zero, so we can simply add them.
-            assert node.predicate_id is not None
-            candidate.branch_distance = _predicate_fitness(
-                node.predicate_id, trace.true_distances
-            ) + _predicate_fitness(node.predicate_id, trace.false_distances)
-            distance = min(distance, candidate)
-        except nx.NetworkXNoPath:  # noqa: PERF203
-            # No path from node to target.
-            pass
+    for node_predicate_id, approach_level in code_object.predicate_distances[
+        predicate_id
+    ].items():
+        if node_predicate_id not in trace.executed_predicates:
+            continue
+        candidate = ControlFlowDistance()
+        candidate.approach_level = approach_level
+        # Predicate was executed but did not lead to execution of desired predicate
+        # So the remaining branch distance to the true or false branch is
+        # the desired distance, right?
+        # One of them has to be zero, so we can simply add them.
+        candidate.branch_distance = _predicate_fitness(
+            node_predicate_id, trace.true_distances
+        ) + _predicate_fitness(node_predicate_id, trace.false_distances)
+        distance = min(distance, candidate)
 
     return distance
 
 
-def _get_node_with_predicate_id(
-    cdg: ControlDependenceGraph, predicate_id: int
-) -> ProgramGraphNode:
-    cdg_nodes = [node for node in cdg.nodes if node.predicate_id == predicate_id]
-    assert len(cdg_nodes) == 1
-    return cdg_nodes.pop()
-
-
 def _predicate_fitness(predicate: int, branch_distances: dict[int, float]) -> float:
     return branch_distances.get(predicate, inf)
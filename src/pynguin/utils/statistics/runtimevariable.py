@@ -116,6 +116,12 @@ class RuntimeVariable(str, enum.Enum):
     # Number of constructors
     NumberOfConstructors = "NumberOfConstructors"
 
+    # Number of statement executions that reused an already instrumented code object
+    CompiledCodeCacheHits = "CompiledCodeCacheHits"
+
+    # Number of statement executions that required instrumenting a code object
+    CompiledCodeCacheMisses = "CompiledCodeCacheMisses"
+
     # ========= Values collected during search =========
 
     # Obtained coverage (of the chosen testing criterion(s)) at different points in time
@@ -4,14 +4,22 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+import timeit
+
+import networkx as nx
 import pytest
 
+from bytecode import Bytecode
+
+from pynguin.analyses.controlflow import CFG
 from pynguin.analyses.controlflow import ControlDependenceGraph
 from pynguin.analyses.controlflow import ControlDependency
+from pynguin.analyses.controlflow import DominatorTree
 from pynguin.analyses.controlflow import ProgramGraphNode
 from pynguin.instrumentation.instrumentation import BranchCoverageInstrumentation
 from pynguin.instrumentation.instrumentation import InstrumentationTransformer
 from pynguin.testcase.execution import ExecutionTracer
+from tests.fixtures.programgraph.statemachine import state_machine
 
 
 def test_integration(small_control_flow_graph):
@@ -84,3 +92,67 @@ def test_get_control_dependencies_asserts(node):
     cdg = list(tracer.get_subject_properties().existing_code_objects.values())[0].cdg
     with pytest.raises(AssertionError):
         cdg.get_control_dependencies(node)
+
+
+def test_predicate_distances():
+    tracer = ExecutionTracer()
+    adapter = BranchCoverageInstrumentation(tracer)
+    transformer = InstrumentationTransformer(tracer, [adapter])
+    transformer.instrument_module(small_fixture.__code__)
+    code_object = list(tracer.get_subject_properties().existing_code_objects.values())[
+        0
+    ]
+    cdg = code_object.cdg
+    nodes = [node for node in cdg.nodes if node.predicate_id is not None]
+    expected = {
+        target.predicate_id: {
+            source.predicate_id: nx.shortest_path_length(cdg.graph, source, target)
+            for source in nodes
+            if nx.has_path(cdg.graph, source, target)
+        }
+        for target in nodes
+    }
+    assert len(expected) == 4
+    assert code_object.predicate_distances == expected
+    assert cdg.compute_predicate_distances() == expected
+
+
+def _traversing_control_dependencies(cfg: CFG) -> set:
+    # The control dependencies as they were computed before the post-dominator
+    # tree was numbered: every CFG edge traverses the post-dominator tree to check
+    # for post-dominance and to find the lowest common ancestor.
+    augmented_cfg = ControlDependenceGraph._create_augmented_graph(cfg)
+    post_dominator_tree = DominatorTree.compute_post_dominator_tree(augmented_cfg)
+    dependencies = set()
+    for source in augmented_cfg.nodes:
+        for target in augmented_cfg.get_successors(source):
+            if source in post_dominator_tree.get_transitive_successors(target):
+                continue
+            least_common_ancestor = post_dominator_tree.get_least_common_ancestor(
+                source, target
+            )
+            current = target
+            while current != least_common_ancestor:
+                dependencies.add((source, current))
+                current = post_dominator_tree.get_predecessors(current).pop()
+            if least_common_ancestor is source:
+                dependencies.add((source, least_common_ancestor))
+    return dependencies
+
+
+@pytest.mark.benchmark
+def test_benchmark_control_dependence_graph():
+    cfg = CFG.from_bytecode(Bytecode.from_code(state_machine(200).__code__))
+    cdg = ControlDependenceGraph.compute(cfg)
+    assert set(cdg.graph.edges) == _traversing_control_dependencies(cfg)
+    new = min(
+        timeit.repeat(lambda: ControlDependenceGraph.compute(cfg), number=1, repeat=3)
+    )
+    traversing = min(
+        timeit.repeat(lambda: _traversing_control_dependencies(cfg), number=1, repeat=3)
+    )
+    print(
+        f"control-dependence graph of {len(cfg.nodes)} nodes: {new:.6f}s, "
+        f"traversing the post-dominator tree {traversing:.6f}s"
+    )
+    assert new < traversing
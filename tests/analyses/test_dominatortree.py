@@ -5,12 +5,17 @@
 #  SPDX-License-Identifier: MIT
 #
 import sys
+import timeit
+
+import networkx as nx
+import pytest
 
 from bytecode import Bytecode
 
 from pynguin.analyses.controlflow import CFG
 from pynguin.analyses.controlflow import DominatorTree
 from tests.fixtures.programgraph.samples import for_loop
+from tests.fixtures.programgraph.statemachine import state_machine
 
 
 def test_integration_post_dominator_tree(conditional_jump_example_bytecode):
@@ -123,3 +128,75 @@ def test_integration_dominator_tree():
     dom_tree = DominatorTree.compute(for_loop_cfg)
     # Every node of the cfg should be in the dominator tree
     assert for_loop_cfg.nodes == dom_tree.nodes
+
+
+def _state_machine(number_of_states: int) -> CFG:
+    machine = state_machine(number_of_states)
+    return CFG.from_bytecode(Bytecode.from_code(machine.__code__))
+
+
+@pytest.mark.parametrize("number_of_states", [1, 5, 50])
+def test_dominator_tree_matches_immediate_dominators(number_of_states):
+    cfg = _state_machine(number_of_states)
+    entry = cfg.entry_node
+    dom_tree = DominatorTree.compute(cfg)
+    expected = {
+        (idom, node)
+        for node, idom in nx.immediate_dominators(cfg.graph, entry).items()
+        if node is not idom
+    }
+    assert set(dom_tree.graph.edges) == expected
+
+
+@pytest.mark.parametrize("number_of_states", [1, 5, 50])
+def test_post_dominator_tree_matches_immediate_dominators(number_of_states):
+    cfg = _state_machine(number_of_states)
+    reversed_cfg = cfg.reversed()
+    post_dom_tree = DominatorTree.compute_post_dominator_tree(cfg)
+    expected = {
+        (idom, node)
+        for node, idom in nx.immediate_dominators(
+            reversed_cfg.graph, reversed_cfg.entry_node
+        ).items()
+        if node is not idom
+    }
+    assert set(post_dom_tree.graph.edges) == expected
+
+
+def _iterative_dominators(cfg: CFG) -> dict:
+    # The iterative data-flow computation of the dominator sets, which was used
+    # before the Cooper-Harvey-Kennedy algorithm.
+    entry = cfg.entry_node
+    nodes = set(cfg.nodes)
+    dominators = {node: set(nodes) for node in nodes}
+    dominators[entry] = {entry}
+    changed = True
+    while changed:
+        changed = False
+        for node in nodes - {entry}:
+            predecessors = cfg.get_predecessors(node)
+            new_dominators = (
+                set.intersection(*(dominators[pred] for pred in predecessors))
+                if predecessors
+                else set()
+            ) | {node}
+            if new_dominators != dominators[node]:
+                dominators[node] = new_dominators
+                changed = True
+    return dominators
+
+
+@pytest.mark.benchmark
+def test_benchmark_post_dominator_tree():
+    reversed_cfg = _state_machine(200).reversed()
+    new = min(
+        timeit.repeat(lambda: DominatorTree.compute(reversed_cfg), number=1, repeat=3)
+    )
+    iterative = min(
+        timeit.repeat(lambda: _iterative_dominators(reversed_cfg), number=1, repeat=3)
+    )
+    print(
+        f"post-dominator tree of {len(reversed_cfg.nodes)} nodes: "
+        f"{new:.6f}s, iterative dominator sets {iterative:.6f}s"
+    )
+    assert new < iterative
@@ -379,6 +379,37 @@ def test_only_any_generator_3(module_test_cluster):
     ) == (OrderedSet([generator, generator2]), False)
 
 
+def test_get_generators_for_memoized(module_test_cluster):
+    typ = module_test_cluster.type_system.convert_type_hint(MagicMock)
+    assert module_test_cluster.get_generators_for(
+        typ
+    ) is module_test_cluster.get_generators_for(typ)
+
+
+def test_get_generators_for_after_add_generator(module_test_cluster):
+    typ = module_test_cluster.type_system.convert_type_hint(MagicMock)
+    assert module_test_cluster.get_generators_for(typ) == (OrderedSet(), True)
+    generator = MagicMock(GenericMethod)
+    generator.generated_type.return_value = typ
+    module_test_cluster.add_generator(generator)
+    assert module_test_cluster.get_generators_for(typ) == (
+        OrderedSet([generator]),
+        False,
+    )
+
+
+def test_get_generators_for_after_update_return_type():
+    cluster = generate_test_cluster("tests.fixtures.cluster.inheritance")
+    from tests.fixtures.cluster.inheritance import Foo
+
+    int_type = cluster.type_system.convert_type_hint(int)
+    assert cluster.get_generators_for(int_type) == (OrderedSet(), True)
+    foo_type = cluster.type_system.convert_type_hint(Foo)
+    constructor = next(iter(cluster.generators[foo_type]))
+    cluster.update_return_type(constructor, int_type)
+    assert cluster.get_generators_for(int_type) == (OrderedSet([constructor]), False)
+
+
 def test_inheritance_modifier():
     cluster = generate_test_cluster("tests.fixtures.cluster.inheritance")
     from tests.fixtures.cluster.inheritance import Bar
@@ -30,6 +30,20 @@ def test_mutate_module():
             adapter, "_build_mutation_controller", mutated
         ) as mock_obj:
             adapter.target_loader = MagicMock()
-            adapter.mutate_module()
+            list(adapter.mutate_module())
             mock_obj.assert_called_once()
             mutated.assert_called_once()
+
+
+def test_mutate_module_is_lazy():
+    adapter = FooAdapter()
+    with mock.patch.object(adapter, "_build_mutation_controller") as build:
+        mutants = adapter.mutate_module()
+        build.assert_not_called()
+        adapter.target_loader = MagicMock()
+        adapter.target_loader.load.return_value = [(MagicMock(__name__="foo"), None)]
+        build.return_value.mutate_module.return_value = iter(
+            [(MagicMock(), []), (MagicMock(), [])]
+        )
+        next(mutants)
+        build.assert_called_once()
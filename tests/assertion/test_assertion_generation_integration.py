@@ -8,6 +8,8 @@ import ast
 import importlib
 import threading
 
+from unittest import mock
+
 import pytest
 
 import pynguin.assertion.assertiongenerator as ag
@@ -264,6 +266,7 @@ def test_mutation_analysis_integration_full(
     module_name = config.configuration.module_name
     tracer = ExecutionTracer()
     tracer.current_thread_identifier = threading.current_thread().ident
+    threads_before = set(threading.enumerate())
     with install_import_hook(module_name, tracer):
         importlib.reload(importlib.import_module(module_name))
         cluster = generate_test_cluster(module_name)
@@ -275,9 +278,8 @@ def test_mutation_analysis_integration_full(
         suite = tsc.TestSuiteChromosome()
         suite.add_test_case_chromosome(chromosome)
 
-        gen = ag.MutationAnalysisAssertionGenerator(
-            TestCaseExecutor(tracer), testing=True
-        )
+        plain_executor = TestCaseExecutor(tracer)
+        gen = ag.MutationAnalysisAssertionGenerator(plain_executor, testing=True)
         suite.accept(gen)
 
         summary = gen._testing_mutation_summary
@@ -301,7 +303,167 @@ def test_mutation_analysis_integration_full(
             )
         )
         assert source == test_case_str_with_assertions
-        for thread in threading.enumerate():
-            if "_execute_test_case" in thread.name:
+        # Only the idle workers of the two executors may still be alive, the
+        # workers of timed out executions must have been killed.
+        idle_workers = {
+            executor._worker.thread
+            for executor in (plain_executor, gen._mutation_executor)
+            if executor._worker is not None
+        }
+        for thread in set(threading.enumerate()) - threads_before - idle_workers:
+            if thread.name == "TestCaseExecutionWorker":
                 thread.join()
-        assert len(threading.enumerate()) == 1  # Only main thread should be alive.
+        assert set(threading.enumerate()) - threads_before == idle_workers
+
+
+@pytest.mark.parametrize("hanging", [False, True])
+def test_mutation_analysis_integration_parallel(hanging):
+    config.configuration.module_name = "tests.fixtures.mutation.mutation"
+    config.configuration.execution.number_of_workers = 2
+    module_name = config.configuration.module_name
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(module_name, tracer):
+        importlib.reload(importlib.import_module(module_name))
+        cluster = generate_test_cluster(module_name)
+        transformer = AstToTestCaseTransformer(cluster, False, EmptyConstantProvider())
+        transformer.visit(
+            ast.parse(
+                "def test_case_0():\n    int_0 = 1\n    float_0 = module_0.foo(int_0)"
+            )
+        )
+        test_case = transformer.testcases[0]
+
+        chromosome = tcc.TestCaseChromosome(test_case)
+        suite = tsc.TestSuiteChromosome()
+        suite.add_test_case_chromosome(chromosome)
+
+        gen = ag.MutationAnalysisAssertionGenerator(
+            TestCaseExecutor(tracer), testing=True
+        )
+        if hanging:
+            # The forked processes never send a result, thus all mutants are
+            # executed here once the time limit of the processes expired.
+            with mock.patch.object(
+                gen,
+                "_execute_mutants_in_forked_process",
+                lambda test_cases, worker_num, connection: threading.Event().wait(),
+            ), mock.patch.object(
+                gen._mutation_executor, "get_execution_time_limit", return_value=1
+            ):
+                suite.accept(gen)
+        else:
+            suite.accept(gen)
+
+        summary = gen._testing_mutation_summary
+        assert [info.mut_num for info in summary.mutant_information] == list(range(5))
+        assert {k.mut_num for k in summary.get_killed()} == {0, 1, 3, 4}
+        assert summary.get_metrics() == ag._MutationMetrics(5, 4, 0)
+        # The mutants are only created in the forked processes, unless these hang.
+        assert len(gen._testing_created_mutants) == (5 if hanging else 0)
+        visitor = tc_to_ast.TestCaseToAstVisitor(ns.NamingScope(prefix="module"), set())
+        test_case.accept(visitor)
+        source = ast.unparse(
+            ast.fix_missing_locations(
+                ast.Module(body=visitor.test_case_ast, type_ignores=[])
+            )
+        )
+        assert source == (
+            "int_0 = 1\nfloat_0 = module_0.foo(int_0)\n"
+            "assert float_0 == pytest.approx(2.0, abs=0.01, rel=0.01)"
+        )
+
+
+@pytest.mark.parametrize(
+    "early_exit,killed_by,executions",
+    [
+        # Mutant 2 is not reached by any test case, thus it is not executed.
+        (False, [[0, 1], [0], [], [0, 1], [0, 1]], 8),
+        # Mutant 1, 3 and 4 are killed by the first test case, whose assertion is
+        # violated by mutant 0 on the second test case.
+        (True, [[0, 1], [0], [], [0], [0]], 5),
+    ],
+)
+def test_mutation_analysis_integration_early_exit(early_exit, killed_by, executions):
+    config.configuration.module_name = "tests.fixtures.mutation.mutation"
+    config.configuration.test_case_output.mutation_early_exit = early_exit
+    module_name = config.configuration.module_name
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(
+        module_name,
+        tracer,
+        {config.CoverageMetric.BRANCH, config.CoverageMetric.LINE},
+    ):
+        importlib.reload(importlib.import_module(module_name))
+        cluster = generate_test_cluster(module_name)
+        transformer = AstToTestCaseTransformer(cluster, False, EmptyConstantProvider())
+        transformer.visit(
+            ast.parse(
+                "def test_case_0():\n    int_0 = 1\n    float_0 = module_0.foo(int_0)\n"
+                "def test_case_1():\n    int_0 = 2\n    float_0 = module_0.foo(int_0)\n"
+            )
+        )
+        suite = tsc.TestSuiteChromosome()
+        for test_case in transformer.testcases:
+            suite.add_test_case_chromosome(tcc.TestCaseChromosome(test_case))
+
+        gen = ag.MutationAnalysisAssertionGenerator(
+            TestCaseExecutor(tracer), testing=True
+        )
+        with mock.patch.object(
+            gen._mutation_executor, "execute", wraps=gen._mutation_executor.execute
+        ) as execute_mock:
+            suite.accept(gen)
+
+        summary = gen._testing_mutation_summary
+        assert [info.killed_by for info in summary.mutant_information] == killed_by
+        assert execute_mock.call_count == executions
+        assert [
+            info.mut_num for info in summary.get_survived_by_non_reachability()
+        ] == [2]
+        for test_case in transformer.testcases:
+            assert len(test_case.statements[-1].assertions) == 1
+
+
+@pytest.mark.parametrize(
+    "filtering_executions,expected_result",
+    [
+        (1, "bool_0 = module_0.every_third_call()\nassert bool_0 is False"),
+        (3, "bool_0 = module_0.every_third_call()"),
+    ],
+)
+def test_filtering_executions_remove_intermittently_failing_assertion(
+    filtering_executions, expected_result
+):
+    config.configuration.module_name = "tests.fixtures.examples.intermittent"
+    module_name = config.configuration.module_name
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(module_name, tracer):
+        importlib.reload(importlib.import_module(module_name))
+        cluster = generate_test_cluster(module_name)
+        transformer = AstToTestCaseTransformer(cluster, False, EmptyConstantProvider())
+        transformer.visit(
+            ast.parse("def test_case_0():\n    bool_0 = module_0.every_third_call()\n")
+        )
+        test_case = transformer.testcases[0]
+        suite = tsc.TestSuiteChromosome()
+        suite.add_test_case_chromosome(tcc.TestCaseChromosome(test_case))
+
+        # The assertion holds in the first filtering execution, thus it is only
+        # removed if the filtering continues although the first one was stable.
+        suite.accept(
+            ag.AssertionGenerator(
+                TestCaseExecutor(tracer), filtering_executions=filtering_executions
+            )
+        )
+
+        visitor = tc_to_ast.TestCaseToAstVisitor(ns.NamingScope(prefix="module"), set())
+        test_case.accept(visitor)
+        source = ast.unparse(
+            ast.fix_missing_locations(
+                ast.Module(body=visitor.test_case_ast, type_ignores=[])
+            )
+        )
+        assert source == expected_result
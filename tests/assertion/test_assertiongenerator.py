@@ -4,9 +4,17 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+from unittest import mock
+from unittest.mock import MagicMock
+
 import pytest
 
+import pynguin.assertion.assertion_trace as at
 import pynguin.assertion.assertiongenerator as ag
+import pynguin.configuration as config
+import pynguin.testcase.execution as ex
+
+from pynguin.utils.orderedset import OrderedSet
 
 
 @pytest.mark.parametrize(
@@ -32,3 +40,123 @@ def test_mutation_score(created, killed, timeout, score):
 )
 def test_compute_metrics(inp, result):
     assert ag._MutationSummary(inp).get_metrics() == result
+
+
+def test_survived_by_non_reachability():
+    summary = ag._MutationSummary(
+        [
+            ag._MutantInfo(0, not_reached=True),
+            ag._MutantInfo(1),
+            ag._MutantInfo(2, [], [0]),
+        ]
+    )
+    assert [info.mut_num for info in summary.get_survived()] == [0, 1]
+    assert [info.mut_num for info in summary.get_survived_by_non_reachability()] == [0]
+
+
+def _filtering_result(failed: bool) -> MagicMock:
+    result = MagicMock(ex.ExecutionResult)
+    result.assertion_verification_trace = at.AssertionVerificationTrace()
+    if failed:
+        result.assertion_verification_trace.failed[0].add(0)
+    return result
+
+
+@pytest.mark.parametrize(
+    "filtering_executions,stable_filtering_executions,failing",
+    [
+        (1, 2, [False]),
+        (1, 2, [True]),
+        (5, 1, [False]),
+        (5, 2, [False, False]),
+        (5, 2, [True, False, False]),
+        (5, 2, [False, True, False, False]),
+        # An assertion that only fails in a later execution is still removed.
+        (3, 2, [False, True, False]),
+        (3, 2, [False, False]),
+        (3, 3, [True, False, True]),
+    ],
+)
+def test_filtering_executions_stop_once_stable(
+    filtering_executions, stable_filtering_executions, failing
+):
+    statement = MagicMock(assertions=OrderedSet(MagicMock() for _ in range(5)))
+    test_case = MagicMock(statements=[statement])
+    executor = MagicMock(ex.TestCaseExecutor)
+    collecting_result = MagicMock(ex.ExecutionResult)
+    collecting_result.assertion_trace = at.AssertionTrace()
+    executor.execute.side_effect = [collecting_result] + [
+        _filtering_result(failed) for failed in failing
+    ]
+    generator = ag.AssertionGenerator(
+        executor,
+        filtering_executions=filtering_executions,
+        stable_filtering_executions=stable_filtering_executions,
+    )
+    generator._add_assertions([test_case])
+    assert executor.execute.call_count == 1 + len(failing)
+    assert len(statement.assertions) == 5 - sum(failing)
+
+
+def _mutant_result(violated: list[int] | None) -> ex.ExecutionResult:
+    # A result that violates the given assertions, or timed out on None.
+    if violated is None:
+        return ex.ExecutionResult(timeout=True)
+    result = ex.ExecutionResult()
+    result.assertion_verification_trace.failed[0].update(violated)
+    return result
+
+
+@pytest.mark.parametrize("early_exit", [False, True])
+@pytest.mark.parametrize(
+    "second_mutant_violates,executions",
+    [
+        # The second mutant violates a new assertion, thus the skipped test case is
+        # executed and the mutant times out on it.
+        ([1], {False: 4, True: 4}),
+        # The second mutant violates no new assertion, thus the traces of the
+        # mutant are ignored without executing the skipped test case.
+        ([0], {False: 4, True: 3}),
+    ],
+)
+def test_mutation_early_exit_timeout_on_skipped_test(
+    early_exit, second_mutant_violates, executions
+):
+    config.configuration.test_case_output.mutation_early_exit = early_exit
+    # The first mutant violates the first assertion of both test cases, the second
+    # one times out on the second test case.
+    outcomes = [
+        [[0], [0]],
+        [second_mutant_violates, None],
+    ]
+    test_cases = [
+        MagicMock(statements=[MagicMock(assertions=[MagicMock(), MagicMock()])]),
+        MagicMock(statements=[MagicMock(assertions=[MagicMock()])]),
+    ]
+    generator = ag.MutationAnalysisAssertionGenerator(MagicMock(), testing=True)
+    generator._traced_lines = {1}
+    generator._covered_lines = {test_case: {1} for test_case in test_cases}
+    # The number of the mutant that is currently executed.
+    current: list[int] = []
+    executor = MagicMock(ex.TestCaseExecutor)
+    executor.module_provider.add_mutated_version.side_effect = (
+        lambda module_name, mutated_module: current.append(mutated_module)
+    )
+    executor.execute.side_effect = lambda test_case: _mutant_result(
+        outcomes[current[-1]][test_cases.index(test_case)]
+    )
+    generator._mutation_executor = executor
+    mutations = [MagicMock(node=MagicMock(lineno=1))]
+    with mock.patch.object(ag.ma, "MutationAdapter") as adapter:
+        adapter.return_value.mutate_module.return_value = [
+            (mut_num, mutations) for mut_num in range(len(outcomes))
+        ]
+        mutant_results = list(generator._execute_mutants(test_cases, lambda _: True))
+
+    assert executor.execute.call_count == executions[early_exit]
+    # Only the traces of the first mutant are used, as without early exit.
+    assert [traces is None for _, traces in mutant_results] == [False, True]
+    assert [dict(trace.failed) for trace in mutant_results[0][1]] == [
+        {0: OrderedSet([0])},
+        {0: OrderedSet([0])},
+    ]
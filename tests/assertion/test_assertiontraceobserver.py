@@ -9,11 +9,16 @@ import ast
 from unittest import mock
 from unittest.mock import MagicMock
 
+import pytest
+
+import pynguin.assertion.assertion as ass
+import pynguin.assertion.assertion_trace as at
 import pynguin.assertion.assertiontraceobserver as ato
 
 from pynguin.testcase.execution import ExecutionContext
 from pynguin.testcase.execution import TestCaseExecutor
 from pynguin.testcase.statement import Statement
+from pynguin.utils.orderedset import OrderedSet
 
 
 class FooObserver(ato.AssertionTraceObserver):
@@ -50,3 +55,54 @@ def test_after_test_case_execution():
         trace_mock.clone.return_value = clone
         observer.after_test_case_execution_inside_thread(MagicMock(), result)
         assert result.assertion_trace == clone
+
+
+def _check(observer, value, ref, position, trace):
+    exec_ctx = MagicMock()
+    exec_ctx.get_reference_value.return_value = value
+    observer._check_reference(exec_ctx, ref, position, trace)
+
+
+def test_unchanged_value_is_not_copied_again():
+    observer = ato.AssertionTraceObserver()
+    ref = MagicMock()
+    trace = at.AssertionTrace()
+    value = [1, 2, 3]
+    _check(observer, value, ref, 0, trace)
+    with mock.patch.object(ato.copy, "deepcopy") as deepcopy_mock:
+        _check(observer, value, ref, 1, trace)
+        deepcopy_mock.assert_not_called()
+    assert trace.get_all_assertions()[1] == OrderedSet(
+        [ass.ObjectAssertion(ref, [1, 2, 3])]
+    )
+
+
+def test_changed_value_is_copied():
+    observer = ato.AssertionTraceObserver()
+    ref = MagicMock()
+    trace = at.AssertionTrace()
+    value = [1, 2, 3]
+    _check(observer, value, ref, 0, trace)
+    value.append(4)
+    _check(observer, value, ref, 1, trace)
+    assertion = next(iter(trace.get_all_assertions()[1]))
+    assert assertion.object == [1, 2, 3, 4]
+    assert assertion.object is not value
+
+
+@pytest.mark.parametrize(
+    "first,second",
+    [
+        ([1], [True]),
+        ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+        ([1], (1,)),
+    ],
+)
+def test_equal_values_of_different_representation_are_copied(first, second):
+    observer = ato.AssertionTraceObserver()
+    ref = MagicMock()
+    trace = at.AssertionTrace()
+    _check(observer, first, ref, 0, trace)
+    _check(observer, second, ref, 1, trace)
+    assertion = next(iter(trace.get_all_assertions()[1]))
+    assert repr(assertion.object) == repr(second)
@@ -0,0 +1,14 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+from itertools import count
+
+
+_calls = count(1)
+
+
+def every_third_call() -> bool:
+    return next(_calls) % 3 == 0
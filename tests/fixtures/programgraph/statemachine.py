@@ -0,0 +1,33 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+from collections.abc import Callable
+
+
+def state_machine(number_of_states: int) -> Callable:
+    """Generates a large function with many branches and a loop.
+
+    Every state is an elif branch with a nested if, thus the control-flow graph
+    has about four nodes per state.
+
+    Args:
+        number_of_states: The number of states of the machine
+
+    Returns:
+        The generated function
+    """
+    lines = ["def machine(state, events):", "    for event in events:"]
+    for state in range(number_of_states):
+        keyword = "if" if state == 0 else "elif"
+        lines.append(f"        {keyword} state == {state}:")
+        lines.append(f"            if event > {state}:")
+        lines.append(f"                state = {(state + 1) % number_of_states}")
+        lines.append("            else:")
+        lines.append(f"                state = {(state * 7) % number_of_states}")
+    lines.append("    return state")
+    namespace: dict = {}
+    exec(compile("\n".join(lines), "<machine>", "exec"), namespace)  # noqa: S102
+    return namespace["machine"]
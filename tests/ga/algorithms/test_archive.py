@@ -10,12 +10,16 @@ from unittest.mock import MagicMock
 import pytest
 
 import pynguin.ga.computations as ff
+import pynguin.ga.coveragegoals as bg
 import pynguin.ga.testcasechromosome as tcc
 
 from pynguin.ga.algorithms.archive import CoverageArchive
 from pynguin.ga.algorithms.archive import MIOArchive
 from pynguin.ga.algorithms.archive import MIOPopulation
 from pynguin.ga.algorithms.archive import MIOPopulationPair
+from pynguin.ga.algorithms.archive import _TargetQueue
+from pynguin.testcase.execution import ExecutionResult
+from pynguin.testcase.execution import ExecutionTrace
 from pynguin.utils.orderedset import OrderedSet
 
 
@@ -73,6 +77,39 @@ def test_update_solution(objectives, chromosomes):
     assert chromosomes[1].get_is_covered.call_count == 4
 
 
+def _line_solution(size: int, line_ids: set[int]) -> tcc.TestCaseChromosome:
+    solution = tcc.TestCaseChromosome(MagicMock(size=MagicMock(return_value=size)))
+    trace = ExecutionTrace()
+    trace.covered_line_ids.update(line_ids)
+    result = ExecutionResult()
+    result.execution_trace = trace
+    solution.set_last_execution_result(result)
+    solution.changed = False
+    return solution
+
+
+def test_update_keyed_objectives_from_trace():
+    objectives = OrderedSet(
+        [
+            bg.LineCoverageTestFitness(MagicMock(), bg.LineCoverageGoal(0, i))
+            for i in range(3)
+        ]
+    )
+    archive = CoverageArchive(objectives)
+    long_solution = _line_solution(5, {0, 1})
+    short_solution = _line_solution(2, {1})
+    with mock.patch.object(tcc.TestCaseChromosome, "get_is_covered") as is_covered:
+        is_covered.return_value = True
+        assert archive.update([long_solution, short_solution])
+        assert archive.solutions == OrderedSet([long_solution, short_solution])
+        # Only the two stored solutions are checked once by the assertion.
+        assert is_covered.call_count == 2
+        assert archive.solutions == OrderedSet([long_solution, short_solution])
+        assert is_covered.call_count == 2
+    assert archive.uncovered_goals == OrderedSet([objectives[2]])
+    assert not archive.update([_line_solution(7, {1})])
+
+
 def test_population_pair():
     pair = MIOPopulationPair(0.5, MagicMock())
     assert pair == pair
@@ -414,3 +451,71 @@ def test_mio_archive_num_covered_targets():
     clone.get_fitness_for.return_value = 0.0
     archive.update([solution])
     assert archive.num_covered_targets == 1
+
+
+def _mio_solution(
+    fitness_values: dict[ff.TestCaseFitnessFunction, float], line_ids: set[int]
+) -> tuple[MagicMock, MagicMock]:
+    solution = MagicMock()
+    clone = MagicMock(changed=False)
+    solution.clone.return_value = clone
+    clone.get_fitness_for.side_effect = fitness_values.__getitem__
+    trace = ExecutionTrace()
+    trace.covered_line_ids.update(line_ids)
+    result = ExecutionResult()
+    result.execution_trace = trace
+    clone.get_last_execution_result.return_value = result
+    return solution, clone
+
+
+def test_mio_archive_update_skips_covered_targets_not_covered_by_trace():
+    targets = [
+        bg.LineCoverageTestFitness(MagicMock(), bg.LineCoverageGoal(0, i))
+        for i in range(2)
+    ]
+    archive = MIOArchive(OrderedSet(targets), 3)
+    first, _ = _mio_solution({targets[0]: 0.0, targets[1]: 1.0}, {0})
+    assert archive.update([first])
+    assert archive.num_covered_targets == 1
+    second, second_clone = _mio_solution({targets[1]: 1.0}, {1})
+    archive.update([second])
+    assert second_clone.get_fitness_for.call_args_list == [mock.call(targets[1])]
+
+
+def test_mio_archive_solutions_updated_on_replacement():
+    fitness = MagicMock()
+    archive = MIOArchive(OrderedSet([fitness]), 3)
+    first, first_clone = _mio_solution({fitness: 0.0}, set())
+    first_clone.size.return_value = 5
+    archive.update([first])
+    assert archive.solutions == OrderedSet([first_clone])
+    second, second_clone = _mio_solution({fitness: 0.0}, set())
+    second_clone.size.return_value = 2
+    archive.update([second])
+    assert archive.solutions == OrderedSet([second_clone])
+
+
+def test_mio_archive_get_solution_lowest_counter():
+    targets = [MagicMock(), MagicMock()]
+    archive = MIOArchive(OrderedSet(targets), 3)
+    solution, _ = _mio_solution({targets[0]: 0.5, targets[1]: 0.5}, set())
+    archive.update([solution])
+    archive.get_solution()
+    archive.get_solution()
+    assert [archive._archive[target].counter for target in targets] == [1, 1]
+
+
+def test_target_queue_samples_lowest_counter():
+    queue = _TargetQueue()
+    targets = [MagicMock() for _ in range(3)]
+    for counter, target in enumerate(targets):
+        queue.add(target, counter)
+    assert len(queue) == 3
+    assert queue.sample() is targets[0]
+    queue.remove(targets[0])
+    assert targets[0] not in queue
+    assert queue.sample() is targets[1]
+    queue.add(targets[1], 5)
+    assert queue.sample() is targets[2]
+    queue.add(targets[1], 0)
+    assert queue.sample() is targets[1]
@@ -15,6 +15,7 @@ import pynguin.ga.coveragegoals as bg
 from pynguin.instrumentation.instrumentation import BranchCoverageInstrumentation
 from pynguin.instrumentation.instrumentation import InstrumentationTransformer
 from pynguin.testcase.execution import ExecutionTracer
+from pynguin.utils.orderedset import OrderedSet
 
 
 @pytest.fixture
@@ -78,3 +79,43 @@ def test_fitness_graph_nested(subject_properties_nested):
         bg.BranchlessCodeObjectGoal(0),
         bg.BranchlessCodeObjectGoal(1),
     }
+
+
+def test_fitness_graph_missing_goal():
+    with pytest.raises(RuntimeError):
+        dyna._BranchFitnessGraph._goal_to_fitness_function(
+            {}, bg.BranchGoal(0, 0, True)
+        )
+
+
+def test_goals_manager_update(subject_properties):
+    pool = bg.BranchGoalPool(subject_properties)
+    ffs = bg.create_branch_coverage_fitness_functions(MagicMock(), pool)
+    by_goal = {ff.goal: ff for ff in ffs}
+    covered_per_update = [
+        [by_goal[bg.BranchGoal(0, 3, True)]],
+        [by_goal[bg.BranchGoal(0, 2, True)]],
+        [],
+    ]
+    callbacks = []
+
+    def update(_):
+        for target in covered_per_update.pop(0):
+            for callback in callbacks:
+                callback(target)
+
+    archive = MagicMock(covered_goals=OrderedSet())
+    archive.add_on_target_covered.side_effect = callbacks.append
+    archive.update.side_effect = update
+    manager = dyna._GoalsManager(ffs, archive, subject_properties)
+    manager.update([])
+    assert [ff.goal for ff in manager.current_goals] == [
+        bg.BranchGoal(0, 1, True),
+        bg.BranchGoal(0, 1, False),
+        bg.BranchGoal(0, 0, True),
+        bg.BranchGoal(0, 0, False),
+        bg.BranchGoal(0, 2, False),
+        bg.BranchGoal(0, 3, False),
+    ]
+    assert archive.update.call_count == 3
+    assert covered_per_update == []
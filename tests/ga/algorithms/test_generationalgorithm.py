@@ -6,6 +6,8 @@
 #
 from unittest.mock import MagicMock
 
+import pynguin.ga.testcasechromosome as tcc
+
 from pynguin.ga import chromosome as chrom
 from pynguin.ga.algorithms.generationalgorithm import GenerationAlgorithm
 from pynguin.ga.stoppingcondition import MaxStatementExecutionsStoppingCondition
@@ -30,3 +32,28 @@ def test_add_search_observer():
     obs = MagicMock()
     strategy.add_search_observer(obs)
     assert strategy._search_observers == [obs]
+
+
+def test_execute_changed_test_cases():
+    strategy = DummyAlgorithm()
+    executor = MagicMock()
+    executor.execute_multiple.side_effect = lambda test_cases: [
+        MagicMock() for _ in test_cases
+    ]
+    strategy.executor = executor
+    changed = tcc.TestCaseChromosome(MagicMock())
+    unchanged = tcc.TestCaseChromosome(MagicMock())
+    unchanged.set_last_execution_result(MagicMock())
+    unchanged.changed = False
+    strategy.execute_changed_test_cases([changed, unchanged])
+    executor.execute_multiple.assert_called_once_with([changed.test_case])
+    assert not changed.changed
+    assert changed.get_last_execution_result() is not None
+
+
+def test_execute_changed_test_cases_nothing_changed():
+    strategy = DummyAlgorithm()
+    executor = MagicMock()
+    strategy.executor = executor
+    strategy.execute_changed_test_cases([])
+    executor.execute_multiple.assert_not_called()
@@ -128,3 +128,48 @@ def test_integrate_whole_suite_plus_archive(module_name: str):
         search_algorithm._logger = logger
         test_cases = search_algorithm.generate_tests()
         assert test_cases.size() >= 0
+
+
+def test_whole_suite_executes_offspring_at_once():
+    module_name = "tests.fixtures.examples.impossible"
+    config.configuration.algorithm = config.Algorithm.WHOLE_SUITE
+    config.configuration.stopping.maximum_iterations = 3
+    config.configuration.module_name = module_name
+    config.configuration.search_algorithm.population = 4
+    config.configuration.test_creation.none_weight = 1
+    config.configuration.test_creation.any_weight = 1
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(module_name, tracer):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+
+        executor = TestCaseExecutor(tracer)
+        cluster = generate_test_cluster(module_name)
+        search_algorithm = gaf.TestSuiteGenerationAlgorithmFactory(
+            executor, cluster
+        ).get_search_algorithm()
+
+        # Record the executions that do not happen as part of a batch.
+        execute = executor.execute
+        execute_multiple = executor.execute_multiple
+        single_executions = []
+        batch_executions = []
+
+        def execute_single(test_case):
+            single_executions.append(test_case)
+            return execute(test_case)
+
+        def execute_batch(test_cases):
+            batch_executions.extend(test_cases)
+            executor.execute = execute
+            try:
+                return execute_multiple(test_cases)
+            finally:
+                executor.execute = execute_single
+
+        executor.execute = execute_single
+        executor.execute_multiple = execute_batch
+        search_algorithm.generate_tests()
+    assert batch_executions
+    assert single_executions == []
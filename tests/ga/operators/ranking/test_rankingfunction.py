@@ -4,6 +4,8 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+import random
+
 from unittest.mock import MagicMock
 
 import pytest
@@ -14,6 +16,9 @@ import pynguin.ga.chromosome as chrom
 from pynguin.ga.operators.ranking import RankBasedPreferenceSorting
 from pynguin.ga.operators.ranking import RankedFronts
 from pynguin.ga.operators.ranking import RankingFunction
+from pynguin.ga.operators.ranking import _fast_non_dominated_sort
+from pynguin.ga.operators.ranking import fast_epsilon_dominance_assignment
+from pynguin.utils.orderedset import OrderedSet
 
 
 @pytest.fixture
@@ -71,3 +76,45 @@ def test_compute_ranking_assignment(ranking_function):
 
     result = ranking_function.compute_ranking_assignment(solutions, set())
     assert result == expected
+
+
+def _dominates(values_1, values_2):
+    return all(v1 <= v2 for v1, v2 in zip(values_1, values_2)) and any(
+        v1 < v2 for v1, v2 in zip(values_1, values_2)
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_fast_non_dominated_sort_matches_repeated_extraction(seed):
+    rng = random.Random(seed)
+    fitness_values = [[float(rng.randint(0, 3)) for _ in range(4)] for _ in range(30)]
+    expected = []
+    remaining = list(range(len(fitness_values)))
+    while remaining:
+        front = [
+            index
+            for index in remaining
+            if not any(
+                _dominates(fitness_values[other], fitness_values[index])
+                for other in remaining
+            )
+        ]
+        expected.append(front)
+        remaining = [index for index in remaining if index not in front]
+    assert list(_fast_non_dominated_sort(fitness_values)) == expected
+
+
+def test_fast_epsilon_dominance_assignment():
+    front = [MagicMock(chrom.Chromosome) for _ in range(4)]
+    fitness_values = [
+        [0.0, 1.0, 0.5],
+        [0.0, 2.0, 0.5],
+        [1.0, 1.0, 0.5],
+        [2.0, 3.0, 0.5],
+    ]
+    for chromosome, values in zip(front, fitness_values):
+        chromosome.get_fitness_values.return_value = values
+    fast_epsilon_dominance_assignment(
+        front, OrderedSet([MagicMock(), MagicMock(), MagicMock()])
+    )
+    assert [chromosome.distance for chromosome in front] == [0.5, 0.5, 0.5, 0]
@@ -120,7 +120,7 @@ def test_test_suite_compute_branch_distance_fitness_values(
     tracer.get_subject_properties.return_value = subject_properties_mock
     executor_mock.tracer.return_value = tracer
     func = ff.BranchDistanceTestSuiteFitnessFunction(executor_mock)
-    indiv = MagicMock()
+    indiv = tsc.TestSuiteChromosome()
     with patch.object(func, "_run_test_suite_chromosome") as run_suite_mock:
         result = ExecutionResult()
         result.execution_trace = trace_mock
@@ -136,7 +136,7 @@ def test_test_suite_compute_statements_covered_fitness_values(
     tracer.get_subject_properties.return_value = subject_properties_mock
     executor_mock.tracer.return_value = tracer
     func = ff.LineTestSuiteFitnessFunction(executor_mock)
-    indiv = MagicMock()
+    indiv = tsc.TestSuiteChromosome()
     with patch.object(func, "_run_test_suite_chromosome") as run_suite_mock:
         result = ExecutionResult()
         result.execution_trace = trace_mock
@@ -152,7 +152,7 @@ def test_test_suite_compute_checked_covered_fitness_values(
     tracer.get_subject_properties.return_value = subject_properties_mock
     executor_mock.tracer.return_value = tracer
     func = ff.StatementCheckedTestSuiteFitnessFunction(executor_mock)
-    indiv = MagicMock()
+    indiv = tsc.TestSuiteChromosome()
     with patch.object(func, "_run_test_suite_chromosome") as run_suite_mock:
         result = ExecutionResult()
         result.execution_trace = trace_mock
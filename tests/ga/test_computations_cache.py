@@ -116,6 +116,23 @@ def test_computation_cache_fitness_compute_order(cache):
     assert func.compute_is_covered.call_count == 1
 
 
+def test_computation_cache_fitness_values(cache):
+    func_1 = MagicMock()
+    func_1.is_maximisation_function.return_value = False
+    func_1.compute_fitness.return_value = 1.0
+    func_2 = MagicMock()
+    func_2.is_maximisation_function.return_value = False
+    func_2.compute_fitness.return_value = 2.0
+    cache.add_fitness_function(func_1)
+    cache.add_fitness_function(func_2)
+    cache._chromosome.changed = False
+
+    assert cache.get_fitness_values([func_2, func_1]) == [2.0, 1.0]
+    assert cache.get_fitness_values([func_1, func_2]) == [1.0, 2.0]
+    assert func_1.compute_fitness.call_count == 1
+    assert func_2.compute_fitness.call_count == 1
+
+
 def test_computation_cache_coverage_cache(cache):
     func = MagicMock()
     func.compute_coverage.return_value = 1
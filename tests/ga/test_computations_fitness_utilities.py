@@ -20,6 +20,7 @@ from hypothesis import given
 
 import pynguin.ga.computations as ff
 
+from pynguin.analyses.controlflow import ProgramGraphNode
 from pynguin.instrumentation.instrumentation import PredicateMetaData
 from pynguin.slicer.dynamicslicer import AssertionSlicer
 from pynguin.slicer.dynamicslicer import DynamicSlicer
@@ -118,6 +119,58 @@ def test_fitness_normalized(trace_mock, subject_properties_mock):
     )
 
 
+def _branch_fitness(predicate, branch_distances, trace):
+    if predicate in branch_distances and branch_distances[predicate] == 0.0:
+        return 0.0
+    if trace.executed_predicates.get(predicate, 0) >= 2:
+        return ff.normalise(branch_distances[predicate])
+    return 1.0
+
+
+@given(
+    st.lists(
+        st.tuples(
+            st.integers(min_value=0, max_value=3),
+            st.sampled_from([0.0, 0.1, 1.0, 3.7, float("inf")]),
+            st.sampled_from([0.0, 0.3, 2.0, 1e-9]),
+            st.booleans(),
+            st.booleans(),
+        ),
+        max_size=30,
+    )
+)
+def test_fitness_equals_sum_of_branch_fitness(predicates):
+    trace = ExecutionTrace()
+    subject_properties = SubjectProperties()
+    exclude_true, exclude_false = set(), set()
+    for predicate, (executions, true, false, no_true, no_false) in enumerate(
+        predicates
+    ):
+        subject_properties.existing_predicates[predicate] = PredicateMetaData(
+            line_no=predicate, code_object_id=0, node=ProgramGraphNode(predicate)
+        )
+        if executions > 0:
+            trace.executed_predicates[predicate] = executions
+            trace.true_distances[predicate] = true
+            trace.false_distances[predicate] = false
+        if no_true:
+            exclude_true.add(predicate)
+        if no_false:
+            exclude_false.add(predicate)
+    expected = 0.0
+    for predicate in subject_properties.existing_predicates:
+        if predicate not in exclude_true:
+            expected += _branch_fitness(predicate, trace.true_distances, trace)
+        if predicate not in exclude_false:
+            expected += _branch_fitness(predicate, trace.false_distances, trace)
+    assert (
+        ff.compute_branch_distance_fitness(
+            trace, subject_properties, set(), exclude_true, exclude_false
+        )
+        == expected
+    )
+
+
 def test_branch_coverage_none(subject_properties_mock, trace_mock):
     assert ff.compute_branch_coverage(trace_mock, subject_properties_mock) == 1.0
 
@@ -225,8 +278,8 @@ def test_assertion_checked_coverage_half_covered(subject_properties_mock, trace_
     mock_instr_1.lineno = 0
     mock_instr_1.code_object_id = 0
     mock_instr_1.file = "foo"
-    with patch.object(AssertionSlicer, "slice_assertion") as slice_mock:
-        slice_mock.return_value = [mock_instr_1]
+    with patch.object(AssertionSlicer, "slice_assertions") as slice_mock:
+        slice_mock.return_value = [[mock_instr_1]]
         assert (
             ff.compute_assertion_checked_coverage(trace_mock, subject_properties_mock)
             == 0.5
@@ -248,8 +301,8 @@ def test_assertion_checked_coverage_fully_covered(subject_properties_mock, trace
     mock_instr_2.lineno = 1
     mock_instr_2.code_object_id = 0
     mock_instr_2.file = "foo"
-    with patch.object(AssertionSlicer, "slice_assertion") as slice_mock:
-        slice_mock.return_value = [mock_instr_1, mock_instr_2]
+    with patch.object(AssertionSlicer, "slice_assertions") as slice_mock:
+        slice_mock.return_value = [[mock_instr_1, mock_instr_2]]
         assert (
             ff.compute_assertion_checked_coverage(trace_mock, subject_properties_mock)
             == 1
@@ -274,10 +327,10 @@ def test_statement_checked_coverage_half_covered(subject_properties_mock, trace_
     mock_instr_1.file = "foo"
     statement = MagicMock()
     statements = [statement]
-    with patch.object(DynamicSlicer, "slice") as slice_mock:
+    with patch.object(DynamicSlicer, "slice_criteria") as slice_mock:
         with patch.object(statement, "get_position") as position_mock:
             position_mock.return_value = 1
-            slice_mock.return_value = [mock_instr_1]
+            slice_mock.return_value = [[mock_instr_1]]
             assert ff.compute_statement_checked_lines(
                 statements, trace_mock, subject_properties_mock, {1: MagicMock()}
             ) == {0}
@@ -299,10 +352,10 @@ def test_statement_checked_coverage_fully_covered(subject_properties_mock, trace
 
     statement = MagicMock()
     statements = [statement]
-    with patch.object(DynamicSlicer, "slice") as slice_mock:
+    with patch.object(DynamicSlicer, "slice_criteria") as slice_mock:
         with patch.object(statement, "get_position") as position_mock:
             position_mock.return_value = 1
-            slice_mock.return_value = [mock_instr_1, mock_instr_2]
+            slice_mock.return_value = [[mock_instr_1, mock_instr_2]]
             assert ff.compute_statement_checked_lines(
                 statements, trace_mock, subject_properties_mock, {1: MagicMock()}
             ) == {0, 1}
@@ -395,3 +395,40 @@ def _get_empty_test() -> tcc.TestCaseChromosome:
     cluster = ModuleTestCluster(0)
     test_case = dtc.DefaultTestCase(cluster)
     return tcc.TestCaseChromosome(test_case=test_case)
+
+
+def test_compute_covered_goal_keys_agrees_with_is_covered():
+    trace = ExecutionTrace()
+    trace.executed_code_objects.add(0)
+    trace.covered_line_ids.add(3)
+    trace.checked_lines.add(4)
+    trace.update_predicate_distances(0.0, 1.0, 1)
+    trace.update_predicate_distances(2.0, 0.0, 2)
+    result = ExecutionResult()
+    result.execution_trace = trace
+    goals = [
+        bg.BranchlessCodeObjectGoal(0),
+        bg.BranchlessCodeObjectGoal(1),
+        bg.LineCoverageGoal(0, 3),
+        bg.LineCoverageGoal(0, 4),
+        bg.CheckedCoverageGoal(0, 3),
+        bg.CheckedCoverageGoal(0, 4),
+        bg.BranchGoal(0, 1, True),
+        bg.BranchGoal(0, 1, False),
+        bg.BranchGoal(0, 2, True),
+        bg.BranchGoal(0, 2, False),
+        bg.BranchGoal(0, 3, True),
+    ]
+    keys = bg.compute_covered_goal_keys(trace)
+    for goal in goals:
+        assert (goal.coverage_key in keys) == goal.is_covered(result)
+
+
+def test_get_coverage_key():
+    goal = bg.LineCoverageGoal(0, 3)
+    fitness = bg.LineCoverageTestFitness(MagicMock(), goal)
+    assert bg.get_coverage_key(fitness) == goal.coverage_key
+
+
+def test_get_coverage_key_unknown_fitness_function():
+    assert bg.get_coverage_key(MagicMock()) is None
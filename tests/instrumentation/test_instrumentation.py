@@ -4,6 +4,7 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+import dis
 import importlib
 import os
 import threading
@@ -470,6 +471,48 @@ def test_multiple_instrumentations_share_code_object_ids(simple_module):
     assert OrderedSet([0]) == tracer.get_trace().executed_code_objects
 
 
+def test_code_object_meta_data_lookups(simple_module):
+    tracer = ExecutionTracer()
+    transformer = InstrumentationTransformer(
+        tracer, [CheckedCoverageInstrumentation(tracer)]
+    )
+    transformer.instrument_module(simple_module.for_loop.__code__)
+    code_meta = tracer.get_subject_properties().existing_code_objects[0]
+
+    for node in code_meta.original_cfg.nodes:
+        assert code_meta.get_original_cfg_node(node.index) is node
+    for node in code_meta.cdg.nodes:
+        assert code_meta.get_cdg_node(node.index) is node
+    assert code_meta.get_original_cfg_node(4711) is None
+
+    for dis_instr in dis.get_instructions(code_meta.code_object):
+        assert (
+            code_meta.get_disassembled_instruction(dis_instr.opcode, dis_instr.offset)
+            == dis_instr
+        )
+    assert code_meta.get_disassembled_instruction(op.NOP, 4711) is None
+
+
+def test_disassembled_instruction_without_extended_args():
+    tracer = ExecutionTracer()
+    transformer = InstrumentationTransformer(tracer, [])
+    # Jumping over many instructions requires an EXTENDED_ARG instruction
+    source = "if x:\n" + "    y = 1\n" * 300
+    transformer.instrument_module(compile(source, "<test>", "exec"))
+    code_meta = tracer.get_subject_properties().existing_code_objects[0]
+
+    dis_instrs = list(dis.get_instructions(code_meta.code_object))
+    assert dis_instrs[0].opcode == op.LOAD_NAME
+    assert dis_instrs[1].opcode == op.EXTENDED_ARG
+    # The offsets after the EXTENDED_ARG instruction are shifted by two
+    assert (
+        code_meta.get_disassembled_instruction(dis_instrs[2].opcode, 2) == dis_instrs[2]
+    )
+    assert (
+        code_meta.get_disassembled_instruction(dis_instrs[3].opcode, 4) == dis_instrs[3]
+    )
+
+
 def test_exception_no_match_integrate():
     tracer = ExecutionTracer()
 
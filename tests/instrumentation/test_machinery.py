@@ -8,6 +8,14 @@ import asyncio
 import importlib
 import threading
 
+from pathlib import Path
+from unittest import mock
+
+import pynguin.configuration as config
+import pynguin.instrumentation.machinery as machinery
+
+from pynguin.instrumentation.instrumentation import InstrumentationTransformer
+from pynguin.instrumentation.machinery import InstrumentationCache
 from pynguin.instrumentation.machinery import install_import_hook
 from pynguin.testcase.execution import ExecutionTracer
 
@@ -47,3 +55,89 @@ async def run_async_generator(gen):
     async for i in gen:
         the_sum += i
     return the_sum
+
+
+def _run_mixed(tracer, cache_dir):
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(
+        "tests.fixtures.instrumentation.mixed",
+        tracer,
+        instrumentation_cache_dir=str(cache_dir),
+    ):
+        mixed = importlib.import_module("tests.fixtures.instrumentation.mixed")
+        mixed = importlib.reload(mixed)
+        assert mixed.function(6) == 0
+        inst = mixed.TestClass(5)
+        inst.method(5)
+
+
+def test_instrumentation_cache(tmp_path):
+    first_tracer = ExecutionTracer()
+    _run_mixed(first_tracer, tmp_path)
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+    second_tracer = ExecutionTracer()
+    with mock.patch.object(
+        InstrumentationTransformer, "instrument_module"
+    ) as instrument_mock:
+        _run_mixed(second_tracer, tmp_path)
+        instrument_mock.assert_not_called()
+
+    first = first_tracer.get_subject_properties()
+    second = second_tracer.get_subject_properties()
+    assert second is not first
+    assert second.existing_code_objects.keys() == first.existing_code_objects.keys()
+    assert second.existing_predicates.keys() == first.existing_predicates.keys()
+    assert second.existing_lines == first.existing_lines
+    # The cached code reports to the new tracer.
+    assert (
+        second_tracer.get_trace().executed_code_objects
+        == first_tracer.get_trace().executed_code_objects
+    )
+    assert (
+        second_tracer.get_trace().true_distances
+        == first_tracer.get_trace().true_distances
+    )
+
+
+def test_instrumentation_cache_key_contains_metrics(tmp_path):
+    tracer = ExecutionTracer()
+    branch = InstrumentationCache(tmp_path, tracer, {config.CoverageMetric.BRANCH})
+    line = InstrumentationCache(tmp_path, tracer, {config.CoverageMetric.LINE})
+    assert branch._key("foo.py", b"") != line._key("foo.py", b"")
+    assert branch._key("foo.py", b"") != branch._key("foo.py", b"pass")
+    assert branch._key("foo.py", b"") != branch._key("bar.py", b"")
+
+
+def test_instrumentation_cache_key_contains_format_version(tmp_path):
+    cache = InstrumentationCache(
+        tmp_path, ExecutionTracer(), {config.CoverageMetric.BRANCH}
+    )
+    key = cache._key("foo.py", b"")
+    with mock.patch.object(
+        machinery, "_CACHE_FORMAT_VERSION", machinery._CACHE_FORMAT_VERSION + 1
+    ):
+        assert cache._key("foo.py", b"") != key
+
+
+def test_instrumentation_cache_corrupt_entry(tmp_path):
+    cache = InstrumentationCache(
+        tmp_path, ExecutionTracer(), {config.CoverageMetric.BRANCH}
+    )
+    cache._entry("foo.py", b"").write_bytes(b"garbage")
+    assert cache.load("foo.py", b"") is None
+
+
+def test_instrumentation_cache_unwritable_dir(tmp_path):
+    # A path component of the cache directory is a file.
+    (tmp_path / "file").touch()
+    _run_mixed(ExecutionTracer(), tmp_path / "file" / "cache")
+
+
+def test_instrumentation_cache_failed_replace(tmp_path):
+    cache = InstrumentationCache(
+        tmp_path, ExecutionTracer(), {config.CoverageMetric.BRANCH}
+    )
+    with mock.patch.object(Path, "replace", side_effect=OSError):
+        cache.store("foo.py", b"", compile("", "foo.py", "exec"))
+    assert list(tmp_path.iterdir()) == []
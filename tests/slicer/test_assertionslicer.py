@@ -339,6 +339,48 @@ def test_slicing_after_test_execution(
         assert checked_lines == expected_lines
 
 
+@pytest.mark.parametrize(
+    "module_name, test_case_name",
+    [
+        ("tests.fixtures.linecoverage.plus", "plus_test_with_multiple_assertions"),
+        ("tests.fixtures.linecoverage.plus", "full_cover_plus_three_test"),
+        ("tests.fixtures.linecoverage.list", "list_test_with_len_assertion"),
+    ],
+)
+def test_slice_assertions_in_single_pass(module_name, test_case_name, request):
+    test_case = request.getfixturevalue(test_case_name)
+    config.configuration.statistics_output.coverage_metrics = [
+        config.CoverageMetric.CHECKED
+    ]
+
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+
+    with install_import_hook(module_name, tracer):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+
+        executor = TestCaseExecutor(tracer)
+        executor.add_observer(AssertionExecutionObserver(tracer))
+        result = executor.execute(test_case)
+        assertions = result.execution_trace.executed_assertions
+        assert assertions
+
+        assertion_slicer = AssertionSlicer(
+            tracer.get_subject_properties().existing_code_objects
+        )
+        slices = assertion_slicer.slice_assertions(assertions, result.execution_trace)
+        assert len(slices) == len(assertions)
+        for assertion, assertion_slice in zip(assertions, slices):
+            expected = assertion_slicer.slice_assertion(
+                assertion, result.execution_trace
+            )
+            assert assertion_slice == expected
+            assert [instr.in_slice for instr in assertion_slice] == [
+                instr.in_slice for instr in expected
+            ]
+
+
 @pytest.mark.parametrize(
     "module_name, test_suite_name, expected_coverage",
     [
@@ -27,6 +27,8 @@ from pynguin.instrumentation.machinery import install_import_hook
 from pynguin.slicer.dynamicslicer import DynamicSlicer
 from pynguin.slicer.statementslicingobserver import StatementSlicingObserver
 from pynguin.testcase.execution import ExecutionTracer
+from pynguin.testcase.execution import LineMetaData
+from pynguin.testcase.execution import SubjectProperties
 from pynguin.testcase.execution import TestCaseExecutor
 from pynguin.testcase.statement import MethodStatement
 from pynguin.utils.generic.genericaccessibleobject import GenericMethod
@@ -314,13 +316,9 @@ def test_get_line_id_by_instruction_throws_error():
         file="foo",
         lineno=1,
     )
-    subject_properties_mock = MagicMock(
+    subject_properties_mock = SubjectProperties(
         existing_lines={
-            0: MagicMock(
-                code_object_id=0,
-                file="foo",
-                lineno=2,
-            )
+            0: LineMetaData(code_object_id=0, file_name="foo", line_number=2)
         }
     )
 
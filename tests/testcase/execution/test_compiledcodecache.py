@@ -0,0 +1,140 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import ast
+import threading
+import timeit
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from pynguin.instrumentation.instrumentation import CheckedCoverageInstrumentation
+from pynguin.instrumentation.instrumentation import InstrumentationTransformer
+from pynguin.testcase.execution import CompiledCodeCache
+from pynguin.testcase.execution import ExecutionTracer
+from pynguin.testcase.execution import TestCaseExecutor
+
+
+@pytest.fixture
+def tracer():
+    return ExecutionTracer()
+
+
+@pytest.fixture
+def cache(tracer):
+    transformer = InstrumentationTransformer(
+        tracer, [CheckedCoverageInstrumentation(tracer)]
+    )
+    return CompiledCodeCache(tracer, transformer, maximum_size=2)
+
+
+def _module(source: str) -> ast.Module:
+    return ast.parse(source)
+
+
+def test_hit(cache):
+    first = cache.get_code(_module("var_0 = 42"), True)
+    second = cache.get_code(_module("var_0 = 42"), True)
+    assert first is second
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_different_names_miss(cache):
+    first = cache.get_code(_module("var_0 = 42"), True)
+    second = cache.get_code(_module("var_1 = 42"), True)
+    assert first is not second
+    assert cache.misses == 2
+
+
+def test_different_constant_types_miss(cache):
+    first = cache.get_code(_module("var_0 = 1"), True)
+    second = cache.get_code(_module("var_0 = 1.0"), True)
+    assert first is not second
+
+
+def test_eviction(cache):
+    cache.get_code(_module("var_0 = 1"), True)
+    cache.get_code(_module("var_0 = 2"), True)
+    cache.get_code(_module("var_0 = 1"), True)
+    cache.get_code(_module("var_0 = 3"), True)
+    assert len(cache) == 2
+    cache.get_code(_module("var_0 = 1"), True)
+    assert cache.hits == 2
+
+
+def test_instrumented_registers_once(cache, tracer):
+    cache.get_code(_module("var_0 = 42"), True)
+    cache.get_code(_module("var_0 = 42"), True)
+    assert len(tracer.get_subject_properties().existing_code_objects) == 1
+
+
+def test_plain_not_cached(cache):
+    first = cache.get_code(_module("var_0 = 42"), False)
+    second = cache.get_code(_module("var_0 = 42"), False)
+    assert first is not second
+    assert len(cache) == 0
+    assert cache.misses == 0
+
+
+def test_instrumented_and_plain_differ(cache):
+    plain = cache.get_code(_module("var_0 = 42"), False)
+    instrumented = cache.get_code(_module("var_0 = 42"), True)
+    assert plain is not instrumented
+
+
+def test_reset_invalidates(cache, tracer):
+    cache.get_code(_module("var_0 = 42"), True)
+    tracer.reset()
+    cache.get_code(_module("var_0 = 42"), True)
+    assert cache.misses == 2
+    assert len(tracer.get_subject_properties().existing_code_objects) == 1
+
+
+def test_clear(cache):
+    cache.get_code(_module("var_0 = 42"), True)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_executor_reuses_compiled_statements(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer, whole_test_case_execution=False)
+    executor.set_instrument(True)
+    executor.execute(short_test_case)
+    executor.execute(short_test_case)
+    assert executor.compiled_code_cache.misses == 2
+    assert executor.compiled_code_cache.hits == 2
+
+
+def test_executor_with_mocked_tracer(short_test_case):
+    executor = TestCaseExecutor(MagicMock(ExecutionTracer))
+    assert len(executor.compiled_code_cache) == 0
+
+
+@pytest.mark.benchmark
+def test_benchmark_instrumented_hit(cache, tracer):
+    node = ast.fix_missing_locations(
+        _module(
+            "\n".join(f"var_{i} = module_0.Foo(var_{i - 1}, {i})" for i in range(1, 30))
+        )
+    )
+    transformer = InstrumentationTransformer(
+        tracer, [CheckedCoverageInstrumentation(tracer)]
+    )
+    cache.get_code(node, True)
+    cached = min(timeit.repeat(lambda: cache.get_code(node, True), number=5, repeat=5))
+    uncached = min(
+        timeit.repeat(
+            lambda: transformer.instrument_module(compile(node, "<ast>", "exec")),
+            number=5,
+            repeat=5,
+        )
+    )
+    print(f"instrumented: cached {cached / 5:.6f}s, uncached {uncached / 5:.6f}s")
+    assert cached < uncached
@@ -4,8 +4,17 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+import pickle
 
+import pytest
+
+from pynguin.slicer.executedinstruction import ExecutedAttributeInstruction
+from pynguin.slicer.executedinstruction import ExecutedCallInstruction
+from pynguin.slicer.executedinstruction import ExecutedControlInstruction
 from pynguin.slicer.executedinstruction import ExecutedInstruction
+from pynguin.slicer.executedinstruction import ExecutedInstructionTrace
+from pynguin.slicer.executedinstruction import ExecutedMemoryInstruction
+from pynguin.slicer.executedinstruction import ExecutedReturnInstruction
 
 
 def test_instruction_equal():
@@ -24,3 +33,76 @@ def test_instruction_equal():
     )
 
     assert instr1 == instr2
+
+
+@pytest.fixture
+def instructions():
+    return [
+        ExecutedInstruction("foo", 0, 1, 100, None, 3, 4),
+        ExecutedMemoryInstruction("foo", 0, 1, 90, "var", 3, 6, 1234, True, False),
+        ExecutedMemoryInstruction("foo", 0, 1, 108, None, None, 8, None, False, True),
+        ExecutedAttributeInstruction("bar", 1, 2, 106, "attr", 5, 2, 42, -1, False),
+        ExecutedAttributeInstruction("bar", 1, 2, 106, "None", 5, 4, 42, None, True),
+        ExecutedControlInstruction("bar", 1, 2, 115, 7, 6, 10),
+        ExecutedCallInstruction("bar", 1, 3, 161, 2, 7, 12),
+        ExecutedReturnInstruction("foo", 0, 1, 83, None, 8, 14),
+    ]
+
+
+def test_instruction_trace_materialises_instructions(instructions):
+    trace = ExecutedInstructionTrace(instructions)
+    assert len(trace) == len(instructions)
+    assert list(trace) == instructions
+    assert list(reversed(trace)) == instructions[::-1]
+    assert trace[-1] == instructions[-1]
+    assert trace[2:4] == instructions[2:4]
+    assert trace == instructions
+
+
+def test_instruction_trace_columns(instructions):
+    trace = ExecutedInstructionTrace(instructions)
+    assert list(trace.opcodes) == [instr.opcode for instr in instructions]
+    assert list(trace.code_object_ids) == [
+        instr.code_object_id for instr in instructions
+    ]
+    assert list(trace.node_ids) == [instr.node_id for instr in instructions]
+    assert list(trace.offsets) == [instr.offset for instr in instructions]
+    assert trace.get_file(3) == "bar"
+
+
+def test_instruction_trace_accessors(instructions):
+    trace = ExecutedInstructionTrace(instructions)
+    assert [trace.get_argument(i) for i in range(len(trace))] == [
+        instr.argument for instr in instructions
+    ]
+    assert [trace.get_lineno(i) for i in range(len(trace))] == [
+        instr.lineno for instr in instructions
+    ]
+    assert [trace.is_jump(i) for i in range(len(trace))] == [
+        instr.is_jump() for instr in instructions
+    ]
+
+
+def test_instruction_trace_extend_translates_strings(instructions):
+    trace = ExecutedInstructionTrace(instructions[3:])
+    trace.extend(ExecutedInstructionTrace(instructions))
+    assert trace == instructions[3:] + instructions
+
+
+def test_instruction_trace_extend_concatenates(instructions):
+    trace = ExecutedInstructionTrace()
+    trace.extend(ExecutedInstructionTrace(instructions))
+    trace.extend(ExecutedInstructionTrace(instructions[:2]))
+    assert trace == instructions + instructions[:2]
+
+
+def test_instruction_trace_pickle(instructions):
+    trace = ExecutedInstructionTrace(instructions)
+    assert pickle.loads(pickle.dumps(trace)) == trace  # noqa: S301
+
+
+def test_instruction_trace_not_equal(instructions):
+    trace = ExecutedInstructionTrace(instructions)
+    assert trace != instructions[1:]
+    assert trace != ExecutedInstructionTrace(instructions[::-1])
+    assert trace != 42
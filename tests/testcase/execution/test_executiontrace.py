@@ -4,11 +4,16 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+import random
+
 from unittest.mock import MagicMock
 
+import pytest
+
 from pynguin.slicer.executedinstruction import ExecutedInstruction
 from pynguin.testcase.execution import ExecutedAssertion
 from pynguin.testcase.execution import ExecutionTrace
+from pynguin.testcase.execution import MergedExecutionTrace
 
 
 def test_merge():
@@ -82,3 +87,65 @@ def test_merge_min():
     dict1 = {0: 0.3, 1: 0.6}
     ExecutionTrace._merge_min(dict0, dict1)
     assert dict0 == {0: 0.3, 1: 0.2}
+
+
+def _random_trace(rng: random.Random) -> ExecutionTrace:
+    trace = ExecutionTrace()
+    for code_object_id in rng.sample(range(5), rng.randint(0, 3)):
+        trace.executed_code_objects.add(code_object_id)
+    for predicate in rng.sample(range(6), rng.randint(0, 4)):
+        trace.update_predicate_distances(
+            rng.choice([0.0, 1.0, 2.0]), rng.choice([0.0, 1.0, 2.0]), predicate
+        )
+    for line_id in rng.sample(range(8), rng.randint(0, 5)):
+        trace.covered_line_ids.add(line_id)
+    for line_id in rng.sample(range(8), rng.randint(0, 2)):
+        trace.checked_lines.add(line_id)
+    return trace
+
+
+def _assert_merged_equals(merged: ExecutionTrace, traces: list[ExecutionTrace]):
+    expected = ExecutionTrace()
+    for trace in traces:
+        expected.merge(trace)
+    assert set(merged.executed_code_objects) == set(expected.executed_code_objects)
+    assert merged.executed_predicates == expected.executed_predicates
+    assert merged.true_distances == expected.true_distances
+    assert merged.false_distances == expected.false_distances
+    assert set(merged.covered_line_ids) == set(expected.covered_line_ids)
+    assert set(merged.checked_lines) == set(expected.checked_lines)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_merged_execution_trace_matches_merge(seed):
+    rng = random.Random(seed)
+    merged = MergedExecutionTrace()
+    suite = [_random_trace(rng) for _ in range(4)]
+    for _ in range(30):
+        choice = rng.random()
+        if choice < 0.3 and suite:
+            suite.pop(rng.randrange(len(suite)))
+        elif choice < 0.6 and suite:
+            suite[rng.randrange(len(suite))] = _random_trace(rng)
+        elif choice < 0.8:
+            suite.append(_random_trace(rng))
+        elif suite:
+            # The same trace may be part of a suite multiple times.
+            suite.append(rng.choice(suite))
+        _assert_merged_equals(merged.update(suite), suite)
+
+
+def test_merged_execution_trace_clone_is_independent():
+    trace0 = ExecutionTrace()
+    trace0.update_predicate_distances(0.0, 1.0, 0)
+    trace1 = ExecutionTrace()
+    trace1.update_predicate_distances(1.0, 0.0, 0)
+    merged = MergedExecutionTrace()
+    merged.update([trace0, trace1])
+    clone = merged.clone()
+    _assert_merged_equals(clone.update([trace1]), [trace1])
+    _assert_merged_equals(merged.update([trace0, trace1]), [trace0, trace1])
+
+
+def test_merged_execution_trace_empty():
+    assert MergedExecutionTrace().update([]) == ExecutionTrace()
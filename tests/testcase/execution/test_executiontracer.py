@@ -4,6 +4,7 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+import pickle
 import threading
 
 from decimal import Decimal
@@ -17,6 +18,8 @@ import pynguin.utils.typetracing as tt
 from pynguin.instrumentation.instrumentation import CodeObjectMetaData
 from pynguin.instrumentation.instrumentation import PynguinCompare
 from pynguin.testcase.execution import ExecutionTracer
+from pynguin.testcase.execution import LineMetaData
+from pynguin.testcase.execution import SubjectProperties
 from pynguin.testcase.execution import _le
 from pynguin.testcase.execution import _lt
 from pynguin.utils.orderedset import OrderedSet
@@ -53,6 +56,33 @@ def test_line_registration():
     assert {0, 1, 2} == tracer.get_subject_properties().existing_lines.keys()
 
 
+def test_line_registration_index():
+    tracer = ExecutionTracer()
+    tracer.register_line(0, "foo", 42)
+    tracer.register_line(0, "foo", 43)
+    tracer.register_line(1, "foo", 42)
+    subject_properties = tracer.get_subject_properties()
+    assert subject_properties.get_line_id(LineMetaData(0, "foo", 42)) == 0
+    assert subject_properties.get_line_id(LineMetaData(0, "foo", 43)) == 1
+    assert len(subject_properties.existing_lines) == 2
+
+
+def test_subject_properties_line_id_of_set_lines():
+    subject_properties = SubjectProperties()
+    subject_properties.existing_lines = {3: LineMetaData(0, "foo", 42)}
+    assert subject_properties.get_line_id(LineMetaData(1, "foo", 42)) == 3
+    assert subject_properties.get_line_id(LineMetaData(0, "foo", 43)) is None
+
+
+def test_subject_properties_line_id_of_unpickled_lines():
+    subject_properties = SubjectProperties()
+    subject_properties.register_line(LineMetaData(0, "foo", 42))
+    unpickled = pickle.loads(pickle.dumps(subject_properties))
+    assert unpickled == subject_properties
+    assert unpickled.get_line_id(LineMetaData(0, "foo", 42)) == 0
+    assert unpickled.register_line(LineMetaData(0, "foo", 43)) == 1
+
+
 def test_line_visit():
     tracer = ExecutionTracer()
     tracer.current_thread_identifier = threading.current_thread().ident
@@ -403,3 +433,56 @@ def test_killed_by_thread_guard(method, inputs):
     tracer.current_thread_identifier = threading.current_thread().ident + 1
     with pytest.raises(RuntimeError):
         getattr(tracer, method)(*inputs)
+
+
+class _Base:
+    @property
+    def prop(self):
+        return 42
+
+
+class _Derived(_Base):
+    attr = 1
+
+    def __init__(self):
+        self.field = 2
+
+
+@pytest.mark.parametrize(
+    "attribute, owner",
+    [
+        ("prop", _Base),
+        ("attr", _Derived),
+        ("__init__", _Derived),
+        ("__eq__", object),
+    ],
+)
+def test_attribute_lookup_class(attribute, owner):
+    assert ExecutionTracer.attribute_lookup(_Derived(), attribute) == id(owner)
+
+
+def test_attribute_lookup_instance():
+    obj = _Derived()
+    assert ExecutionTracer.attribute_lookup(obj, "field") == id(obj)
+
+
+def test_attribute_lookup_unknown():
+    assert ExecutionTracer.attribute_lookup(_Derived(), "unknown") == -1
+
+
+def test_attribute_lookup_class_dict_changes():
+    class Foo(_Derived):
+        pass
+
+    obj = Foo()
+    assert ExecutionTracer.attribute_lookup(obj, "prop") == id(_Base)
+    Foo.prop = property(lambda self: 24)
+    assert ExecutionTracer.attribute_lookup(obj, "prop") == id(Foo)
+    del Foo.prop
+    assert ExecutionTracer.attribute_lookup(obj, "prop") == id(_Base)
+    _Derived.extra = 3
+    try:
+        assert ExecutionTracer.attribute_lookup(obj, "extra") == id(_Derived)
+    finally:
+        del _Derived.extra
+    assert ExecutionTracer.attribute_lookup(obj, "extra") == -1
@@ -6,10 +6,13 @@
 #
 """Integration tests for the executor."""
 import ast
+import gc
 import importlib
 import threading
+import weakref
 
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
 import pytest
 
@@ -19,9 +22,11 @@ from pynguin.analyses.constants import EmptyConstantProvider
 from pynguin.analyses.module import generate_test_cluster
 from pynguin.analyses.seeding import AstToTestCaseTransformer
 from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.testcase.execution import ExecutionResult
 from pynguin.testcase.execution import ExecutionTracer
 from pynguin.testcase.execution import ModuleProvider
 from pynguin.testcase.execution import TestCaseExecutor
+from pynguin.testcase.execution import _make_exceptions_picklable
 from pynguin.testcase.statement import IntPrimitiveStatement
 from pynguin.testcase.statement import MethodStatement
 
@@ -138,9 +143,183 @@ def test_killing_endless_loop():
             )
         )
         test_case = transformer.testcases[0]
-        executor.execute(test_case)
+        threads_before = set(threading.enumerate())
+        assert executor.execute(test_case).timeout
         # Running this with a debugger may break these assertions
-        for thread in threading.enumerate():
-            if "_execute_test_case" in thread.name:
+        for thread in set(threading.enumerate()) - threads_before:
+            if thread.name == "TestCaseExecutionWorker":
                 thread.join()
-        assert len(threading.enumerate()) == 1  # Only main thread should be alive.
+        # The worker of the timed out execution must have been killed.
+        assert not set(threading.enumerate()) - threads_before
+
+
+def test_worker_is_reused(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    executor.execute(short_test_case)
+    thread_ident = tracer.current_thread_identifier
+    executor.execute(short_test_case)
+    assert tracer.current_thread_identifier == thread_ident
+    assert thread_ident != threading.current_thread().ident
+
+
+def test_worker_stops_with_executor(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    executor.execute(short_test_case)
+    thread = executor._worker.thread
+    del executor
+    gc.collect()
+    thread.join()
+    assert not thread.is_alive()
+
+
+def test_replaced_worker_is_not_kept_alive(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    executor.execute(short_test_case)
+    worker = weakref.ref(executor._worker)
+    thread = executor._worker.thread
+    executor._worker.stop()
+    thread.join()
+    executor.execute(short_test_case)
+    gc.collect()
+    assert worker() is None
+    assert executor._worker is not None
+
+
+@pytest.mark.parametrize("whole_test_case_execution", [True, False])
+def test_exception_position(method_mock, default_test_case, whole_test_case_execution):
+    config.configuration.module_name = "tests.fixtures.accessibles.accessible"
+    int_stmt = IntPrimitiveStatement(default_test_case, 5)
+    method_stmt = MethodStatement(default_test_case, method_mock, int_stmt.ret_val)
+    default_test_case.add_statement(int_stmt)
+    default_test_case.add_statement(method_stmt)
+    default_test_case.add_statement(IntPrimitiveStatement(default_test_case, 6))
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(config.configuration.module_name, tracer):
+        module = importlib.import_module(config.configuration.module_name)
+        importlib.reload(module)
+        executor = TestCaseExecutor(
+            tracer, whole_test_case_execution=whole_test_case_execution
+        )
+        result = executor.execute(default_test_case)
+        assert list(result.exceptions) == [1]
+        assert isinstance(result.exceptions[1], AttributeError)
+
+
+def test_whole_test_case_execution_single_compilation(short_test_case):
+    config.configuration.module_name = "tests.fixtures.accessibles.accessible"
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(config.configuration.module_name, tracer):
+        module = importlib.import_module(config.configuration.module_name)
+        importlib.reload(module)
+        executor = TestCaseExecutor(tracer)
+        with patch(
+            "pynguin.testcase.execution.compile", create=True, wraps=compile
+        ) as compile_mock:
+            result = executor.execute(short_test_case)
+    assert not result.has_test_exceptions()
+    compile_mock.assert_called_once()
+
+
+def test_whole_test_case_execution_statement_observer(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    observer = MagicMock(observes_statements=False)
+    executor.add_observer(observer)
+    executor.execute(short_test_case)
+    assert observer.before_test_case_execution.call_count == 1
+    assert observer.before_statement_execution.call_count == 0
+    assert observer.after_test_case_execution_inside_thread.call_count == 1
+
+
+def test_execute_multiple_in_parallel():
+    config.configuration.module_name = "tests.fixtures.examples.triangle"
+    module_name = config.configuration.module_name
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(module_name, tracer):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+
+        cluster = generate_test_cluster(module_name)
+        transformer = AstToTestCaseTransformer(cluster, False, EmptyConstantProvider())
+        transformer.visit(
+            ast.parse(
+                """def test_case_0():
+    int_0 = 1
+    str_0 = module_0.triangle(int_0, int_0, int_0)
+
+def test_case_1():
+    int_0 = 1
+    int_1 = 2
+    str_0 = module_0.triangle(int_0, int_0, int_1)
+
+def test_case_2():
+    int_0 = 1
+    int_1 = 2
+    int_2 = 3
+    str_0 = module_0.triangle(int_0, int_1, int_2)
+"""
+            )
+        )
+        sequential = TestCaseExecutor(tracer).execute_multiple(transformer.testcases)
+        parallel = TestCaseExecutor(tracer, number_of_workers=2).execute_multiple(
+            transformer.testcases
+        )
+    assert [result.execution_trace for result in parallel] == [
+        result.execution_trace for result in sequential
+    ]
+
+
+def test_execute_multiple_in_parallel_unsupported_observer(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer, number_of_workers=2)
+    observer = MagicMock(observes_statements=False, supports_parallel_execution=False)
+    executor.add_observer(observer)
+    executor.execute_multiple([short_test_case, short_test_case])
+    # The observer is not notified in a forked process.
+    assert observer.before_test_case_execution.call_count == 2
+    assert observer.after_test_case_execution_outside_thread.call_count == 2
+
+
+def test_execute_multiple_in_parallel_hanging_process(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(
+        tracer, maximum_test_execution_timeout=1, number_of_workers=2
+    )
+    # The forked processes never send their results, thus the test cases are
+    # executed in this process once the processes time out.
+    with patch.object(
+        executor,
+        "_execute_in_forked_process",
+        lambda test_cases, connection: threading.Event().wait(),
+    ), patch.object(
+        executor, "_execute_in_worker", wraps=executor._execute_in_worker
+    ) as execute_in_worker:
+        results = executor.execute_multiple([short_test_case, short_test_case])
+    assert execute_in_worker.call_count == 2
+    assert not any(result.timeout for result in results)
+
+
+def test_make_exceptions_picklable():
+    class LocalError(Exception):
+        pass
+
+    picklable = ValueError("foo")
+    result = ExecutionResult()
+    result.report_new_thrown_exception(0, picklable)
+    result.report_new_thrown_exception(1, LocalError("bar"))
+    _make_exceptions_picklable(result)
+    assert result.exceptions[0] is picklable
+    assert isinstance(result.exceptions[1], RuntimeError)
+    assert result.exceptions[1].args == ("LocalError: bar",)